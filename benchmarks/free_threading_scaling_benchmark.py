@@ -0,0 +1,73 @@
+"""Thread-scaling benchmark for Segmenter.map on free-threaded CPython.
+
+Segments a fixed corpus with ``Segmenter.map(texts, threads=N)`` for increasing
+``N`` and reports throughput and speedup over one thread. On a free-threaded
+build (``python3.14t``, GIL disabled) the threads share one Segmenter and its
+caches and the speedup should track the thread count closely up to the number
+of physical cores. On a GIL build ``map`` warns and falls back to a process
+pool, so the numbers then measure ``segment_batch`` instead.
+
+Run with:
+    uv run --python 3.14t python benchmarks/free_threading_scaling_benchmark.py
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import warnings
+
+import sentencesplit
+
+try:
+    from benchmarks._samples import LARGE, LEGAL, MEDIUM
+except ImportError:  # pragma: no cover - run as a plain script
+    from _samples import LARGE, LEGAL, MEDIUM
+
+N_DOCUMENTS = 4000
+CHUNKSIZE = 32
+THREAD_COUNTS = (1, 2, 4, 8, 16)
+
+
+def _corpus():
+    samples = (MEDIUM, LEGAL, LARGE[:1500])
+    return [samples[i % len(samples)] for i in range(N_DOCUMENTS)]
+
+
+def _run(seg, corpus, threads):
+    start = time.perf_counter()
+    for _ in seg.map(corpus, threads=threads, chunksize=CHUNKSIZE):
+        pass
+    return time.perf_counter() - start
+
+
+def main():
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    cpus = getattr(os, "process_cpu_count", os.cpu_count)() or 1
+    print(f"Segmenter.map thread-scaling  (python {sys.version.split()[0]}, GIL {'on' if gil else 'off'}, {cpus} CPUs)")
+    if gil:
+        print("  note: GIL enabled -- threads > 1 fall back to a process pool")
+    print("=" * 62)
+
+    seg = sentencesplit.Segmenter(language="en")
+    corpus = _corpus()
+    _run(seg, corpus[:200], 1)  # warm caches
+
+    baseline = None
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        for threads in THREAD_COUNTS:
+            if threads > cpus:
+                break
+            elapsed = _run(seg, corpus, threads)
+            baseline = baseline or elapsed
+            docs_per_s = len(corpus) / elapsed
+            print(
+                f"  threads={threads:<3d} {docs_per_s:9.0f} docs/s   speedup {baseline / elapsed:5.2f}x   "
+                f"efficiency {baseline / elapsed / threads:6.1%}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,20 @@
+from .async_stream import asegment_stream as asegment_stream
 from .exceptions import InvalidConfigurationError as InvalidConfigurationError
 from .exceptions import SentenceSplitError as SentenceSplitError
 from .exceptions import UnknownLanguageError as UnknownLanguageError
+from .file_stream import iter_sentences as iter_sentences
 from .languages import list_languages as list_languages
 from .languages import register_language as register_language
 from .languages import unregister_language as unregister_language
 from .segmenter import Segmenter as Segmenter
+from .stream_pool import StreamSegmenterPool as StreamSegmenterPool
 from .stream_segmenter import StreamSegmenter as StreamSegmenter
+from .utils import AnnotatedSpan as AnnotatedSpan
 from .utils import SegmentLookahead as SegmentLookahead
+from .utils import StreamClause as StreamClause
+from .utils import StreamRetraction as StreamRetraction
 from .utils import TextSpan as TextSpan
+from .utils import TextSpanView as TextSpanView
 
 __all__: list[str]
 
@@ -14,6 +14,7 @@ class _AbbreviationData:
         "abbr_set",
         "prepositive_set",
         "number_abbr_set",
+        "multi_word_final_set",
         "automaton",
         "elision_chars",
         "boundary_class",
@@ -83,4 +84,7 @@ class _AbbreviationData:
         self.abbr_set = frozenset(a.strip().lower() for a in raw)
         self.prepositive_set = frozenset(a.lower() for a in lang_abbreviation_class.PREPOSITIVE_ABBREVIATIONS)
         self.number_abbr_set = frozenset(a.lower() for a in lang_abbreviation_class.NUMBER_ABBREVIATIONS)
+        # Last words of multi-word abbreviations ("sub nom" -> "nom"), which are
+        # not abbreviations on their own.
+        self.multi_word_final_set = frozenset(a.split()[-1] for a in self.abbr_set if len(a.split()) > 1)
         self._classifier_cache: dict[tuple[int, str, type], object] = {}
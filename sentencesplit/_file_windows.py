@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""Windowed reading of a text file for :meth:`Segmenter.segment_file` and :func:`~sentencesplit.file_stream.iter_sentences`.
+
+The file is memory-mapped and decoded ``window_size`` bytes at a time with an
+incremental decoder, so a multi-byte character split across two windows is
+decoded correctly and the whole file is never held as one ``str``. A file
+object is read a chunk at a time instead (:func:`iter_text_pieces`). Decoded text
+accumulates in a pending buffer that is cut at paragraph breaks with the same
+rules as :func:`~sentencesplit._hard_boundary.hard_boundary_cuts`. The pieces are
+handed to :func:`~sentencesplit._hard_boundary.iter_stitched_spans`, which
+verifies every seam.
+
+Those cut rules are applied per pending buffer, not over the whole file. A cut
+is only taken once the list phase's pairing reach past it is buffered, but
+the phase also counts markers over all the text it is given. List numbering
+can therefore differ from segmenting the decoded file in one call. If no paragraph break turns up
+for ``_MAX_PENDING_WINDOWS`` windows, the buffer is force-cut at its last line
+break, or before its last sentence when the second half of the buffer has no
+line break, so memory stays bounded by a few windows plus the longest sentence.
+Cuts clear of list numbering are preferred, where there are any.
+That can happen on one very long paragraph or line, or on a buffer holding
+reserved sentinel characters. Seam verification still applies, though a
+rewritten sentence is checked for a verbatim copy in the following piece only
+(see :mod:`sentencesplit._hard_boundary`).
+"""
+
+from __future__ import annotations
+
+import codecs
+import mmap
+import os
+import re
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
+
+from sentencesplit._hard_boundary import _LIST_REGION_MARGIN, cuts_clear_of_lists, hard_boundary_cuts
+from sentencesplit.utils import ZERO_WIDTH_CHARS
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from sentencesplit.segmenter import Segmenter
+
+# Once the pending buffer holds this many windows without a regular cut, it is
+# force-cut at a line break instead of growing further.
+_MAX_PENDING_WINDOWS = 4
+# Any line break plus the whitespace after it; the force-cut candidate.
+_LINE_BREAK_RUN_RE = re.compile(r"(?:\r\n|\r|\n)\s*")
+
+
+def _forced_cut(segmenter: Segmenter, text: str) -> int:
+    settled = len(text) - _LIST_REGION_MARGIN
+    cuts = [
+        match.end()
+        for match in _LINE_BREAK_RUN_RE.finditer(text)
+        if match.end() < len(text) and text[match.end()] not in ZERO_WIDTH_CHARS
+    ]
+    if not cuts or cuts[-1] < len(text) // 2:
+        # No line break in the second half (one long line): cut between
+        # sentences too, keeping the last one, which may still be incomplete.
+        cuts = sorted({*cuts, *segmenter._span_ends(text)[:-1]})
+    cuts = [cut for cut in cuts if cut <= settled]
+    # Keep clear of list numbering where possible; bounded memory comes first.
+    cuts = cuts_clear_of_lists(segmenter, text, cuts) or cuts
+    return cuts[-1] if cuts else 0
+
+
+def _pending_cut(segmenter: Segmenter, pending: str, window_size: int) -> int:
+    # A cut is only taken once the list phase's pairing reach past it is
+    # buffered: markers that arrive later may pair with ones before it.
+    settled = len(pending) - _LIST_REGION_MARGIN
+    cuts = [cut for cut in hard_boundary_cuts(segmenter, pending, max(1, window_size // 4)) if cut <= settled]
+    if cuts:
+        return cuts[-1]
+    if len(pending) >= _MAX_PENDING_WINDOWS * window_size:
+        return _forced_cut(segmenter, pending)
+    return 0
+
+
+def iter_file_pieces(
+    segmenter: Segmenter,
+    path: str | os.PathLike[str],
+    encoding: str,
+    errors: str,
+    window_size: int,
+) -> Iterator[tuple[int, str, list[int], list[tuple[int, str, bool]]]]:
+    """Yield the ``iter_stitched_spans`` items for consecutive pieces of the file at *path*."""
+    with open(path, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            return
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            decoder = codecs.getincrementaldecoder(encoding)(errors)
+            size = len(mapped)
+            windows = (
+                decoder.decode(mapped[offset : offset + window_size], final=offset + window_size >= size)
+                for offset in range(0, size, window_size)
+            )
+            yield from iter_text_pieces(segmenter, windows, window_size)
+
+
+def iter_text_pieces(
+    segmenter: Segmenter, windows: Iterable[str], window_size: int
+) -> Iterator[tuple[int, str, list[int], list[tuple[int, str, bool]]]]:
+    """Yield the ``iter_stitched_spans`` items for the text of consecutive *windows*."""
+    pending = ""
+    start = 0
+    for window in windows:
+        pending += window
+        cut = _pending_cut(segmenter, pending, window_size)
+        if cut:
+            piece, pending = pending[:cut], pending[cut:]
+            yield start, piece, *segmenter._piece_alignment(piece)
+            start += cut
+    if pending:
+        yield start, pending, *segmenter._piece_alignment(pending)
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""Regex-free whitespace/zero-width-flexible search for span projection.
+
+``Segmenter._match_spans`` maps each processed sentence back onto the source.
+When ``str.find`` misses (the processor normalized whitespace or dropped a
+zero-width char), the sentence used to be turned into a per-sentence regex,
+compiled and searched, once with flexible spaces and once more with flexible
+zero-width chars as well. Every such sentence is a distinct pattern, so this
+paid a full ``re.compile`` per divergent sentence.
+
+The patterns involved only ever alternate literal text with a greedy run of
+one character class, so they are matched here directly. A pattern is a tuple
+of tokens: a ``str`` is a literal chunk and an ``int`` is a greedy run of
+whitespace (``_WS``), zero-width chars (``_ZW``) or either (``_WS_ZW``).
+:func:`_search` reproduces ``re.search`` on the equivalent regex exactly:
+leftmost start, greedy runs that give characters back in the same order as the
+regex backtracker, and the same first match. States known to fail are
+remembered, so one search costs at most ``tokens x positions`` steps.
+"""
+
+from __future__ import annotations
+
+from sentencesplit._normalize import _ZERO_WIDTH_CHARS
+
+_WS = 0
+_ZW = 1
+_WS_ZW = 2
+
+_Token = str | int
+
+
+def _run_end(text: str, pos: int, kind: int) -> int:
+    n = len(text)
+    if kind == _ZW:
+        while pos < n and text[pos] in _ZERO_WIDTH_CHARS:
+            pos += 1
+    elif kind == _WS:
+        while pos < n and text[pos].isspace():
+            pos += 1
+    else:
+        while pos < n and (text[pos].isspace() or text[pos] in _ZERO_WIDTH_CHARS):
+            pos += 1
+    return pos
+
+
+def _match_at(tokens: tuple[_Token, ...], text: str, start: int, failed: set[tuple[int, int]]) -> int | None:
+    # Depth-first over the run lengths, longest first, like the regex
+    # backtracker. Each frame is [token index, run start, current run end].
+    frames: list[list[int]] = []
+    index, pos = 0, start
+    while True:
+        if index == len(tokens):
+            return pos
+        token = tokens[index]
+        if (index, pos) not in failed:
+            if isinstance(token, str):
+                if text.startswith(token, pos):
+                    index, pos = index + 1, pos + len(token)
+                    continue
+            else:
+                end = _run_end(text, pos, token)
+                frames.append([index, pos, end])
+                index, pos = index + 1, end
+                continue
+            failed.add((index, pos))
+        # Backtrack into the innermost run that can still give a char back.
+        while frames:
+            frame = frames[-1]
+            failed.add((frame[0] + 1, frame[2]))
+            if frame[2] > frame[1]:
+                frame[2] -= 1
+                index, pos = frame[0] + 1, frame[2]
+                break
+            frames.pop()
+            failed.add((frame[0], frame[1]))
+        else:
+            return None
+
+
+def _search(tokens: tuple[_Token, ...], text: str, pos: int) -> tuple[int, int] | None:
+    failed: set[tuple[int, int]] = set()
+    first = tokens[0]
+    if isinstance(first, str):
+        candidate = text.find(first, pos)
+        while candidate != -1:
+            end = _match_at(tokens, text, candidate, failed)
+            if end is not None:
+                return candidate, end
+            candidate = text.find(first, candidate + 1)
+        return None
+    for candidate in range(pos, len(text) + 1):
+        end = _match_at(tokens, text, candidate, failed)
+        if end is not None:
+            return candidate, end
+    return None
+
+
+def _whitespace_flexible_tokens(sent: str) -> tuple[_Token, ...]:
+    # re.escape(sent).replace(r"\ ", r"\s*"): every space may match any run of
+    # whitespace, including none.
+    tokens: list[_Token] = []
+    for index, chunk in enumerate(sent.split(" ")):
+        if index:
+            tokens.append(_WS)
+        if chunk:
+            tokens.append(chunk)
+    return tuple(tokens)
+
+
+def _zero_width_flexible_tokens(sent: str) -> tuple[_Token, ...]:
+    # Every char may be followed by a run of zero-width chars, and whitespace
+    # may match any run of whitespace or zero-width chars, including none.
+    tokens: list[_Token] = []
+    for char in sent:
+        tokens.append(_WS_ZW if char.isspace() else char)
+        tokens.append(_ZW)
+    return tuple(tokens)
+
+
+def find_flexible(sent: str, text: str, pos: int) -> tuple[int, int] | None:
+    """Find *sent* in *text* from *pos*, tolerating whitespace, then zero-width, divergence.
+
+    Equivalent to searching the whitespace-flexible pattern (each space in
+    *sent* matches ``\\s*``) and, if that misses, the zero-width-flexible
+    pattern. Returns ``(start, end)`` of the first match, or None.
+    """
+    match = _search(_whitespace_flexible_tokens(sent), text, pos)
+    if match is None:
+        match = _search(_zero_width_flexible_tokens(sent), text, pos)
+    return match
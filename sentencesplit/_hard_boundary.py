@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+"""Cut a large document at hard boundaries so its pieces segment independently.
+
+``Processor.split_into_segments`` treats every newline as a segment break, so a
+paragraph break (a blank-line run) is a natural place to cut a document into
+pieces that can be segmented on their own. Three things reach across such a
+break and are handled here:
+
+* **List marking** (``ListItemReplacer.add_line_break``) is global: it pairs
+  numbered/lettered markers up to 200 chars apart and its guards count markers
+  over the whole text. The phase is run once on the whole text; if it changed
+  anything, no cut is placed inside the changed region (plus a margin), so every
+  piece that lies outside it carries no list markers at all.
+* **Local context** (abbreviation lookaheads, orphan-fragment merging, zero-width
+  boundary stripping) can see a few characters past a newline, and the sentence
+  after a seam can split differently without the text before it ("??1)" splits
+  after "??" only at the start of a text). Every seam is verified by
+  re-segmenting the two sentences on each side of it together; a seam where any
+  of those boundaries moves is dropped and the two pieces are segmented as one.
+* **Alignment** (``Segmenter._match_bounds``) searches for each processed
+  sentence verbatim from where the previous one ended, to the end of the text.
+  A sentence the processor rewrote (".\\ni." becomes ". i.") is found
+  verbatim further on if it recurs there, and the span stretches to it. A seam
+  is dropped when a sentence before it that was not found verbatim occurs
+  verbatim after it, or was not found at all.
+
+Where the whole text is in memory the last check searches all of it, and the
+stitched spans equal ``segment_spans`` of the whole text. A stream sees one
+piece ahead only, so a rewritten sentence that recurs verbatim more than a
+piece later is aligned where the piece found it, while ``segment_spans`` on the
+whole text stretches the span to the copy.
+
+Input containing reserved sentinel characters is never cut: the processor picks
+its escape tables per text, so it is segmented whole.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
+
+from sentencesplit._sentinel import RESERVED_SENTINEL_SET
+from sentencesplit.language_profile import LanguageProfile
+from sentencesplit.lists_item_replacer import ListItemReplacer
+from sentencesplit.utils import ZERO_WIDTH_CHARS, Rule, TextSpan
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from sentencesplit.segmenter import Segmenter
+
+# A blank line: two line breaks separated only by horizontal whitespace, plus
+# any whitespace that follows. A cut goes at the end of the match, so the
+# whitespace stays with the earlier piece, as ``segment_spans`` attaches it.
+_BLANK_LINE_RUN_RE = re.compile(r"(?:\r\n|\r|\n)[^\S\r\n]*(?:\r\n|\r|\n)\s*")
+# Chars kept clear of a list-marked region on either side. Covers the list
+# scanner's 200-char pairing window.
+_LIST_REGION_MARGIN = 256
+_TRACING_LIST_REPLACERS: dict[type[ListItemReplacer], type[ListItemReplacer]] = {}
+
+
+def _common_prefix_len(a: str, b: str) -> int:
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[lo:mid] == b[lo:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _common_suffix_len(a: str, b: str, limit: int) -> int:
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid : len(a) - lo] == b[len(b) - mid : len(b) - lo]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _tracing_list_replacer_cls(replacer_cls: type[ListItemReplacer]) -> type[ListItemReplacer]:
+    # Parenthesized numbered items are marked with "☝" and the marker is removed
+    # again at the end of the phase, so a list found there can leave the text
+    # unchanged. Keep the marker so the region shows up in the diff. Racing
+    # builders produce equivalent classes, so the first writer simply wins.
+    tracing = _TRACING_LIST_REPLACERS.get(replacer_cls)
+    if tracing is None:
+        tracing = type(f"_Tracing{replacer_cls.__name__}", (replacer_cls,), {"ListMarkerRule": Rule("☝", "☝")})
+        tracing = _TRACING_LIST_REPLACERS.setdefault(replacer_cls, tracing)
+    return tracing
+
+
+def list_marked_region(segmenter: Segmenter, text: str) -> tuple[int, int] | None:
+    """Return the ``[start, end)`` range of *text* the list phase marks, or None."""
+    normalized = text.replace("\n", "\r")
+    replacer_cls = _tracing_list_replacer_cls(LanguageProfile.from_language(segmenter.language_module).list_item_replacer_cls)
+    marked = replacer_cls(normalized, segmenter.split_mode).add_line_break()
+    if marked == normalized:
+        return None
+    prefix = _common_prefix_len(normalized, marked)
+    suffix = _common_suffix_len(normalized, marked, min(len(normalized), len(marked)) - prefix)
+    return prefix, len(normalized) - suffix
+
+
+def hard_boundary_cuts(segmenter: Segmenter, text: str, min_piece_size: int) -> list[int]:
+    """Return interior cut offsets splitting *text* into pieces of at least *min_piece_size* chars.
+
+    Returns ``[]`` when *text* should be segmented whole.
+    """
+    if len(text) < 2 * min_piece_size or not RESERVED_SENTINEL_SET.isdisjoint(text):
+        return []
+    region = list_marked_region(segmenter, text)
+    if region is not None:
+        blocked_start, blocked_end = region[0] - _LIST_REGION_MARGIN, region[1] + _LIST_REGION_MARGIN
+    else:
+        blocked_start = blocked_end = -1
+    cuts: list[int] = []
+    last = 0
+    for match in _BLANK_LINE_RUN_RE.finditer(text, min_piece_size):
+        cut = match.end()
+        if len(text) - cut < min_piece_size:
+            break
+        if cut - last < min_piece_size or blocked_start <= cut <= blocked_end or text[cut] in ZERO_WIDTH_CHARS:
+            continue
+        cuts.append(cut)
+        last = cut
+    return cuts
+
+
+def cuts_clear_of_lists(segmenter: Segmenter, text: str, cuts: list[int]) -> list[int]:
+    """Return the *cuts* outside the region the list phase marks in *text*, plus a margin."""
+    region = list_marked_region(segmenter, text)
+    if region is None:
+        return cuts
+    return [cut for cut in cuts if not region[0] - _LIST_REGION_MARGIN <= cut <= region[1] + _LIST_REGION_MARGIN]
+
+
+def seam_holds(segmenter: Segmenter, text: str, before_start: int, seam: int, after_end: int) -> bool:
+    """Whether segmenting ``text[before_start:after_end]`` keeps a single boundary at *seam*."""
+    return window_holds(segmenter, text[before_start:after_end], [seam - before_start, after_end - before_start])
+
+
+def window_holds(segmenter: Segmenter, text: str, ends: list[int]) -> bool:
+    """Whether segmenting *text* on its own yields exactly the span end offsets *ends*."""
+    return segmenter._span_ends(text) == ends
+
+
+def anchored_across(text: str, unanchored: list[tuple[int, str, bool]], rest: str, rest_start: int = 0) -> bool:
+    """Whether the text ``rest[rest_start:]`` following *text* leaves its alignment unchanged.
+
+    *unanchored* lists the sentences of *text* not found verbatim, as returned
+    by ``Segmenter._piece_alignment``. A copy starting after the offset the
+    search began at, across the seam or in the following text, would be
+    matched instead; a sentence not found at all might be found further on.
+    """
+    for offset, sent, found in unanchored:
+        if not found:
+            return False
+        straddle = text[max(offset, len(text) - len(sent) + 1) :] + rest[rest_start : rest_start + len(sent) - 1]
+        if sent in straddle or rest.find(sent, rest_start) != -1:
+            return False
+    return True
+
+
+def iter_stitched_spans(
+    segmenter: Segmenter,
+    pieces: Iterable[tuple[int, str, list[int], list[tuple[int, str, bool]]]],
+    source: str | None = None,
+) -> Iterator[TextSpan]:
+    """Join segmented pieces into the spans of the text they tile.
+
+    Each item of ``pieces`` is ``(start, piece_text, span_ends, unanchored)``:
+    the absolute offset of a piece, its text, and its alignment as returned by
+    ``Segmenter._piece_alignment`` (span end offsets relative to the piece,
+    and the sentences not found verbatim). Pieces must be contiguous.
+    ``pieces`` is consumed lazily, and a piece's spans are yielded once the seam
+    after it is verified, so at most two pieces are held at a time. A seam is
+    verified by re-segmenting the two sentences on each side of it together
+    (:func:`window_holds`); one that fails that or :func:`anchored_across` is
+    dropped, and the pieces on both sides are re-segmented together, serially.
+    Consecutive failing seams re-segment a growing piece, which is only
+    expected on pathological input.
+
+    *source* is the whole text when it is already in memory. The alignment
+    check then searches all of it after the seam rather than the following
+    piece only, which makes the result equal ``segment_spans(source)``.
+    """
+    remaining = iter(pieces)
+    first = next(remaining, None)
+    if first is None:
+        return
+    start, text, ends, unanchored = first
+    for following_start, following_text, following_ends, following_unanchored in remaining:
+        # Two sentences each side: a boundary next to the seam can move too.
+        before_start = ends[-3] if len(ends) > 2 else 0
+        window = text[before_start:] + following_text[: following_ends[:2][-1]]
+        seam = len(text) - before_start
+        window_ends = [end - before_start for end in ends[-2:]] + [seam + end for end in following_ends[:2]]
+        if source is None:
+            anchored = anchored_across(text, unanchored, following_text)
+        else:
+            anchored = anchored_across(text, unanchored, source, following_start)
+        if window_holds(segmenter, window, window_ends) and anchored:
+            yield from _piece_spans(start, text, ends)
+            start, text, ends, unanchored = following_start, following_text, following_ends, following_unanchored
+        else:
+            text += following_text
+            ends, unanchored = segmenter._piece_alignment(text)
+    yield from _piece_spans(start, text, ends)
+
+
+def _piece_spans(start: int, text: str, ends: list[int]) -> Iterator[TextSpan]:
+    prior_end = 0
+    for end in ends:
+        yield TextSpan(text[prior_end:end], start + prior_end, start + end)
+        prior_end = end
+
+
+def iter_segmented_pieces(
+    segmenter: Segmenter, text: str, bounds: list[int]
+) -> Iterator[tuple[int, str, list[int], list[tuple[int, str, bool]]]]:
+    """Serially segment each piece of *text* into the items :func:`iter_stitched_spans` takes."""
+    for start, end in zip(bounds, bounds[1:]):
+        piece = text[start:end]
+        yield start, piece, *segmenter._piece_alignment(piece)
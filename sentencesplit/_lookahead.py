@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""Static lookahead verdicts decided from the terminal token alone.
+
+``Segmenter.should_wait_for_more`` asks whether a segment ending in a period
+could still be joined with text that has not arrived yet. The general answer
+re-segments the tail with probe suffixes appended (see
+``Segmenter._wait_with_tail_probe``), which runs the whole processor once per
+probe. Most segments end in a token whose answer is already known:
+
+* a declared abbreviation ("Dr.", "etc.") or a number before an unspaced
+  period ("GPT 3.") is joined by some probe, so the segment waits (aggressive
+  mode may split after an abbreviation, so there it is left to the probes);
+* an ordinary lowercase word ("finale.") is not an abbreviation, an initial or
+  a list marker, so no probe moves the boundary and the segment does not wait.
+
+:func:`static_wait_verdict` returns that answer, or None when the token needs
+the probes (quotes or brackets after the period, single letters, roman
+numerals, mixed case, digits and symbols inside the token, ...). Only a segment
+ending at its period or in one space is decided statically: after a line break
+or a run of spaces the probes can settle an abbreviation differently
+("Jan.  " does not wait), so those are always probed.
+
+Probe verdicts themselves are memoized in :data:`VERDICT_CACHE`, shared by
+every segmenter in the process: in streaming, the same trailing segment is
+probed again on each delta until it is emitted, and short endings recur across
+streams.
+"""
+
+from __future__ import annotations
+
+from sentencesplit._abbreviation_data import _AbbreviationData
+from sentencesplit._result_cache import ResultCache
+from sentencesplit._screen import _TRIVIAL_BODY_RE
+
+_ROMAN_NUMERAL_CHARS = frozenset("ivxlcdm")
+_VERDICT_CACHE_SIZE = 4096
+_VERDICT_CACHE_MAX_BYTES = 1 << 22
+
+VERDICT_CACHE = ResultCache(_VERDICT_CACHE_SIZE, _VERDICT_CACHE_MAX_BYTES, "text")
+
+
+def static_wait_verdict(
+    terminal_text: str, punct_index: int, trailing_whitespace: str, data: _AbbreviationData, aggressive: bool
+) -> bool | None:
+    """Return whether a segment ending at *punct_index* waits, or None if undecided.
+
+    *terminal_text* is the right-stripped last segment, *punct_index* the
+    index of its terminal period and *trailing_whitespace* what was stripped.
+    """
+    if punct_index != len(terminal_text) - 1 or trailing_whitespace not in ("", " "):
+        return None
+    token_start = punct_index
+    while token_start > 0 and not terminal_text[token_start - 1].isspace():
+        token_start -= 1
+    token = terminal_text[token_start:punct_index]
+    if not token:
+        return None
+    if token[-1].isdigit():
+        # The unspaced digit probe turns "3." into the decimal "3.1".
+        return True if not trailing_whitespace and token.isdigit() else None
+    lowered = token.lower()
+    if lowered in data.abbr_set or lowered in data.prepositive_set or lowered in data.number_abbr_set:
+        return None if aggressive else True
+    if lowered in data.multi_word_final_set:
+        return None
+    return False if _is_plain_final_word(terminal_text, token_start, token) else None
+
+
+def _is_plain_final_word(terminal_text: str, token_start: int, token: str) -> bool:
+    # A lowercase word of two or more letters that is not a roman numeral, in a
+    # segment with no other punctuation, and not a unit after a number ("5 in.").
+    if len(token) < 2 or not token.isalpha() or not token.islower() or _ROMAN_NUMERAL_CHARS.issuperset(token):
+        return False
+    if _TRIVIAL_BODY_RE.fullmatch(terminal_text, 0, token_start + len(token)) is None:
+        return False
+    previous_end = token_start - 1
+    while previous_end > 0 and terminal_text[previous_end - 1].isspace():
+        previous_end -= 1
+    return not (previous_end > 0 and terminal_text[previous_end - 1].isdigit())
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""Worker-pool plumbing for batch and threaded segmentation.
+
+:meth:`Segmenter.segment_batch` and :meth:`Segmenter.segment_spans_batch` fan a
+stream of documents out to a :class:`~concurrent.futures.ProcessPoolExecutor`.
+Each worker process rebuilds an equivalent segmenter, of the same class, from its
+plain constructor config once, at startup, and warms the per-language caches
+(``LanguageProfile``, ``_AbbreviationData`` and the cached ``PeriodClassifier``)
+before the first real document arrives, so no task pays the cold-start cost.
+
+:meth:`Segmenter.map` instead runs one shared :class:`Segmenter` on a
+:class:`~concurrent.futures.ThreadPoolExecutor`. On a free-threaded build the
+threads segment truly in parallel over the same compiled profiles, abbreviation
+automata and cached ``PeriodClassifier`` instances; every shared cache is
+read lock-free once published, so the hot path takes no lock.
+
+Work is submitted in ``chunksize`` batches with a bounded number of chunks in
+flight, so an arbitrarily long (or lazy) input iterable is consumed
+incrementally rather than materialized up front the way
+:meth:`Executor.map <concurrent.futures.Executor.map>` does.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from functools import partial
+from itertools import islice
+from typing import TYPE_CHECKING, Any
+
+from sentencesplit.exceptions import InvalidConfigurationError
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from sentencesplit.segmenter import Segmenter
+
+# Chunks kept in flight per worker. Two keeps every worker busy while the parent
+# drains results, without buffering an unbounded slice of the input.
+_CHUNKS_IN_FLIGHT_PER_WORKER = 2
+
+# Per-process Segmenter, built once by ``_init_worker``.
+_WORKER_SEGMENTER: Segmenter | None = None
+
+
+def default_worker_count() -> int:
+    """Return the number of CPUs usable by this process (at least 1)."""
+    counter = getattr(os, "process_cpu_count", None) or os.cpu_count
+    return counter() or 1
+
+
+def gil_enabled() -> bool:
+    """Return whether the GIL is active (always True before CPython 3.13)."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def validate_pool_args(n_workers: int | None, chunksize: int, name: str = "n_workers") -> int:
+    """Validate pool arguments and resolve a ``None`` worker count to the CPU count."""
+    if n_workers is None:
+        n_workers = default_worker_count()
+    if isinstance(n_workers, bool) or not isinstance(n_workers, int) or n_workers < 1:
+        raise InvalidConfigurationError(f"{name} must be a positive integer or None.")
+    if isinstance(chunksize, bool) or not isinstance(chunksize, int) or chunksize < 1:
+        raise InvalidConfigurationError("chunksize must be a positive integer.")
+    return n_workers
+
+
+def segmenter_config(segmenter: Segmenter) -> dict[str, Any]:
+    """Plain, picklable constructor kwargs that rebuild an equivalent Segmenter."""
+    return {
+        "language": segmenter.language,
+        "clean": segmenter.clean,
+        "doc_type": segmenter.doc_type,
+        "split_mode": segmenter.split_mode,
+        "cache_size": segmenter.cache_size,
+        "cache_max_bytes": segmenter.cache_max_bytes,
+        "cache_key": segmenter.cache_key,
+    }
+
+
+def _init_worker(segmenter_class: type[Segmenter], config: dict[str, Any]) -> None:
+    global _WORKER_SEGMENTER
+    segmenter = segmenter_class(**config)
+    segmenter._warm_caches()
+    _WORKER_SEGMENTER = segmenter
+
+
+def _run_chunk(method: str, texts: list[Any]) -> list[Any]:
+    assert _WORKER_SEGMENTER is not None, "worker used before _init_worker ran"
+    fn = getattr(_WORKER_SEGMENTER, method)
+    return [fn(text) for text in texts]
+
+
+def _run_chunk_on(segmenter: Segmenter, method: str, texts: list[Any]) -> list[Any]:
+    fn = getattr(segmenter, method)
+    return [fn(text) for text in texts]
+
+
+def _chunks(texts: Iterable[Any], chunksize: int) -> Iterator[list[Any]]:
+    iterator = iter(texts)
+    while chunk := list(islice(iterator, chunksize)):
+        yield chunk
+
+
+def iter_batch(
+    segmenter: Segmenter,
+    method: str,
+    texts: Iterable[Any],
+    n_workers: int,
+    chunksize: int,
+    ordered: bool,
+) -> Iterator[Any]:
+    """Run ``segmenter.<method>`` over *texts* on a process pool, streaming results.
+
+    Yields one result per input text, in input order when *ordered*; otherwise
+    yields ``(index, result)`` pairs as soon as each chunk completes. With
+    ``n_workers=1`` the work runs in-process (no pool, no pickling) but the
+    output shape is identical. The pool is created lazily on first iteration and
+    shut down once the input is exhausted or the consumer abandons the iterator.
+    """
+    if n_workers == 1:
+        yield from _iter_serial(getattr(segmenter, method), texts, ordered)
+        return
+    executor = ProcessPoolExecutor(
+        max_workers=n_workers,
+        initializer=_init_worker,
+        # The class is pickled by reference, so a subclass is rebuilt as itself;
+        # it must be importable by the workers and take the same kwargs.
+        initargs=(type(segmenter), segmenter_config(segmenter)),
+    )
+    try:
+        yield from iter_chunks_on(executor, _run_chunk, method, texts, n_workers, chunksize, ordered)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def iter_thread_map(segmenter: Segmenter, method: str, texts: Iterable[Any], threads: int, chunksize: int) -> Iterator[Any]:
+    """Run ``segmenter.<method>`` over *texts* on a thread pool, in input order.
+
+    All threads share *segmenter*. The pool is created lazily on first
+    iteration and shut down once the input is exhausted or abandoned.
+    """
+    if threads == 1:
+        yield from _iter_serial(getattr(segmenter, method), texts, True)
+        return
+    segmenter._warm_caches()
+    executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="sentencesplit")
+    try:
+        yield from iter_chunks_on(executor, partial(_run_chunk_on, segmenter), method, texts, threads, chunksize, True)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _iter_serial(fn: Callable[[Any], Any], texts: Iterable[Any], ordered: bool) -> Iterator[Any]:
+    for index, text in enumerate(texts):
+        yield fn(text) if ordered else (index, fn(text))
+
+
+def iter_chunks_on(
+    executor: Executor,
+    task: Callable[[str, list[Any]], list[Any]],
+    method: str,
+    texts: Iterable[Any],
+    n_workers: int,
+    chunksize: int,
+    ordered: bool,
+) -> Iterator[Any]:
+    """Drive *executor* with a bounded number of in-flight chunks.
+
+    Each chunk runs ``task(method, chunk)`` on the executor. Results are yielded
+    per text in input order when *ordered*, else as ``(index, result)`` pairs in
+    chunk-completion order.
+    """
+    max_in_flight = n_workers * _CHUNKS_IN_FLIGHT_PER_WORKER
+    pending: dict[Future[list[Any]], int] = {}
+    chunks = _chunks(texts, chunksize)
+    next_index = 0
+    while True:
+        for chunk in islice(chunks, max_in_flight - len(pending)):
+            pending[executor.submit(task, method, chunk)] = next_index
+            next_index += len(chunk)
+        if not pending:
+            return
+        if ordered:
+            # dicts keep insertion order, so the first key is the oldest chunk.
+            future = next(iter(pending))
+            del pending[future]
+            yield from future.result()
+            continue
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield from enumerate(future.result(), pending.pop(future))
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""Bounded LRU cache of segmentation results for ``Segmenter(cache_size=N)``.
+
+Entries are keyed by ``(kind, text)``, where *kind* names the method whose
+result is stored, so ``segment``, ``segment_spans`` and the lookahead variants
+never share an entry. *kind* may be any hashable; the shared probe-verdict
+cache in ``_lookahead`` puts the segmenter configuration in it. With
+``key="hash"`` the text is replaced in the key by its length and a 128-bit
+BLAKE2b digest, so large documents are not pinned in memory by the cache.
+Values are stored immutable (tuples of strings or of span offsets) and the
+caller rebuilds fresh lists from them, so mutating a returned result cannot
+corrupt the cache.
+
+The cache is bounded by entry count and optionally by an approximate byte size
+(``sys.getsizeof`` of the key text and the stored strings). The least recently
+used entries are evicted first, and a single entry larger than the byte bound
+is not stored at all.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from hashlib import blake2b
+from threading import RLock
+from typing import Any
+
+from sentencesplit.utils import CacheInfo, CacheKey
+
+_DIGEST_SIZE = 16
+# Rough per-entry bookkeeping: the OrderedDict node, the key tuple and the
+# stored tuple.
+_ENTRY_OVERHEAD = 200
+
+
+def _approx_size(value: Any) -> int:
+    if isinstance(value, tuple):
+        return sys.getsizeof(value) + sum(_approx_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class ResultCache:
+    """Thread-safe LRU of immutable segmentation results."""
+
+    def __init__(self, maxsize: int, max_bytes: int | None, key: CacheKey) -> None:
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.key = key
+        self._entries: OrderedDict[tuple[Hashable, Any], tuple[Any, int]] = OrderedDict()
+        self._lock = RLock()
+        self._hits = 0
+        self._misses = 0
+        self._bytes = 0
+
+    def _key(self, kind: Hashable, text: str) -> tuple[Hashable, Any]:
+        if self.key == "hash":
+            digest = blake2b(text.encode("utf-8", "surrogatepass"), digest_size=_DIGEST_SIZE).digest()
+            return kind, (len(text), digest)
+        return kind, text
+
+    def get_or_compute(self, kind: Hashable, text: str, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for ``(kind, text)``, computing and storing it on a miss."""
+        key = self._key(kind, text)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+        # Compute outside the lock; concurrent misses on one key just both compute.
+        value = compute()
+        size = _ENTRY_OVERHEAD + _approx_size(value) + (sys.getsizeof(text) if self.key == "text" else 0)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return value
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while len(self._entries) > self.maxsize or (self.max_bytes is not None and self._bytes > self.max_bytes):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+        return value
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._entries), self.max_bytes, self._bytes)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._bytes = 0
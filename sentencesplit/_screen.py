@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""Pre-screen for input the processor would return as a single sentence.
+
+Short chat-style messages often contain no boundary candidate at all, or a
+single terminator at the very end. For those, every text phase (list items,
+abbreviations, numbers, continuous punctuation, ...) runs and changes nothing,
+and ``process()`` returns the stripped text. :func:`trivial_sentences` detects
+such input with one regex match and returns that result directly.
+
+The screen accepts text made only of letters, combining marks, ASCII digits,
+plain spaces and ``, ; -`` around the content, optionally followed by one of
+the language's terminal punctuation marks. Anything else (a period or other
+punctuation mid-text, a line break, a bracket or quote, a zero-width char or a
+reserved sentinel) goes through the full pipeline, as does a separator that is
+itself a terminator for the language (Greek ``;``). That includes the
+apostrophe: once the text ends in a terminator, the processor splits after a
+closing single quote before a capital ("'Hi' Bob.").
+"""
+
+from __future__ import annotations
+
+import re
+
+from sentencesplit._sentinel import RESERVED_SENTINEL_SET
+from sentencesplit.lists_item_replacer import ListItemReplacer
+
+# Combining marks that \w does not cover.
+_COMBINING_MARKS = (
+    r"\u0300-\u036f\u0483-\u0489\u0591-\u05c7\u0610-\u061a\u064b-\u065f\u0670\u06d6-\u06ed"
+    r"\u0900-\u0903\u093a-\u094f\u0951-\u0957\u0962\u0963\u102b-\u103e\u1056-\u1059"
+    r"\u105e-\u1060\u1062-\u1064\u1067-\u106d\u1071-\u1074\u1082-\u108d\u108f\u109a-\u109d"
+    r"\u3099\u309a"
+)
+# Letters ([^\W\d_]: word chars minus digits and underscore), combining marks,
+# ASCII digits, and a few inert separators.
+_TRIVIAL_BODY_RE = re.compile(rf"(?:[^\W\d_]|[0-9 ,;\-{_COMBINING_MARKS}])*")
+# The trivial body plus tabs and the ASCII symbols common in code and tables.
+# Parentheses, double quotes and "&" stay out: they take part in list markers,
+# quote rules and the multi-char "&X&" sentinels.
+_BOUNDARY_FREE_RE = re.compile(rf"(?:[^\W\d_]|[0-9 \t,;'\-\[\]{{}}<>=+*/\\_#@$%^|~`:{_COMBINING_MARKS}])*")
+# Characters that cannot open, close or extend any construct the processor
+# matches across words (quotes, brackets, dashes, abbreviations, numbers).
+_INERT_CHAR_RE = re.compile(rf"[^\W\d_]|[0-9 \t,{_COMBINING_MARKS}]")
+_INERT_RUN_RE = re.compile(rf"(?:[^\W\d_]|[0-9 \t,{_COMBINING_MARKS}])*")
+_WORD_START_RE = re.compile(r"(?<=[ \t])[^ \t]")
+_LETTERS_RE = re.compile(r"[^\W\d_]+")
+# Bracket pairs an inert run may hold, opener to closer. Each pair is one level
+# deep and encloses inert text only. Quotes are left out: a straight quote may
+# close one opened before the run, and a quoted stretch next to a bracketed one
+# forms a boundary (PARENS_BETWEEN_DOUBLE_QUOTES_REGEX).
+_INERT_PAIRS = {"(": ")", "[": "]"}
+# Everything that is inert or may pair up; the rest always ends a run.
+_PAIRED_RUN_RE = re.compile(rf"(?:[^\W\d_]|[0-9 \t,()\[\]{_COMBINING_MARKS}])*")
+# Letters before a closer that could make it a list marker ("b)", "(iv)").
+_LIST_LETTERS = frozenset(ListItemReplacer.LATIN_NUMERALS + ListItemReplacer.ROMAN_NUMERALS)
+# A marker for a last word that is not all letters (a digit before ")" is a
+# numbered-list marker).
+_MIXED_WORD = "#"
+
+
+def trivial_sentences(text: str, punctuations: frozenset[str]) -> list[str] | None:
+    """Return ``process()`` output for *text* if it is trivially one sentence, else None."""
+    stripped = text.strip()
+    if not stripped:
+        return None
+    body = stripped[:-1] if stripped[-1] in punctuations else stripped
+    if (
+        _TRIVIAL_BODY_RE.fullmatch(body) is None
+        or not punctuations.isdisjoint(body)
+        or not RESERVED_SENTINEL_SET.isdisjoint(body)
+    ):
+        return None
+    return [stripped]
+
+
+def boundary_free_end(text: str, start: int, punctuations: frozenset[str]) -> int:
+    """Return where the run of *text* from *start* that cannot hold a boundary ends.
+
+    The processor returns text made only of such characters as one sentence,
+    and appending more of them cannot split it. The run stops before a
+    terminal punctuation mark, a reserved sentinel, any other character, and
+    the apostrophe of a hyphen-apostrophe pair (the pair may straddle *start*).
+    """
+    end = _BOUNDARY_FREE_RE.match(text, start).end()  # type: ignore[union-attr]
+    for index in range(start, end):
+        char = text[index]
+        if char in punctuations or char in RESERVED_SENTINEL_SET:
+            end = index
+            break
+    hyphen_quote = text.find("-'", max(start - 1, 0), end)
+    if hyphen_quote != -1:
+        end = hyphen_quote + 1
+    return end
+
+
+def inert_tail(text: str, punctuations: frozenset[str]) -> tuple[int, tuple[int, str, str, str]]:
+    """Return the start of the trailing inert run of *text* and its state.
+
+    Appending inert text far enough past the last boundary candidate cannot
+    change how that candidate is decided. See :func:`extend_inert_run` for
+    what the run may hold and what the state records.
+    """
+    # A character that is neither inert nor part of a pair always ends a run,
+    # so scanning forward from just after the last one finds the same run as
+    # scanning the whole text.
+    origin = len(text)
+    while origin and text[origin - 1] not in punctuations and _PAIRED_RUN_RE.match(text, origin - 1, origin):
+        origin -= 1
+    return extend_inert_run(text, punctuations, origin)
+
+
+def extend_inert_run(
+    text: str, punctuations: frozenset[str], start: int = 0, state: tuple[int, str, str, str] = (0, "", "", "")
+) -> tuple[int, tuple[int, str, str, str]]:
+    """Scan *text* from *start* as the continuation of an inert run.
+
+    The run holds letters, combining marks, ASCII digits, spaces, tabs and
+    commas (but no terminal punctuation of the language), plus one level of
+    round or square brackets around such text. A closer must follow a
+    word of two or more letters that is not a list letter or roman numeral, so
+    the pair cannot form a list marker (``b)``, ``(iv)``, ``2)``). Any other
+    character ends the run, and a new one begins after it.
+
+    *state* is ``(words, last, closer, word)``: the words begun in the run (a
+    word begins at each non-blank character after a space or tab), its last
+    character ("" if empty), the closer of an open pair ("" if none) and the
+    word before the end (``"#"`` if not all letters, else its last six
+    letters). Returns where the run holding the end of *text* begins (*start*
+    if the whole text continued the run) and the state at the end.
+    """
+    words, last, closer, word = state
+    run_start = index = start
+    while index < len(text):
+        end = _INERT_RUN_RE.match(text, index).end()  # type: ignore[union-attr]
+        if not punctuations.isdisjoint(text[index:end]):
+            end = next(at for at in range(index, end) if text[at] in punctuations)
+        if end > index:
+            stretch = text[index:end]
+            words += len(_WORD_START_RE.findall(last + stretch))
+            blank = max(stretch.rfind(" "), stretch.rfind("\t"))
+            word = word + stretch if blank < 0 else stretch[blank + 1 :]
+            word = word[-6:] if _LETTERS_RE.fullmatch(word) or not word else _MIXED_WORD
+            last = stretch[-1]
+            index = end
+            continue
+        char = text[index]
+        if closer and char == closer and len(word) > 1 and word != _MIXED_WORD and word.lower() not in _LIST_LETTERS:
+            closer, word = "", _MIXED_WORD
+        elif not closer and char in _INERT_PAIRS:
+            closer, word = _INERT_PAIRS[char], ""
+        else:
+            run_start, words, last, closer, word = index + 1, 0, "", "", ""
+            index += 1
+            continue
+        words += last in (" ", "\t")
+        last = char
+        index += 1
+    return run_start, (words, last, closer, word)
@@ -211,12 +211,21 @@ class AbbreviationReplacer:
     def __init__(self, text: str, lang, split_mode: str = "balanced") -> None:
         self.text = text
         self.lang = lang
-        abbr_class = lang.Abbreviation
         self.split_mode = split_mode
-        with AbbreviationReplacer._cache_lock:
-            if abbr_class not in AbbreviationReplacer._data_cache:
-                AbbreviationReplacer._data_cache[abbr_class] = _AbbreviationData(lang.Abbreviation)
-            self._data = AbbreviationReplacer._data_cache[abbr_class]
+        self._data = self.abbreviation_data(lang)
+
+    @staticmethod
+    def abbreviation_data(lang) -> _AbbreviationData:
+        """Return the shared, lazily built abbreviation data for *lang*."""
+        abbr_class = lang.Abbreviation
+        # Lock-free hit path: entries are published only after full construction.
+        data = AbbreviationReplacer._data_cache.get(abbr_class)
+        if data is None:
+            with AbbreviationReplacer._cache_lock:
+                if abbr_class not in AbbreviationReplacer._data_cache:
+                    AbbreviationReplacer._data_cache[abbr_class] = _AbbreviationData(abbr_class)
+                data = AbbreviationReplacer._data_cache[abbr_class]
+        return data
 
     def _period_classifier(self):
         """Return a PeriodClassifier, reusing the one cached per
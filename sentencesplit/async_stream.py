@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""Asyncio adapter over :class:`StreamSegmenter`.
+
+:func:`asegment_stream` turns an async iterable of text deltas (an LLM
+response, an ASR feed) into an async iterator of sentences::
+
+    async for sentence in asegment_stream(response_chunks, language="en"):
+        await tts.speak(sentence)
+
+A reader task pulls deltas into a queue of at most ``max_pending_chunks``
+items, so the source keeps streaming while the consumer is busy with a
+sentence, but stops being read once the consumer falls that far behind.
+Sentences are yielded one at a time as the consumer asks for them.
+
+Segmenting a long tail costs milliseconds, which would stall the event loop.
+When the unemitted tail reaches ``offload_threshold`` characters, the delta is
+fed on a worker thread (``asyncio.to_thread``). The stream is only ever fed by
+one task at a time, so no locking is needed. With ``max_hold_ms``, waiting for
+the next delta is cut short at the held sentence's deadline, so a sentence
+held by lookahead is released during a pause in the source. ``asyncio`` is imported on first
+use, keeping ``import sentencesplit`` cheap.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+from typing import Any
+
+from sentencesplit.exceptions import InvalidConfigurationError
+from sentencesplit.stream_segmenter import StreamSegmenter
+from sentencesplit.utils import BufferingMode, SplitMode, StreamItem
+
+_END = object()
+
+
+class _SourceError:
+    """Carries an exception raised by the source from the reader to the consumer."""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+
+def asegment_stream(
+    chunks: AsyncIterable[str | None],
+    language: str = "en",
+    *,
+    char_span: bool = False,
+    split_mode: SplitMode = "balanced",
+    buffering_mode: BufferingMode = "conservative",
+    max_buffer_size: int | None = None,
+    max_hold_ms: float | None = None,
+    clause_min_length: int | None = None,
+    max_pending_chunks: int = 64,
+    offload_threshold: int | None = 1024,
+) -> AsyncIterator[StreamItem]:
+    """Segment an async stream of text deltas into an async iterator of sentences.
+
+    The configuration is validated when this is called, not on first
+    iteration.
+
+    Parameters
+    ----------
+    chunks : AsyncIterable[str | None]
+        The text deltas. ``None`` and empty deltas are skipped.
+    language, char_span, split_mode, buffering_mode, max_buffer_size, max_hold_ms, clause_min_length
+        As for :class:`StreamSegmenter`.
+    max_pending_chunks : int, optional
+        Deltas read ahead of the consumer, by default 64.
+    offload_threshold : int or None, optional
+        Tail length in characters from which deltas are fed on a worker
+        thread, by default 1024. None always feeds on the event loop.
+
+    Returns
+    -------
+    AsyncIterator[str | TextSpan | StreamRetraction | StreamClause]
+        Each sentence once its boundary is stable, then the flushed tail when
+        *chunks* is exhausted. An exception raised by *chunks* is re-raised
+        after the sentences completed before it.
+    """
+    if max_pending_chunks <= 0:
+        raise InvalidConfigurationError("max_pending_chunks must be a positive integer.")
+    if offload_threshold is not None and offload_threshold < 0:
+        raise InvalidConfigurationError("offload_threshold must be a non-negative integer or None.")
+    stream = StreamSegmenter(
+        language=language,
+        char_span=char_span,
+        split_mode=split_mode,
+        buffering_mode=buffering_mode,
+        max_buffer_size=max_buffer_size,
+        max_hold_ms=max_hold_ms,
+        clause_min_length=clause_min_length,
+    )
+    return _sentences(stream, chunks, max_pending_chunks, offload_threshold)
+
+
+async def _sentences(
+    stream: StreamSegmenter, chunks: AsyncIterable[str | None], max_pending_chunks: int, offload_threshold: int | None
+) -> AsyncIterator[StreamItem]:
+    import asyncio
+
+    queue: asyncio.Queue[Any] = asyncio.Queue(max_pending_chunks)
+    reader = asyncio.create_task(_read(chunks, queue))
+    try:
+        while True:
+            remaining = stream._hold_remaining()
+            try:
+                item = await asyncio.wait_for(queue.get(), None if remaining is None else max(remaining, 0))
+            except TimeoutError:
+                for sentence in stream.get_completed_sentences():
+                    yield sentence
+                continue
+            if item is _END:
+                break
+            if isinstance(item, _SourceError):
+                raise item.error
+            if not item:
+                continue
+            sentences = await _call(stream._length + len(item), offload_threshold, stream._feed_and_drain, item)
+            for sentence in sentences:
+                yield sentence
+        for sentence in await _call(stream._length, offload_threshold, stream.flush):
+            yield sentence
+    finally:
+        reader.cancel()
+
+
+async def _call(size: int, offload_threshold: int | None, func: Callable[..., Any], *args: Any) -> Any:
+    """Run *func* on a worker thread if it segments *size* characters or more."""
+    if offload_threshold is not None and size >= offload_threshold:
+        import asyncio
+
+        return await asyncio.to_thread(func, *args)
+    return func(*args)
+
+
+async def _read(chunks: AsyncIterable[str | None], queue: Any) -> None:
+    try:
+        async for chunk in chunks:
+            await queue.put(chunk)
+    except Exception as error:
+        await queue.put(_SourceError(error))
+    else:
+        await queue.put(_END)
@@ -63,6 +63,11 @@ class LanguageProfile:
         # A language's hooks are immutable class attributes, so the resolved
         # profile is fully determined by the class — cache it to avoid rebuilding
         # one (and re-running getattr/regex resolution) on every Segmenter call.
+        # Profiles are published fully built, so the hit path reads the dict
+        # without the lock; only a miss serializes on it.
+        cached = _PROFILE_CACHE.get(lang)
+        if cached is not None:
+            return cached
         with _PROFILE_CACHE_LOCK:
             cached = _PROFILE_CACHE.get(lang)
             if cached is not None:
@@ -223,13 +223,15 @@ def _evict_profile(code: str) -> None:
     This drops both the cached :class:`LanguageProfile` (keyed on the language
     class) and the per-``Abbreviation``-class Aho-Corasick data (keyed on
     ``language_cls.Abbreviation``); otherwise a re-registered class whose
-    abbreviation list changed would keep a stale automaton.
+    abbreviation list changed would keep a stale automaton. The shared
+    probe-verdict cache is cleared as well.
 
-    Lock ordering (load-bearing): the two cache locks are acquired *sequentially*
+    Lock ordering (load-bearing): the cache locks are acquired *sequentially*
     (never co-held) while the caller holds ``_LANGUAGE_LOCK``. No reader path ever
     acquires ``_LANGUAGE_LOCK`` while holding ``_PROFILE_CACHE_LOCK`` or
     ``_cache_lock``, so there is no lock-ordering cycle. Preserve that invariant.
     """
+    from sentencesplit._lookahead import VERDICT_CACHE
     from sentencesplit.abbreviation_replacer import AbbreviationReplacer
     from sentencesplit.language_profile import _PROFILE_CACHE, _PROFILE_CACHE_LOCK
 
@@ -242,6 +244,9 @@ def _evict_profile(code: str) -> None:
         if abbr_class is not None:
             with AbbreviationReplacer._cache_lock:
                 AbbreviationReplacer._data_cache.pop(abbr_class, None)
+        # Probe verdicts are keyed by the language class, which a
+        # re-registration may reuse with different rules.
+        VERDICT_CACHE.clear()
 
 
 def register_language(code: str, language_cls: type) -> None:
@@ -1,26 +1,44 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
-import re
-
+import codecs
+import os
+import warnings
+from array import array
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from threading import Lock, local
+from typing import TYPE_CHECKING, Literal, overload
+
+from sentencesplit._flexible_match import find_flexible
+from sentencesplit._lookahead import VERDICT_CACHE, static_wait_verdict
 from sentencesplit._normalize import (
     _ZERO_WIDTH_CHARS,
-    _ZERO_WIDTH_CLASS,
     strip_zero_width,
     terminal_punctuation,
 )
+from sentencesplit._screen import trivial_sentences
+from sentencesplit.abbreviation_replacer import AbbreviationReplacer
 from sentencesplit.cleaner import Cleaner
 from sentencesplit.exceptions import InvalidConfigurationError
 from sentencesplit.languages import Language
 from sentencesplit.processor import Processor
 from sentencesplit.utils import (
+    CACHE_KEYS,
     SPLIT_MODES,
+    CacheInfo,
+    CacheKey,
     DocType,
+    LookaheadInfo,
     SegmentLookahead,
     SplitMode,
     TextSpan,
+    TextSpanView,
 )
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from sentencesplit._result_cache import ResultCache
+
 # Simple, common characters per script that won't trigger abbreviation rules.
 _DEFAULT_LOOKAHEAD_STEMS = ("a", "A")
 _LANGUAGE_LOOKAHEAD_STEMS = {
@@ -42,12 +60,27 @@ _LANGUAGE_LOOKAHEAD_STEMS = {
 }
 _DIGIT_LOOKAHEAD_STEM = "1"
 _PERIOD_END_PUNCTUATION = frozenset({".", "．"})
-
-# Above this length, the whole-sentence flexible-regex span fallback (which
-# emits ~8 pattern chars per input char with no cache) is replaced by a linear
-# whitespace/zero-width-tolerant index walk. Real sentences are far shorter than
-# this; the cap exists only to bound CPU on adversarial single-"sentence" input.
-_REGEX_FALLBACK_MAX_LEN = 4096
+# Indices into a per-thread lookahead tally (see Segmenter._lookahead_tally).
+_STATIC, _CACHED, _PROBED = range(3)
+
+# Above this length, the exact flexible span search (which can backtrack over
+# every char of the sentence at every candidate position) is replaced by a
+# linear, greedy whitespace/zero-width-tolerant index walk. Real sentences are
+# far shorter than this; the cap exists only to bound CPU on adversarial
+# single-"sentence" input.
+_FLEXIBLE_MATCH_MAX_LEN = 4096
+
+# Default number of texts per task for the batch APIs: large enough to amortize
+# pickling/IPC per task, small enough to keep every worker busy on short inputs.
+_DEFAULT_BATCH_CHUNKSIZE = 64
+# Tiny input run once per worker so lazy language/abbreviation/classifier caches
+# are populated before the first real document.
+_WARM_UP_TEXT = "Mr. Smith arrived at 3 p.m. He left. Did he? Yes!"
+# Default smallest piece for segment_spans_parallel. Smaller pieces cost more in
+# pickling and seam checks than they save.
+_DEFAULT_MIN_PIECE_SIZE = 1 << 16
+# Default bytes decoded per window by segment_file.
+_DEFAULT_FILE_WINDOW_SIZE = 1 << 20
 
 
 class Segmenter:
@@ -57,6 +90,9 @@ class Segmenter:
         clean: bool = False,
         doc_type: DocType = None,
         split_mode: SplitMode = "balanced",
+        cache_size: int = 0,
+        cache_max_bytes: int | None = None,
+        cache_key: CacheKey = "text",
     ) -> None:
         """Segments a text into a list of sentences.
 
@@ -102,6 +138,18 @@ class Segmenter:
             Only genuinely ambiguous decisions move with this knob;
             structural rules (decimals, period-before-comma, known
             abbreviations) are unaffected.
+        cache_size : int, optional
+            Keep the results of the last ``cache_size`` distinct calls to
+            :meth:`segment`, :meth:`segment_spans`, :meth:`should_wait_for_more`
+            and the ``*_with_lookahead`` methods in an LRU cache, by default 0
+            (disabled). Each method has its own entries; see :meth:`cache_info`.
+        cache_max_bytes : int, optional
+            Also bound the cache by the approximate size of its keys and
+            results, by default None (count bound only).
+        cache_key : str, optional
+            "text" (default) keys entries by the input string itself; "hash"
+            keys them by a BLAKE2b digest of it, so large inputs are not kept
+            alive by the cache.
         """
         self.language = language
         self.language_module = Language.get_language_code(language)
@@ -117,6 +165,35 @@ class Segmenter:
             raise InvalidConfigurationError("`doc_type='pdf'` should have `clean=True` since original text will be modified.")
         self._cleaner_cls = getattr(self.language_module, "Cleaner", Cleaner)
         self._processor_cls = getattr(self.language_module, "Processor", Processor)
+        # Only built-in languages are screened: a registered language may give
+        # any character meaning through its own rules.
+        self._screen_punctuations: frozenset[str] | None = None
+        if self.language_module.__module__.startswith("sentencesplit.lang."):
+            self._screen_punctuations = frozenset(self.language_module.Punctuations)
+        # The static lookahead verdicts are checked against the probes of the
+        # built-in languages on the plain (clean=False) path only.
+        self._static_lookahead = self._screen_punctuations is not None and not clean
+        # Lookahead counters are kept per thread, so counting a verdict takes no
+        # lock (see map()); the lock only registers a thread's first tally.
+        self._lookahead_local = local()
+        self._lookahead_tallies: list[list[int]] = []
+        self._lookahead_lock = Lock()
+        if isinstance(cache_size, bool) or not isinstance(cache_size, int) or cache_size < 0:
+            raise InvalidConfigurationError("cache_size must be a non-negative integer.")
+        if cache_max_bytes is not None and (
+            isinstance(cache_max_bytes, bool) or not isinstance(cache_max_bytes, int) or cache_max_bytes < 1
+        ):
+            raise InvalidConfigurationError("cache_max_bytes must be a positive integer or None.")
+        if cache_key not in CACHE_KEYS:
+            raise InvalidConfigurationError("cache_key must be one of {}.".format(", ".join(repr(k) for k in CACHE_KEYS)))
+        self.cache_size = cache_size
+        self.cache_max_bytes = cache_max_bytes
+        self.cache_key = cache_key
+        self._result_cache: ResultCache | None = None
+        if cache_size:
+            from sentencesplit._result_cache import ResultCache
+
+            self._result_cache = ResultCache(cache_size, cache_max_bytes, cache_key)
 
     @staticmethod
     def list_languages() -> list[str]:
@@ -137,6 +214,15 @@ class Segmenter:
     def processor(self, text: str):
         return self._processor_cls(text, self.language_module, split_mode=self.split_mode)
 
+    def _process(self, text: str) -> list[str]:
+        # Built-in languages skip the processor for text that is trivially a
+        # single sentence; see ``_screen``.
+        if self._screen_punctuations is not None:
+            sentences = trivial_sentences(text, self._screen_punctuations)
+            if sentences is not None:
+                return sentences
+        return self.processor(text).process()
+
     def _analysis_text(self, text: str) -> str:
         if self.clean or self.doc_type == "pdf":
             return self.cleaner(text).clean()
@@ -175,11 +261,20 @@ class Segmenter:
 
         return tuple(dict.fromkeys(probes))
 
-    def _comparison_segments_from_analysis_text(self, analysis_text: str) -> list[str]:
-        processed_sents = self.processor(self._processor_text(analysis_text)).process()
+    def _probe_segments(self, probe_text: str, processor_text: str) -> Iterator[str]:
+        """Lazily yield the comparison segments of *probe_text*.
+
+        *processor_text* is the text handed to the processor, normally
+        ``self._processor_text(probe_text)``. Only as many
+        processed sentences are aligned with the probe text as the caller
+        consumes, so a tail probe that compares one segment aligns one.
+        """
+        processed_sents = self._process(processor_text)
         if self.clean:
-            return processed_sents
-        return [s for s, _, _ in self._match_spans(processed_sents, analysis_text)]
+            yield from processed_sents
+            return
+        for start, end in self._match_bounds(processed_sents, probe_text):
+            yield probe_text[start:end]
 
     def _expected_last_segment_for_probe(self, last_segment: str, suffix: str) -> str:
         if self.clean:
@@ -188,16 +283,19 @@ class Segmenter:
         return last_segment + leading_whitespace
 
     def _wait_with_tail_probe(self, base_tail: str, last_segment: str, probe_suffixes: tuple[str, ...]) -> bool:
-        # base_tail starts exactly at the last segment, so probe_segments[0]
-        # corresponds to that segment. If appending a suffix changes it, the
-        # boundary is unstable and we should wait for more input.
+        # base_tail starts exactly at the last segment, so the first probe
+        # segment corresponds to that segment. If appending a suffix changes it,
+        # the boundary is unstable and we should wait for more input.
+        #
+        # base_tail is zero-width-stripped once here instead of once per probe:
+        # the probe suffixes are a space and letters or digits, which neither
+        # end a boundary run nor are closing quotes, so stripping base_tail plus
+        # a suffix gives the stripped base_tail plus that suffix.
+        base_tail = self._processor_text(base_tail)
         for suffix in probe_suffixes:
-            probe_segments = self._comparison_segments_from_analysis_text(base_tail + suffix)
-            if not probe_segments:
-                return True
-
-            expected_last_segment = self._expected_last_segment_for_probe(last_segment, suffix)
-            if probe_segments[0] != expected_last_segment:
+            probe_text = base_tail + suffix
+            first_segment = next(self._probe_segments(probe_text, probe_text), None)
+            if first_segment != self._expected_last_segment_for_probe(last_segment, suffix):
                 return True
         return False
 
@@ -210,9 +308,10 @@ class Segmenter:
     ) -> bool:
         expected_prefix = comparison_segments[:-1]
         for suffix in probe_suffixes:
-            probe_segments = self._comparison_segments_from_analysis_text(analysis_text + suffix)
             expected_last_segment = self._expected_last_segment_for_probe(last_segment, suffix)
-            probe_prefix = probe_segments[: len(comparison_segments)]
+            probe_text = analysis_text + suffix
+            probe_segments = self._probe_segments(probe_text, self._processor_text(probe_text))
+            probe_prefix = list(islice(probe_segments, len(comparison_segments)))
             if probe_prefix != [*expected_prefix, expected_last_segment]:
                 return True
         return False
@@ -223,7 +322,7 @@ class Segmenter:
 
         original_text = text
         analysis_text = self._analysis_text(text)
-        processed_sents = self.processor(self._processor_text(analysis_text)).process()
+        processed_sents = self._process(self._processor_text(analysis_text))
 
         if self.clean:
             return analysis_text, processed_sents, processed_sents
@@ -254,6 +353,18 @@ class Segmenter:
         if punct not in _PERIOD_END_PUNCTUATION:
             return False
 
+        if self._static_lookahead:
+            verdict = static_wait_verdict(
+                terminal_text,
+                punct_index,
+                lookahead_segment[len(terminal_text) :],
+                AbbreviationReplacer.abbreviation_data(self.language_module),
+                aggressive=self.split_mode == "aggressive",
+            )
+            if verdict is not None:
+                self._lookahead_tally()[_STATIC] += 1
+                return verdict
+
         probe_suffixes = self._lookahead_probes_for_text(
             terminal_text,
             punct_index,
@@ -266,11 +377,41 @@ class Segmenter:
         # rfind returns the correct (rightmost) occurrence.
         start_index = analysis_text.rfind(last_segment)
         if start_index != -1:
-            probe_tail = self._strip_zero_width(analysis_text[start_index:]) if not self.clean else analysis_text[start_index:]
-            return self._wait_with_tail_probe(probe_tail, lookahead_segment, probe_suffixes)
+            return self._cached_tail_probe(analysis_text[start_index:], lookahead_segment, probe_suffixes)
 
+        self._lookahead_tally()[_PROBED] += 1
         return self._wait_with_full_probe(analysis_text, comparison_segments, last_segment, probe_suffixes)
 
+    def _cached_tail_probe(self, base_tail: str, last_segment: str, probe_suffixes: tuple[str, ...]) -> bool:
+        # The tail probe's verdict depends only on the zero-width-stripped tail,
+        # the last segment and the configuration (probe suffixes derive from the
+        # last segment and the language), so it is shared process-wide through
+        # the verdict cache. The segmenter class is part of the key because a
+        # subclass may probe differently.
+        probe_tail = self._processor_text(base_tail)
+        config = (type(self), self.language, self.language_module, self.split_mode, self.clean)
+        kind = (*config, None if last_segment == probe_tail else last_segment)
+        probed = False
+
+        def probe() -> bool:
+            nonlocal probed
+            probed = True
+            return self._wait_with_tail_probe(probe_tail, last_segment, probe_suffixes)
+
+        verdict = VERDICT_CACHE.get_or_compute(kind, probe_tail, probe)
+        self._lookahead_tally()[_PROBED if probed else _CACHED] += 1
+        return verdict
+
+    def _lookahead_tally(self) -> list[int]:
+        """Return the calling thread's ``[static, cached, probed]`` lookahead counters."""
+        try:
+            return self._lookahead_local.tally
+        except AttributeError:
+            tally = self._lookahead_local.tally = [0, 0, 0]
+            with self._lookahead_lock:
+                self._lookahead_tallies.append(tally)
+            return tally
+
     def _find_sentence_start(self, sent: str, original_text: str, prior_end: int):
         """Return start/end indices for ``sent`` from ``prior_end`` if found."""
         start_idx = original_text.find(sent, prior_end)
@@ -279,35 +420,26 @@ class Segmenter:
 
         # The processed sentence diverges from the original (post-processing may
         # normalize spaces around punctuation, drop boundary zero-width chars,
-        # etc.). For long sentences, building/compiling a per-character regex
-        # from the whole sentence is O(N) work per call (CPU amplification on
+        # etc.). For long sentences the exact flexible search can cost a step
+        # per char per candidate position (CPU amplification on
         # attacker-controlled input length), so fall back to a linear,
         # whitespace/zero-width-tolerant index walk instead.
-        if len(sent) > _REGEX_FALLBACK_MAX_LEN:
+        if len(sent) > _FLEXIBLE_MATCH_MAX_LEN:
             return self._find_sentence_start_tolerant(sent, original_text, prior_end)
 
-        # Some post-processing rules may normalize spaces around punctuation,
-        # so allow flexible whitespace when mapping back to original text. Search
-        # from ``prior_end`` via the pattern's ``pos`` arg rather than slicing
-        # ``original_text[prior_end:]`` (which copies the whole remaining text on
-        # every sentence — O(n^2) over a document). The flexible patterns are
-        # anchor-free (escaped literal + ``\s*``/zero-width joiners), so matching
-        # at ``pos`` is identical to matching the slice.
-        whitespace_flexible = re.compile(re.escape(sent).replace(r"\ ", r"\s*"))
-        match = whitespace_flexible.search(original_text, prior_end)
-        if match is None:
-            match = re.compile(self._zero_width_flexible_pattern(sent)).search(original_text, prior_end)
-        if match is None:
-            return None
-
-        return match.start(), match.end()
+        # Some post-processing rules may normalize spaces around punctuation or
+        # drop zero-width chars, so allow flexible whitespace, then flexible
+        # zero-width chars, when mapping back to original text. The search is a
+        # direct walk from ``prior_end`` rather than a per-sentence compiled
+        # regex; see ``_flexible_match``.
+        return find_flexible(sent, original_text, prior_end)
 
     @staticmethod
     def _match_tolerant_at(sent: str, original_text: str, start: int):
         """Match ``sent`` against ``original_text`` starting at ``start``.
 
-        Mirrors the zero-width-flexible regex fallback without compiling a
-        per-character pattern: between any two characters a run of zero-width
+        A greedy, non-backtracking take on the zero-width-flexible search in
+        ``_flexible_match``: between any two characters a run of zero-width
         characters may be skipped, and where ``sent`` has whitespace a run of
         whitespace-or-zero-width may be consumed (including the empty run).
         Returns the end index in ``original_text`` on success, else ``None``.
@@ -327,7 +459,7 @@ class Segmenter:
             if oi >= n or original_text[oi] != ch:
                 return None
             oi += 1
-        # Trailing inter-char joiner run (the regex appends one after the
+        # Trailing inter-char joiner run (the flexible pattern has one after the
         # final character as well).
         while oi < n and original_text[oi] in _ZERO_WIDTH_CHARS:
             oi += 1
@@ -360,17 +492,6 @@ class Segmenter:
                 return candidate, end_idx
             search_from = candidate + 1
 
-    def _zero_width_flexible_pattern(self, sent: str) -> str:
-        joiner = rf"[{_ZERO_WIDTH_CLASS}]*"
-        parts = []
-        for char in sent:
-            if char.isspace():
-                parts.append(rf"[\s{_ZERO_WIDTH_CLASS}]*")
-            else:
-                parts.append(re.escape(char))
-            parts.append(joiner)
-        return "".join(parts)
-
     def _next_sentence_start(self, sentences: list[str], start_at: int, original_text: str, prior_end: int):
         """Find start index for the next matchable sentence after ``start_at``."""
         for next_sent in sentences[start_at:]:
@@ -382,14 +503,14 @@ class Segmenter:
         return None
 
     def _unmatched_span(self, sentences: list[str], idx: int, original_text: str, prior_end: int):
-        """Return fallback span when current processed sentence cannot be matched."""
+        """Return fallback ``(start, end)`` when current processed sentence cannot be matched."""
         next_start = self._next_sentence_start(sentences, idx + 1, original_text, prior_end)
         if next_start is None:
             if prior_end < len(original_text):
-                return original_text[prior_end:], prior_end, len(original_text)
+                return prior_end, len(original_text)
             return None
         if next_start > prior_end:
-            return original_text[prior_end:next_start], prior_end, next_start
+            return prior_end, next_start
         return None
 
     def _match_spans(self, sentences: list[str], original_text: str):
@@ -404,17 +525,33 @@ class Segmenter:
         reproduces ``original_text`` byte-for-byte even when the processor
         emits no sentence content (e.g. whitespace- or zero-width-only input).
         """
+        for start, end in self._match_bounds(sentences, original_text):
+            yield original_text[start:end], start, end
+
+    def _match_bounds(
+        self, sentences: list[str], original_text: str, unanchored: list[tuple[int, str, bool]] | None = None
+    ) -> Iterator[tuple[int, int]]:
+        # The (start, end) offsets behind _match_spans, without slicing the text.
+        # With *unanchored*, each sentence not found verbatim is recorded there
+        # as (offset the search began at, sentence, whether it was found).
         prior_end = 0
         for idx, sent in enumerate(sentences):
             if not sent:
                 continue
+            if sent[0] in _ZERO_WIDTH_CHARS:
+                # The processor can leave a zero-width char ahead of a sentence
+                # (" \u200bMr." strips to "\u200bMr."). The previous span's
+                # trailing sweep has usually consumed it already, so searching
+                # with it would skip to a later occurrence of the sentence.
+                sent = sent.lstrip("".join(_ZERO_WIDTH_CHARS)) or sent
             match_span = self._find_sentence_start(sent, original_text, prior_end)
+            if unanchored is not None and (match_span is None or original_text[match_span[0] : match_span[1]] != sent):
+                unanchored.append((prior_end, sent, match_span is not None))
             if match_span is None:
                 fallback_span = self._unmatched_span(sentences, idx, original_text, prior_end)
                 if fallback_span is not None:
-                    txt, start, end = fallback_span
-                    yield txt, start, end
-                    prior_end = end
+                    yield fallback_span
+                    prior_end = fallback_span[1]
                 continue
 
             start_idx, end_idx = match_span
@@ -424,7 +561,7 @@ class Segmenter:
                 original_text[end_idx].isspace() or original_text[end_idx] in _ZERO_WIDTH_CHARS
             ):
                 end_idx += 1
-            yield original_text[start_idx:end_idx], start_idx, end_idx
+            yield start_idx, end_idx
             prior_end = end_idx
 
         # Trailing remainder the matching loop did not cover (e.g. whitespace-
@@ -434,7 +571,7 @@ class Segmenter:
         # text the per-sentence trailing-whitespace sweep already advances
         # prior_end to len(original_text), so this never fires.
         if prior_end < len(original_text):
-            yield original_text[prior_end:], prior_end, len(original_text)
+            yield prior_end, len(original_text)
 
     def segment(self, text: str | None) -> list[str]:
         """Segment ``text`` into a ``list[str]`` of sentences.
@@ -442,6 +579,8 @@ class Segmenter:
         Use :meth:`segment_spans` to get ``list[TextSpan]`` with original-text
         character offsets and a byte-for-byte round-trip guarantee.
         """
+        if self._result_cache is not None and text:
+            return list(self._result_cache.get_or_compute("segment", text, lambda: tuple(self._segment_result(text)[1])))
         _, segments, _ = self._segment_result(text)
         return segments
 
@@ -451,6 +590,11 @@ class Segmenter:
         This is continuation-sensitive by design: we probe with tiny suffixes to
         detect whether the last boundary remains stable if more text arrives.
         """
+        if self._result_cache is not None and text:
+            return self._result_cache.get_or_compute("should_wait_for_more", text, lambda: self._should_wait(text))
+        return self._should_wait(text)
+
+    def _should_wait(self, text: str | None) -> bool:
         analysis_text, _, comparison_segments = self._segment_result(text)
         return self._wait_for_last_segment(analysis_text, comparison_segments)
 
@@ -461,12 +605,21 @@ class Segmenter:
         ``segments`` is a ``list[str]``. Use
         :meth:`segment_spans_with_lookahead` for the ``list[TextSpan]`` variant.
         """
+        if self._result_cache is not None and text:
+            segments, should_wait = self._result_cache.get_or_compute(
+                "segment_with_lookahead", text, lambda: self._segments_with_lookahead(text)
+            )
+            return SegmentLookahead(segments=list(segments), should_wait_for_more=should_wait)
         analysis_text, segments, comparison_segments = self._segment_result(text)
         return SegmentLookahead(
             segments=segments,
             should_wait_for_more=self._wait_for_last_segment(analysis_text, comparison_segments),
         )
 
+    def _segments_with_lookahead(self, text: str | None) -> tuple[tuple[str, ...], bool]:
+        analysis_text, segments, comparison_segments = self._segment_result(text)
+        return tuple(segments), self._wait_for_last_segment(analysis_text, comparison_segments)
+
     def segment_spans(self, text: str | None) -> list[TextSpan]:
         """Return sentence spans as a ``list[TextSpan]``.
 
@@ -484,9 +637,212 @@ class Segmenter:
             raise InvalidConfigurationError("segment_spans() requires clean=False.")
         if not text:
             return []
-        processed_sents = self.processor(self._processor_text(text)).process()
+        if self._result_cache is not None:
+            bounds = self._result_cache.get_or_compute("segment_spans", text, lambda: self._span_bounds(text))
+            return [TextSpan(text[start:end], start, end) for start, end in bounds]
+        processed_sents = self._process(self._processor_text(text))
         return [TextSpan(s, start, end) for s, start, end in self._match_spans(processed_sents, text)]
 
+    def _span_bounds(self, text: str) -> tuple[tuple[int, int], ...]:
+        processed_sents = self._process(self._processor_text(text))
+        return tuple(self._match_bounds(processed_sents, text))
+
+    def _span_ends(self, text: str | None) -> list[int]:
+        # End offsets of segment_spans(text), without building TextSpan objects.
+        if not text:
+            return []
+        processed_sents = self._process(self._processor_text(text))
+        return [end for _, end in self._match_bounds(processed_sents, text)]
+
+    def _piece_alignment(self, text: str) -> tuple[list[int], list[tuple[int, str, bool]]]:
+        # _span_ends plus the sentences _match_bounds did not find verbatim,
+        # which _hard_boundary needs to tell whether a seam after text holds.
+        unanchored: list[tuple[int, str, bool]] = []
+        processed_sents = self._process(self._processor_text(text))
+        return [end for _, end in self._match_bounds(processed_sents, text, unanchored)], unanchored
+
+    def segment_span_views(self, text: str | None) -> list[TextSpanView]:
+        """Return the spans of :meth:`segment_spans` as lightweight :class:`~sentencesplit.utils.TextSpanView` objects.
+
+        Each view holds a reference to ``text`` plus its offsets in slots and
+        slices ``.sent`` only on access, so no sentence substring is copied up
+        front. Views compare equal to the matching ``TextSpan``; call
+        ``to_text_span()`` where a real ``TextSpan`` is needed. Requires
+        ``clean=False``.
+        """
+        if self.clean:
+            raise InvalidConfigurationError("segment_span_views() requires clean=False.")
+        if not text:
+            return []
+        processed_sents = self._process(self._processor_text(text))
+        return [TextSpanView(text, start, end) for start, end in self._match_bounds(processed_sents, text)]
+
+    def segment_offsets(self, text: str | None) -> array[int]:
+        """Return the sentence boundaries of :meth:`segment_spans` as a compact ``array('q')``.
+
+        ``offsets[0]`` is 0, ``offsets[-1]`` is ``len(text)``, and sentence ``i``
+        is ``text[offsets[i]:offsets[i + 1]]``, so the tiling and round-trip
+        guarantees of :meth:`segment_spans` carry over. Neither
+        :class:`~sentencesplit.utils.TextSpan` objects nor sentence substrings
+        are built: one machine-word per boundary, for corpora where only the
+        offsets are kept. Empty input returns ``array('q', [0])``. Requires
+        ``clean=False``.
+        """
+        if self.clean:
+            raise InvalidConfigurationError("segment_offsets() requires clean=False.")
+        offsets = array("q", [0])
+        if text:
+            processed_sents = self._process(self._processor_text(text))
+            offsets.extend(end for _, end in self._match_bounds(processed_sents, text))
+        return offsets
+
+    def segment_spans_parallel(
+        self,
+        text: str | None,
+        n_workers: int | None = None,
+        min_piece_size: int = _DEFAULT_MIN_PIECE_SIZE,
+    ) -> list[TextSpan]:
+        """Segment one large document on a process pool; same result as :meth:`segment_spans`.
+
+        ``text`` is cut at paragraph breaks (blank-line runs) into pieces of at
+        least ``min_piece_size`` chars. The pieces are segmented on ``n_workers``
+        processes (default: the usable CPU count) and their offsets rebased onto
+        ``text``. Cuts are never placed in or near a region the list-item phase
+        rewrites, and every seam is re-checked by segmenting the two sentences
+        on each side of it together; a seam where a boundary moves, or where a
+        sentence the processor rewrote recurs verbatim after it, is dropped and
+        the adjacent pieces are segmented as one. Text shorter than two pieces, or
+        containing reserved sentinel characters, is segmented whole. Requires
+        ``clean=False``.
+        """
+        if self.clean:
+            raise InvalidConfigurationError("segment_spans_parallel() requires clean=False.")
+        if min_piece_size < 1:
+            raise InvalidConfigurationError("min_piece_size must be a positive integer.")
+        from sentencesplit import _hard_boundary, _parallel
+
+        n_workers = _parallel.validate_pool_args(n_workers, 1)
+        if not text:
+            return []
+        cuts = _hard_boundary.hard_boundary_cuts(self, text, min_piece_size)
+        if not cuts:
+            return self.segment_spans(text)
+        bounds = [0, *cuts, len(text)]
+        pieces = [text[start:end] for start, end in zip(bounds, bounds[1:])]
+        alignments = _parallel.iter_batch(self, "_piece_alignment", pieces, n_workers, 1, True)
+        piece_items = ((start, piece, *alignment) for start, piece, alignment in zip(bounds, pieces, alignments))
+        return list(_hard_boundary.iter_stitched_spans(self, piece_items, text))
+
+    def iter_segment_spans(self, text: str | None, min_piece_size: int = _DEFAULT_MIN_PIECE_SIZE) -> Iterator[TextSpan]:
+        """Lazily yield the spans of :meth:`segment_spans`, piece by piece.
+
+        ``text`` is cut at paragraph breaks into pieces of at least
+        ``min_piece_size`` chars, exactly as in :meth:`segment_spans_parallel`,
+        and the pieces are segmented one after another in this process. Spans of
+        a piece are yielded once the boundary after it is verified, so only about
+        two pieces' worth of processed sentences is alive at a time instead of
+        the whole document's. The yielded spans equal ``segment_spans(text)``.
+        Requires ``clean=False``.
+        """
+        if self.clean:
+            raise InvalidConfigurationError("iter_segment_spans() requires clean=False.")
+        if min_piece_size < 1:
+            raise InvalidConfigurationError("min_piece_size must be a positive integer.")
+        return self._iter_segment_spans(text, min_piece_size)
+
+    def _iter_segment_spans(self, text: str | None, min_piece_size: int) -> Iterator[TextSpan]:
+        if not text:
+            return
+        from sentencesplit import _hard_boundary
+
+        bounds = [0, *_hard_boundary.hard_boundary_cuts(self, text, min_piece_size), len(text)]
+        yield from _hard_boundary.iter_stitched_spans(self, _hard_boundary.iter_segmented_pieces(self, text, bounds), text)
+
+    @overload
+    def segment_file(
+        self,
+        path: str | os.PathLike[str],
+        encoding: str = ...,
+        errors: str = ...,
+        byte_offsets: Literal[False] = ...,
+        window_size: int = ...,
+    ) -> Iterator[TextSpan]: ...
+
+    @overload
+    def segment_file(
+        self,
+        path: str | os.PathLike[str],
+        encoding: str = ...,
+        errors: str = ...,
+        *,
+        byte_offsets: Literal[True],
+        window_size: int = ...,
+    ) -> Iterator[tuple[TextSpan, int, int]]: ...
+
+    def segment_file(
+        self,
+        path: str | os.PathLike[str],
+        encoding: str = "utf-8",
+        errors: str = "strict",
+        byte_offsets: bool = False,
+        window_size: int = _DEFAULT_FILE_WINDOW_SIZE,
+    ) -> Iterator[TextSpan] | Iterator[tuple[TextSpan, int, int]]:
+        """Stream the sentence spans of a text file without decoding it whole.
+
+        The file is memory-mapped and decoded ``window_size`` bytes at a time;
+        decoded text is cut at paragraph breaks and segmented piece by piece,
+        with every seam verified as in :meth:`iter_segment_spans`. Yields
+        :class:`~sentencesplit.utils.TextSpan` objects whose offsets are absolute
+        character offsets into the decoded file, so the spans tile it exactly.
+        Peak memory is bounded by a few windows regardless of file size.
+
+        With ``byte_offsets=True`` each item is ``(span, byte_start, byte_end)``,
+        the span's range in the file's bytes (a decoded BOM belongs to the first
+        span). Byte lengths are computed by re-encoding each span with
+        ``encoding``, which is exact for UTF-8/16/32 and for any encoding whose
+        byte form is unique.
+
+        The file is opened on the first ``next()``. Numbered or lettered list
+        markers are paired within a window, not across the whole file; see
+        :mod:`sentencesplit._file_windows`. Requires ``clean=False``.
+        """
+        if self.clean:
+            raise InvalidConfigurationError("segment_file() requires clean=False.")
+        if window_size < 1:
+            raise InvalidConfigurationError("window_size must be a positive integer.")
+        codecs.lookup(encoding)
+        from sentencesplit import _file_windows, _hard_boundary
+
+        pieces = _file_windows.iter_file_pieces(self, path, encoding, errors, window_size)
+        spans = _hard_boundary.iter_stitched_spans(self, pieces)
+        if not byte_offsets:
+            return spans
+        return self._with_byte_offsets(spans, encoding, errors)
+
+    @staticmethod
+    def _with_byte_offsets(spans: Iterator[TextSpan], encoding: str, errors: str) -> Iterator[tuple[TextSpan, int, int]]:
+        # One incremental encoder for the whole stream, so a stateful encoding
+        # emits its BOM once, in the first span's byte range.
+        encoder = codecs.getincrementalencoder(encoding)(errors)
+        byte_start = 0
+        for span in spans:
+            byte_end = byte_start + len(encoder.encode(span.sent))
+            yield span, byte_start, byte_end
+            byte_start = byte_end
+
+    def iter_segment(self, text: str | None, min_piece_size: int = _DEFAULT_MIN_PIECE_SIZE) -> Iterator[str]:
+        """Lazily yield the sentences of :meth:`segment`.
+
+        With ``clean=False`` sentences are derived from :meth:`iter_segment_spans`
+        and produced piece by piece. With ``clean=True`` the cleaner rewrites the
+        whole text before segmentation, so the sentences of :meth:`segment` are
+        computed up front and then iterated.
+        """
+        if self.clean:
+            return iter(self.segment(text))
+        spans = self.iter_segment_spans(text, min_piece_size)
+        return (sentence for sentence in (self._strip_zero_width(span.sent) for span in spans) if sentence.strip())
+
     def segment_spans_with_lookahead(self, text: str | None) -> SegmentLookahead[TextSpan]:
         """Return sentence spans **and** the trailing-boundary lookahead verdict.
 
@@ -508,16 +864,201 @@ class Segmenter:
             raise InvalidConfigurationError("segment_spans_with_lookahead() requires clean=False.")
         if not text:
             return SegmentLookahead(segments=[], should_wait_for_more=False)
-        processed_sents = self.processor(self._processor_text(text)).process()
+        if self._result_cache is not None:
+            bounds, should_wait = self._result_cache.get_or_compute(
+                "segment_spans_with_lookahead", text, lambda: self._span_bounds_with_lookahead(text)
+            )
+            spans = [TextSpan(text[start:end], start, end) for start, end in bounds]
+            return SegmentLookahead(segments=spans, should_wait_for_more=should_wait)
+        processed_sents = self._process(self._processor_text(text))
         matched_spans = list(self._match_spans(processed_sents, text))
         spans = [TextSpan(s, start, end) for s, start, end in matched_spans]
         comparison_segments = [s for s, _, _ in matched_spans]
         should_wait = self._wait_for_last_segment(text, comparison_segments)
         return SegmentLookahead(segments=spans, should_wait_for_more=should_wait)
 
+    def _span_bounds_with_lookahead(self, text: str) -> tuple[tuple[tuple[int, int], ...], bool]:
+        processed_sents = self._process(self._processor_text(text))
+        matched_spans = list(self._match_spans(processed_sents, text))
+        should_wait = self._wait_for_last_segment(text, [s for s, _, _ in matched_spans])
+        return tuple((start, end) for _, start, end in matched_spans), should_wait
+
+    def cache_info(self) -> CacheInfo:
+        """Return hit/miss counters and current size of the result cache.
+
+        ``currbytes`` is the approximate size counted against
+        ``cache_max_bytes``. All zero when the cache is disabled
+        (``cache_size=0``).
+        """
+        if self._result_cache is None:
+            return CacheInfo(0, 0, 0, 0, self.cache_max_bytes, 0)
+        return self._result_cache.info()
+
+    def cache_clear(self) -> None:
+        """Drop every cached result and reset the counters."""
+        if self._result_cache is not None:
+            self._result_cache.clear()
+
+    def lookahead_info(self) -> LookaheadInfo:
+        """Report how period-final segments were resolved by the lookahead methods.
+
+        Segments ending in a known abbreviation, a number or an ordinary
+        lowercase word are decided from that token (``static``); the rest are
+        re-segmented with probe suffixes appended (``probed``) unless the same
+        terminal context was already probed by any segmenter with this
+        configuration (``cached``, see :meth:`lookahead_cache_info`). Results
+        served by the result cache (see ``cache_size``) are not counted.
+        Counts are summed over every thread that used this segmenter.
+        """
+        with self._lookahead_lock:
+            tallies = list(self._lookahead_tallies)
+        return LookaheadInfo(*(sum(tally[index] for tally in tallies) for index in (_STATIC, _CACHED, _PROBED)))
+
+    @staticmethod
+    def lookahead_cache_info() -> CacheInfo:
+        """Statistics of the process-wide cache of probe verdicts.
+
+        Shared by every :class:`Segmenter` and :class:`StreamSegmenter`; keyed by
+        configuration and the zero-width-stripped last segment, LRU-evicted.
+        """
+        return VERDICT_CACHE.info()
+
+    @staticmethod
+    def lookahead_cache_clear() -> None:
+        """Drop every cached probe verdict and reset the counters."""
+        VERDICT_CACHE.clear()
+
+    def _warm_caches(self) -> None:
+        # Populate the per-language profile/abbreviation/classifier caches once
+        # so the first real call does not pay the cold-start cost.
+        from sentencesplit.language_profile import LanguageProfile
+
+        LanguageProfile.from_language(self.language_module)
+        self.segment(_WARM_UP_TEXT)
+
+    @overload
+    def segment_batch(
+        self,
+        texts: Iterable[str | None],
+        n_workers: int | None = ...,
+        chunksize: int = ...,
+        ordered: Literal[True] = ...,
+    ) -> Iterator[list[str]]: ...
+
+    @overload
+    def segment_batch(
+        self,
+        texts: Iterable[str | None],
+        n_workers: int | None = ...,
+        chunksize: int = ...,
+        *,
+        ordered: Literal[False],
+    ) -> Iterator[tuple[int, list[str]]]: ...
+
+    def segment_batch(
+        self,
+        texts: Iterable[str | None],
+        n_workers: int | None = None,
+        chunksize: int = _DEFAULT_BATCH_CHUNKSIZE,
+        ordered: bool = True,
+    ) -> Iterator[list[str]] | Iterator[tuple[int, list[str]]]:
+        """Segment many texts on a process pool, streaming results back.
+
+        Equivalent to ``(self.segment(t) for t in texts)`` but fanned out to
+        ``n_workers`` processes (default: the usable CPU count), ``chunksize``
+        texts per task. Each worker rebuilds this segmenter's configuration once
+        and warms the language caches before its first task. A subclass is
+        rebuilt as itself from the same constructor arguments, so it must be
+        importable by the workers. ``texts`` may be any (lazy) iterable; only a
+        bounded window of it is in flight at once.
+
+        With ``ordered=True`` (default) results are yielded in input order. With
+        ``ordered=False`` ``(index, segments)`` pairs are yielded as soon as each
+        chunk finishes, which avoids head-of-line blocking on uneven inputs.
+        ``n_workers=1`` runs in-process with the same output shape.
+
+        The pool is started on first iteration and shut down when the returned
+        iterator is exhausted, closed, or garbage-collected. Languages added with
+        :func:`~sentencesplit.languages.register_language` are visible to workers
+        only under the ``fork`` start method.
+        """
+        from sentencesplit import _parallel
+
+        n_workers = _parallel.validate_pool_args(n_workers, chunksize)
+        return _parallel.iter_batch(self, "segment", texts, n_workers, chunksize, ordered)
+
+    @overload
+    def segment_spans_batch(
+        self,
+        texts: Iterable[str | None],
+        n_workers: int | None = ...,
+        chunksize: int = ...,
+        ordered: Literal[True] = ...,
+    ) -> Iterator[list[TextSpan]]: ...
+
+    @overload
+    def segment_spans_batch(
+        self,
+        texts: Iterable[str | None],
+        n_workers: int | None = ...,
+        chunksize: int = ...,
+        *,
+        ordered: Literal[False],
+    ) -> Iterator[tuple[int, list[TextSpan]]]: ...
+
+    def segment_spans_batch(
+        self,
+        texts: Iterable[str | None],
+        n_workers: int | None = None,
+        chunksize: int = _DEFAULT_BATCH_CHUNKSIZE,
+        ordered: bool = True,
+    ) -> Iterator[list[TextSpan]] | Iterator[tuple[int, list[TextSpan]]]:
+        """Spans variant of :meth:`segment_batch`: one ``list[TextSpan]`` per text.
+
+        Each result is exactly ``self.segment_spans(text)``, so the round-trip
+        and tiling guarantees hold per text. Requires ``clean=False``.
+        """
+        if self.clean:
+            raise InvalidConfigurationError("segment_spans_batch() requires clean=False.")
+        from sentencesplit import _parallel
+
+        n_workers = _parallel.validate_pool_args(n_workers, chunksize)
+        return _parallel.iter_batch(self, "segment_spans", texts, n_workers, chunksize, ordered)
+
+    def map(
+        self,
+        texts: Iterable[str | None],
+        threads: int | None = None,
+        chunksize: int = _DEFAULT_BATCH_CHUNKSIZE,
+    ) -> Iterator[list[str]]:
+        """Segment many texts on a thread pool sharing this Segmenter.
+
+        Equivalent to ``(self.segment(t) for t in texts)``, yielded in input
+        order. On a free-threaded build (CPython 3.14t, GIL disabled) ``threads``
+        workers (default: the usable CPU count) segment in parallel over one
+        shared set of language profiles, abbreviation automata and period
+        classifiers, with no lock on the per-call path.
+
+        With the GIL enabled, threads cannot run segmentation concurrently, so
+        ``threads > 1`` emits a :class:`RuntimeWarning` and falls back to
+        :meth:`segment_batch` with the same number of worker processes.
+        """
+        from sentencesplit import _parallel
+
+        threads = _parallel.validate_pool_args(threads, chunksize, name="threads")
+        if threads > 1 and _parallel.gil_enabled():
+            warnings.warn(
+                "Segmenter.map(): the GIL is enabled, so threads cannot segment in parallel; "
+                "falling back to a process pool (segment_batch).",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+            return _parallel.iter_batch(self, "segment", texts, threads, chunksize, True)
+        return _parallel.iter_thread_map(self, "segment", texts, threads, chunksize)
+
     def segment_clean(self, text: str | None) -> list[str]:
         """Return cleaned sentences regardless of the instance's clean flag."""
         if not text:
             return []
         analysis_text = self.cleaner(text).clean()
-        return self.processor(analysis_text).process()
+        return self._process(analysis_text)
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""Many concurrent streaming sessions over one shared :class:`Segmenter`.
+
+A standalone :class:`StreamSegmenter` builds its own ``Segmenter``. A voice
+gateway or chat server holding one stream per live session pays for that
+instance tens of thousands of times over, although every session uses the same
+configuration. :class:`StreamSegmenterPool` validates the configuration once,
+builds one ``Segmenter`` and gives each session a slotted ``StreamSegmenter``
+that only holds its own buffer, offsets and completed list.
+
+Sessions are created on first use and kept in least-recently-fed order, so
+idle sessions past ``ttl`` seconds are evicted from the front of that order in
+time proportional to the number evicted. Eviction drops the session's pending
+text; call :meth:`StreamSegmenterPool.flush` at the end of a session to
+collect it.
+
+The pool is thread-safe for distinct sessions. Feeding one session from two
+threads at once is not supported, as for a single ``StreamSegmenter``.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from threading import Lock
+from typing import Any
+
+from sentencesplit.exceptions import InvalidConfigurationError
+from sentencesplit.stream_segmenter import StreamSegmenter
+from sentencesplit.utils import BufferingMode, PoolInfo, SplitMode, StreamItem
+
+
+class StreamSegmenterPool:
+    """Session-keyed :class:`StreamSegmenter` instances sharing one ``Segmenter``.
+
+    Parameters mirror :class:`StreamSegmenter`, plus ``ttl``, the idle time in
+    seconds after which a session is evicted (None keeps sessions until they
+    are flushed). ``clock`` is the time source for both ``ttl`` and
+    ``max_hold_ms``; ``feed(session_id, None)`` releases a session's sentence
+    held past ``max_hold_ms`` without adding text.
+    """
+
+    def __init__(
+        self,
+        language: str = "en",
+        clean: bool = False,
+        char_span: bool = False,
+        split_mode: SplitMode = "balanced",
+        buffering_mode: BufferingMode = "conservative",
+        max_buffer_size: int | None = None,
+        max_hold_ms: float | None = None,
+        clause_min_length: int | None = None,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ttl is not None and ttl <= 0:
+            raise InvalidConfigurationError("ttl must be a positive number of seconds or None.")
+        # Validates the configuration; every session is spawned from it.
+        self._template = StreamSegmenter(
+            language=language,
+            clean=clean,
+            char_span=char_span,
+            split_mode=split_mode,
+            buffering_mode=buffering_mode,
+            max_buffer_size=max_buffer_size,
+            max_hold_ms=max_hold_ms,
+            clock=clock,
+            clause_min_length=clause_min_length,
+        )
+        self.language = language
+        self.char_span = char_span
+        self.split_mode = split_mode
+        self.buffering_mode = buffering_mode
+        self.max_buffer_size = max_buffer_size
+        self.max_hold_ms = max_hold_ms
+        self.clause_min_length = clause_min_length
+        self.ttl = ttl
+        self._clock = clock
+        # Least recently fed first; values are (stream, last-fed time).
+        self._sessions: OrderedDict[Hashable, tuple[StreamSegmenter, float]] = OrderedDict()
+        self._lock = Lock()
+        self._evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, session_id: object) -> bool:
+        return session_id in self._sessions
+
+    def feed(self, session_id: Hashable, delta: str | None, meta: Any = None) -> list[StreamItem]:
+        """Feed *delta* to a session, creating it if needed, and return its new sentences.
+
+        The result holds the sentences that became stable, plus the
+        force-emitted tail when ``max_buffer_size`` overflows. *meta* is as
+        for :meth:`StreamSegmenter.feed`.
+        """
+        now = self._clock()
+        with self._lock:
+            self._evict_expired(now)
+            stream = self._touch(session_id, now)
+        return stream._feed_and_drain(delta, meta)
+
+    def feed_many(self, items: Iterable[tuple[Hashable, str | None]]) -> dict[Hashable, list[StreamItem]]:
+        """Feed ``(session_id, delta)`` pairs in order; return new sentences by session.
+
+        Sessions that completed nothing are left out of the result. The clock is
+        read and expired sessions are evicted once for the whole batch.
+        """
+        items = list(items)
+        now = self._clock()
+        with self._lock:
+            self._evict_expired(now)
+            streams = [self._touch(session_id, now) for session_id, _ in items]
+        completed: dict[Hashable, list[StreamItem]] = {}
+        for (session_id, delta), stream in zip(items, streams):
+            sentences = stream._feed_and_drain(delta)
+            if sentences:
+                completed.setdefault(session_id, []).extend(sentences)
+        return completed
+
+    def pending_text(self, session_id: Hashable) -> str:
+        """Return a session's unemitted tail ("" for an unknown session)."""
+        entry = self._sessions.get(session_id)
+        return "" if entry is None else entry[0].pending_text()
+
+    def is_complete(self, session_id: Hashable) -> bool:
+        """Return :meth:`StreamSegmenter.is_complete` for a session (True if unknown)."""
+        entry = self._sessions.get(session_id)
+        return True if entry is None else entry[0].is_complete()
+
+    def flush(self, session_id: Hashable) -> list[StreamItem]:
+        """End a session: return its remaining sentences and remove it.
+
+        An unknown or already evicted session returns ``[]``.
+        """
+        with self._lock:
+            entry = self._sessions.pop(session_id, None)
+        return [] if entry is None else entry[0].flush()
+
+    def evict_idle(self) -> list[Hashable]:
+        """Evict the sessions idle for ``ttl`` seconds or more and return their IDs.
+
+        Feeding also evicts, so this is only needed to reclaim memory while no
+        session is fed. A no-op without ``ttl``.
+        """
+        with self._lock:
+            return self._evict_expired(self._clock())
+
+    def info(self) -> PoolInfo:
+        """Report session counts and the approximate memory they hold.
+
+        ``approx_bytes`` sums ``sys.getsizeof`` of each session's stream, its
+        buffered chunks and its uncollected sentences, excluding the shared
+        ``Segmenter``. It visits every session, so it is a diagnostic, not a hot
+        path call.
+        """
+        with self._lock:
+            streams = [stream for stream, _ in self._sessions.values()]
+            evicted = self._evicted
+        approx_bytes = sum(_session_size(stream) for stream in streams)
+        return PoolInfo(len(streams), evicted, approx_bytes)
+
+    def _touch(self, session_id: Hashable, now: float) -> StreamSegmenter:
+        # Caller holds the lock.
+        entry = self._sessions.pop(session_id, None)
+        stream = self._template._spawn() if entry is None else entry[0]
+        self._sessions[session_id] = (stream, now)
+        return stream
+
+    def _evict_expired(self, now: float) -> list[Hashable]:
+        # Caller holds the lock. Sessions are ordered by last feed, so the
+        # expired ones are a prefix.
+        evicted: list[Hashable] = []
+        if self.ttl is None:
+            return evicted
+        while self._sessions:
+            session_id, (_, fed_at) = next(iter(self._sessions.items()))
+            if now - fed_at < self.ttl:
+                break
+            del self._sessions[session_id]
+            evicted.append(session_id)
+        self._evicted += len(evicted)
+        return evicted
+
+
+def _session_size(stream: StreamSegmenter) -> int:
+    size = sys.getsizeof(stream) + sys.getsizeof(stream._chunks) + sys.getsizeof(stream._completed)
+    size += sum(sys.getsizeof(chunk) for chunk in stream._chunks)
+    return size + sum(sys.getsizeof(span) + sys.getsizeof(span.sent) for span in stream._completed)
@@ -30,16 +30,41 @@ immutable:
 - offsets are simply ``base_offset + tail_offset`` and stay byte-faithful, with no
   length-derived drift on dirty input (zero-width / NBSP / BOM / combining / RTL).
 
-Cost is bounded by the length of a single sentence (the held tail), so a long
-stream stays linear, not quadratic.
+Each segmentation pass covers the held tail, which is about one sentence
+long, so a long sentence fed in many small deltas is re-segmented once per
+delta (quadratic in its length) unless one of these skips applies. A held tail
+that cannot yet contain a boundary at all (letters, digits, spaces and inert
+ASCII symbols, with no terminal punctuation, line break, bracket pair or quote;
+see :func:`sentencesplit._screen.boundary_free_end`) is not re-segmented: the
+stream only scans the new delta, so a long unterminated run costs O(delta) per
+feed. Once the tail ends in an *inert* run reaching a few words past its last
+boundary candidate, further inert deltas are deferred too: they cannot reach
+back to that candidate or start a new one, so segmentation waits for the next
+delta that is not inert. The run holds letters, digits, spaces, tabs and
+commas, plus round or square brackets around such text that cannot form a
+list marker (see :func:`sentencesplit._screen.extend_inert_run`).
+Abbreviations, decimal numbers, quotes and other punctuation still re-segment
+the tail on every delta. Deltas are kept as chunks and joined only
+when the tail is segmented.
 
 ``clean=True`` is unsupported: text cleaning (HTML/PDF repair) is a whole-document
 operation that does not compose with incremental streaming. Clean upstream, then
 stream the cleaned text.
 
-Emission is full-sentence granularity only. Sub-sentence (clause/phrase) flows
-should drive an external tokenizer; this class never emits a partial sentence
-except via :meth:`flush`.
+Emission is full-sentence granularity by default: with neither of the two
+options below set, a partial sentence is only emitted by :meth:`flush`.
+``clause_min_length`` opts into clause-level emission for long sentences: once
+the unterminated trailing sentence is at least that many characters, the tail
+up to its last clause mark (``,`` ``;`` ``:`` with the whitespace after it, or
+an em dash, outside quotes and brackets) is emitted as a
+:class:`StreamClause`, which records where its sentence began. The next item
+emitted continues the same sentence, so consumers can regroup the pieces. The
+rest of the sentence is then segmented without the emitted clause before it.
+``max_buffer_size`` bounds memory instead: once the unemitted tail exceeds it,
+the unterminated final sentence is emitted up to its strongest soft break near
+the end of the tail (a line break, then ``;``/``:``, a comma, whitespace), or
+whole when there is none, and the rest stays buffered. That piece is a plain
+sentence, not a :class:`StreamClause`, and :meth:`feed` returns it.
 
 Buffering modes
 ---------------
@@ -57,20 +82,56 @@ Buffering modes
     it ends in a sentence-terminal mark, without waiting for lookahead to confirm.
     Lower latency, at the risk of speaking an abbreviation tail or a pre-decimal
     number prematurely.
+``speculative``
+    Emit the trailing sentence as soon as it ends in terminal punctuation, like
+    ``aggressive``, but keep it in the tail until lookahead decides it as
+    ``conservative`` would. If a later delta moves the boundary ("Dr." +
+    `` Smith``), a :class:`StreamRetraction` for that sentence is emitted and its
+    text goes out again as part of the real sentence; otherwise the sentence
+    is confirmed silently. A consumer that can cancel queued work (TTS) gets
+    ``aggressive`` latency and, after applying retractions, ``conservative``
+    sentences. A confirmed sentence keeps the extent it was emitted with. The
+    whitespace after it, which ``conservative`` would have emitted with it,
+    is left out when the rest of the tail is segmented and leads the next
+    sentence instead.
 
 All modes emit confirmed (non-trailing) boundaries identically and always agree
 once :meth:`flush` is called, so the streaming-equals-non-streaming contract holds
-regardless of mode.
+regardless of mode (for ``speculative``, once retracted sentences are dropped).
+
+``max_hold_ms`` caps how long ``conservative`` / ``balanced`` may hold a
+terminated trailing sentence. Past the deadline it is emitted as is, trading
+the lookahead's precision for bounded latency when the source pauses; that
+stream may then differ from ``Segmenter.segment`` at that boundary.
 """
 
 from __future__ import annotations
 
+import copy
+import re
+import time
+from bisect import bisect_right
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
 from sentencesplit._normalize import strip_zero_width, terminal_punctuation
+from sentencesplit._screen import boundary_free_end, extend_inert_run, inert_tail
 from sentencesplit.exceptions import InvalidConfigurationError
-from sentencesplit.segmenter import Segmenter
-from sentencesplit.utils import BufferingMode, SplitMode, TextSpan
+from sentencesplit.segmenter import _PROBED, Segmenter
+from sentencesplit.utils import (
+    AnnotatedSpan,
+    BufferingMode,
+    HoldInfo,
+    SegmentLookahead,
+    SplitMode,
+    StreamClause,
+    StreamItem,
+    StreamRetraction,
+    StreamStats,
+    TextSpan,
+)
 
-BUFFERING_MODES = ("conservative", "balanced", "aggressive")
+BUFFERING_MODES = ("conservative", "balanced", "aggressive", "speculative")
 
 # Terminal marks that can cluster into a single multi-character terminator
 # ("...", "!!!", "??"). A boundary that segment_spans() places *between* two of
@@ -80,6 +141,45 @@ BUFFERING_MODES = ("conservative", "balanced", "aggressive")
 # (_MULTI_TERMINATOR_RESPLIT_RE, the "..." ellipsis rules) are ASCII-only.
 _CLUSTER_TERMINALS = frozenset(".!?")
 
+# Words an inert run must already span past the last boundary candidate before
+# further inert deltas are deferred. The processor decides a candidate from the
+# token after it (abbreviation followers, standalone "I", decimals), so one
+# word is enough; the extra two are margin.
+_SETTLED_WORDS = 3
+
+# Clause punctuation a long unterminated sentence may be emitted up to with
+# ``clause_min_length``: a comma, semicolon or colon with the whitespace after
+# it, or an em dash. The next word must have begun with two letters, so the
+# remainder does not open with a list marker ("b)") or a number.
+_CLAUSE_RE = re.compile(r"(?:[,;:]\s+|\u2014\s*)(?=[^\W\d_]{2})")
+# A clause ends only outside quotes and brackets: cutting inside them would
+# segment the closing mark without its opening one.
+_CLAUSE_OPENERS = "([{\u201c\u00ab\u300c\u300e\uff08"
+_CLAUSE_CLOSERS = ")]}\u201d\u00bb\u300d\u300f\uff09"
+# Characters before a delta searched for a clause mark it completes.
+_CLAUSE_CONTEXT = 16
+
+# Soft breaks an overflowing tail is cut after, strongest first: a line break,
+# a semicolon or colon, a comma (each with the whitespace after it), then any
+# whitespace. Only the last _OVERFLOW_WINDOW characters of the tail, and at
+# most half of max_buffer_size, are searched, so the kept remainder stays well
+# under the limit and the search cost is bounded.
+_OVERFLOW_BREAKS = (re.compile(r"\n\s*"), re.compile(r"[;:]\s+"), re.compile(r",\s+"), re.compile(r"\s+"))
+_OVERFLOW_WINDOW = 256
+
+# Bumped only when a field changes meaning. A field added later is simply
+# missing from older snapshots, and restore() gives it its default.
+_SNAPSHOT_VERSION = 1
+_SNAPSHOT_CONFIG = (
+    "language",
+    "char_span",
+    "split_mode",
+    "buffering_mode",
+    "max_buffer_size",
+    "max_hold_ms",
+    "clause_min_length",
+)
+
 
 class StreamSegmenter:
     """Stateful streaming wrapper over :class:`Segmenter`.
@@ -89,8 +189,57 @@ class StreamSegmenter:
     :meth:`_to_output`), a streaming-specific ``buffering_mode``, and an optional
     ``max_buffer_size`` guard against pathological unbounded tails. ``clean=True``
     is not supported (see the module docstring).
+
+    ``max_hold_ms`` bounds how long lookahead may hold a terminated trailing
+    sentence ("Dr.", "GPT 3."): once it has been held that long, the next
+    :meth:`feed` or :meth:`get_completed_sentences` emits it as is. ``clock``
+    (seconds, ``time.monotonic`` by default) is the time source for it.
+
+    ``clause_min_length`` (characters, None by default) emits long
+    unterminated sentences clause by clause (see the module docstring).
     """
 
+    __slots__ = (
+        "_segmenter",
+        "language",
+        "clean",
+        "char_span",
+        "split_mode",
+        "buffering_mode",
+        "max_buffer_size",
+        "_chunks",
+        "_length",
+        "_boundary_free_end",
+        "_inert_run",
+        "_punctuations",
+        "_base_offset",
+        "_last_should_wait",
+        "_completed",
+        "max_hold_ms",
+        "_clock",
+        "_held_since",
+        "_emitted",
+        "_forced",
+        "_speculative",
+        "_lead",
+        "clause_min_length",
+        "_sentence_start",
+        "_clause_end",
+        "_feeds",
+        "_detects",
+        "_segmented",
+        "_max_tail",
+        "_probes",
+        "_held_feed",
+        "_holds",
+        "_hold_feeds",
+        "_max_hold_feeds",
+        "_hold_seconds",
+        "_max_hold_seconds",
+        "_meta_starts",
+        "_metas",
+    )
+
     def __init__(
         self,
         language: str = "en",
@@ -99,6 +248,9 @@ class StreamSegmenter:
         split_mode: SplitMode = "balanced",
         buffering_mode: BufferingMode = "conservative",
         max_buffer_size: int | None = None,
+        max_hold_ms: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        clause_min_length: int | None = None,
     ) -> None:
         if clean:
             raise InvalidConfigurationError(
@@ -112,6 +264,10 @@ class StreamSegmenter:
             )
         if max_buffer_size is not None and max_buffer_size <= 0:
             raise InvalidConfigurationError("max_buffer_size must be a positive integer or None.")
+        if max_hold_ms is not None and max_hold_ms < 0:
+            raise InvalidConfigurationError("max_hold_ms must be a non-negative number or None.")
+        if clause_min_length is not None and clause_min_length <= 0:
+            raise InvalidConfigurationError("clause_min_length must be a positive integer or None.")
         # The wrapped Segmenter validates language/split_mode (clean is fixed to
         # False). It always works in spans internally; this class's own
         # ``char_span`` flag only governs the user-facing output shape (see
@@ -123,10 +279,22 @@ class StreamSegmenter:
         self.split_mode = split_mode
         self.buffering_mode = buffering_mode
         self.max_buffer_size = max_buffer_size
+        self.max_hold_ms = max_hold_ms
+        self._clock = clock
+        self.clause_min_length = clause_min_length
 
-        # The unemitted tail: text that still needs (re-)segmenting. Emitted bytes
+        # The unemitted tail: text that still needs (re-)segmenting, kept as the
+        # deltas fed since it was last joined (see ``_buffer``). Emitted bytes
         # are dropped from the front, so this only ever holds the volatile tail.
-        self._buffer: str = ""
+        self._chunks: list[str] = []
+        self._length: int = 0
+        # Length of the tail prefix known to be boundary-free. Only built-in
+        # languages have a known punctuation set to check against.
+        self._boundary_free_end: int = 0
+        # State of the trailing inert run of the tail (see ``extend_inert_run``):
+        # words begun, last character, open closer, last word.
+        self._inert_run: tuple[int, str, str, str] = (0, "", "", "")
+        self._punctuations = self._segmenter._screen_punctuations
         # Stream-absolute position of ``self._buffer[0]`` — the count of characters
         # already emitted and dropped. Added to each span's buffer-relative offset
         # to produce monotonic, byte-faithful stream offsets.
@@ -135,37 +303,108 @@ class StreamSegmenter:
         # is_complete() need not re-segment.
         self._last_should_wait: bool = False
         # Completed sentences (always TextSpans internally) awaiting collection.
-        self._completed: list[TextSpan] = []
+        self._completed: list[TextSpan | StreamRetraction | StreamClause] = []
+        # Clock reading and feed count when lookahead started holding the
+        # terminated trailing sentence; _held_since is None while none is held.
+        self._held_since: float | None = None
+        self._held_feed: int = 0
+        # Sentences emitted by detection, and by the max_hold_ms deadline.
+        self._emitted: int = 0
+        self._forced: int = 0
+        # The trailing sentence a ``speculative`` stream emitted ahead of
+        # lookahead, in stream offsets, or None. It is still the head of the
+        # tail (its start is ``_base_offset``) and the last sentence emitted.
+        self._speculative: TextSpan | None = None
+        # Whitespace at the head of the tail that lookahead found after a
+        # confirmed speculative sentence. A conservative stream would have
+        # emitted it with that sentence, so the tail is segmented without it
+        # and it leads the next sentence emitted.
+        self._lead: int = 0
+        # Where the sentence continued by the head of the tail began, and where
+        # the last clause emitted from it ended (stream offsets). The head of
+        # the tail continues that sentence only while the two ends meet, i.e.
+        # ``_clause_end == _base_offset``.
+        self._sentence_start: int | None = None
+        self._clause_end: int | None = None
+        # Stream offsets at which the deltas fed with ``meta`` began, and their
+        # metadata; None until a delta brings metadata. Entries for text
+        # already collected are pruned, so this covers about the tail.
+        self._meta_starts: list[int] | None = None
+        self._metas: list[Any] | None = None
+        # Cumulative counters reported by stats().
+        self._feeds: int = 0
+        self._detects: int = 0
+        self._segmented: int = 0
+        self._max_tail: int = 0
+        self._probes: int = 0
+        self._holds: int = 0
+        self._hold_feeds: int = 0
+        self._max_hold_feeds: int = 0
+        self._hold_seconds: float = 0.0
+        self._max_hold_seconds: float = 0.0
 
     # ------------------------------------------------------------------ #
     # Public API
     # ------------------------------------------------------------------ #
 
-    def feed(self, delta: str | None) -> list[str | TextSpan] | None:
+    def feed(self, delta: str | None, meta: Any = None) -> list[StreamItem] | None:
         """Append a text delta and detect any newly-stable sentences.
 
-        ``None`` and empty deltas are no-ops. Returns ``None`` normally; if
+        ``None`` and empty deltas are no-ops. With ``char_span=True``, *meta*
+        (a timestamp, a token index range, any object) is attached to the
+        delta: once any delta brings it, emitted sentences are
+        :class:`AnnotatedSpan` items carrying the metadata of the deltas holding
+        their first and last characters. Plain-string output ignores it. Returns ``None`` normally; if
         ``max_buffer_size`` is set and the unemitted tail exceeds it, the
         overflowing tail is force-emitted and returned (so the caller can react to
         the overflow rather than silently growing memory).
 
-        Overflow force-emission is a hard boundary: it may cut mid-sentence.
-        ``max_buffer_size`` trades boundary precision for bounded memory; leave it
-        ``None`` (the default) for fully boundary-faithful streaming.
+        Overflow force-emission may cut mid-sentence, though at the strongest
+        soft break near the end of the tail (a line break, then ``;``/``:``, a
+        comma, whitespace) rather than mid-word when there is one; the text
+        after the break stays buffered. ``max_buffer_size`` trades boundary
+        precision for bounded memory; leave it ``None`` (the default) for fully
+        boundary-faithful streaming.
         """
         if delta:
-            self._buffer += delta
-            self._detect()
+            self._feeds += 1
+            if self.char_span and (meta is not None or self._metas is not None):
+                self._record_meta(meta)
+            # A delta arriving after the deadline no longer resolves the held
+            # sentence: it has waited its maximum and goes out first.
+            self._release_expired_hold()
+            skip = self._append(delta)
+            if skip and self._speculative is None and not self._clause_due(delta):
+                # Segmenting would emit nothing new: the tail is one
+                # unterminated span that waits unless it is blank.
+                self._last_should_wait = self._last_should_wait or not delta.isspace()
+                self._end_hold(False)
+            else:
+                self._detect()
         if self.max_buffer_size is not None:
             return self._enforce_max_buffer_size()
         return None
 
-    def get_completed_sentences(self) -> list[str | TextSpan]:
+    def feed_many(self, deltas: Iterable[str | None]) -> list[StreamItem] | None:
+        """Append a burst of deltas and segment the tail once, not once per delta.
+
+        Equivalent to :meth:`feed` of the deltas joined (``None`` and empty
+        ones are skipped), so a replayed burst of 200 tokens costs one
+        segmentation pass instead of 200. Returns as :meth:`feed` does.
+        """
+        return self.feed("".join(delta for delta in deltas if delta))
+
+    def get_completed_sentences(self) -> list[StreamItem]:
         """Return and drain the sentences whose boundary is now stable.
 
         Ordered, never duplicated. Calling it again returns ``[]`` until more text
-        completes another sentence.
+        completes another sentence. With ``max_hold_ms``, a trailing sentence
+        held past the deadline is emitted first, so polling this during a pause
+        in the stream releases it. A ``speculative`` stream also returns
+        :class:`StreamRetraction` items, and ``clause_min_length`` adds
+        :class:`StreamClause` items, in order with the sentences.
         """
+        self._release_expired_hold()
         drained = self._completed
         self._completed = []
         return self._to_output(drained)
@@ -187,14 +426,14 @@ class StreamSegmenter:
         # before any poll, so it reflects the current tail.
         return not self._last_should_wait
 
-    def flush(self) -> list[str | TextSpan]:
+    def flush(self) -> list[StreamItem]:
         """Emit every remaining sentence — stable and unstable tail — and drain.
 
         After ``flush()`` the buffer is reset to empty, so the next ``feed()``
         starts a fresh logical stream. Use this at end-of-stream (LLM done, ASR
         final) as an explicit synchronization point.
         """
-        for span in self._tail_spans():
+        for span in self._settle_speculation():
             self._completed.append(self._stream_span(span))
         out = self._completed
         self._completed = []
@@ -204,7 +443,12 @@ class StreamSegmenter:
         self._buffer = ""
         self._base_offset = 0
         self._last_should_wait = False
-        return self._to_output(out)
+        self._end_hold(True)
+        self._speculative = None
+        self._sentence_start = self._clause_end = None
+        output = self._to_output(out)
+        self._meta_starts = self._metas = None
+        return output
 
     def reset(self) -> None:
         """Clear all buffered state, making the instance reusable from scratch."""
@@ -212,54 +456,287 @@ class StreamSegmenter:
         self._base_offset = 0
         self._last_should_wait = False
         self._completed = []
+        self._end_hold(False)
+        self._speculative = None
+        self._sentence_start = self._clause_end = None
+        self._meta_starts = self._metas = None
+
+    def hold_info(self) -> HoldInfo:
+        """Count sentences emitted once stable versus at the ``max_hold_ms`` deadline.
+
+        ``emitted`` counts sentences emitted by detection as their boundary
+        became stable (or, in ``aggressive`` mode, terminated); ``forced``
+        counts held sentences released by the deadline. A ``speculative``
+        sentence is counted once lookahead or the deadline confirms it, and not
+        at all if it is retracted. :meth:`flush` and ``max_buffer_size``
+        overflow are counted by neither.
+        """
+        return HoldInfo(self._emitted, self._forced)
+
+    def stats(self) -> StreamStats:
+        """Report cumulative counters explaining where this stream spends its time.
+
+        ``detects`` counts segmentation passes over the tail and
+        ``segmented_chars`` the characters they covered; the latter growing
+        much faster than the text fed is the sign of a long tail re-segmented
+        on every delta. ``max_tail`` and ``mean_tail`` describe the tails
+        segmented, and ``probes`` counts lookahead probe re-segmentations.
+        ``holds`` counts terminated sentences lookahead held before they were
+        emitted, alone or inside the longer sentence they turned out to start
+        ("Dr." + " Smith."); each hold is measured in :meth:`feed` calls and
+        in ``clock`` seconds, summed and as a maximum. The counters cost a few
+        additions per pass, survive :meth:`flush` and :meth:`reset`, and are
+        not carried by :meth:`snapshot`. ``stats()._asdict()`` is a plain dict.
+        """
+        return StreamStats(
+            feeds=self._feeds,
+            detects=self._detects,
+            segmented_chars=self._segmented,
+            max_tail=self._max_tail,
+            mean_tail=self._segmented / self._detects if self._detects else 0.0,
+            probes=self._probes,
+            holds=self._holds,
+            hold_feeds=self._hold_feeds,
+            max_hold_feeds=self._max_hold_feeds,
+            hold_seconds=self._hold_seconds,
+            max_hold_seconds=self._max_hold_seconds,
+        )
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the stream's configuration and in-flight state as a JSON-safe dict.
+
+        The state holds the unemitted tail, its stream offset, the last
+        lookahead verdict and any completed sentences not yet collected, so
+        its size is bounded by the held tail, not by the stream. Pass it to
+        :meth:`restore` (on this or another process) to continue the stream
+        with output identical to an uninterrupted one. Custom languages must
+        be registered under the same code where it is restored. A held
+        sentence keeps the time it has already been held (``held_ms``), since
+        clock readings do not carry across processes. Uncollected retractions
+        are stored as ``[sent, start, end, "retraction"]`` and clauses as
+        ``[sent, start, end, "clause", sentence_start]``. Delta metadata is
+        not kept, since it need not be JSON-safe.
+        """
+        return {
+            "version": _SNAPSHOT_VERSION,
+            **{name: getattr(self, name) for name in _SNAPSHOT_CONFIG},
+            "buffer": self._buffer,
+            "lead": self._lead,
+            "base_offset": self._base_offset,
+            "should_wait": self._last_should_wait,
+            "held_ms": None if self._held_since is None else (self._clock() - self._held_since) * 1000,
+            "speculative": None if self._speculative is None else _encode(self._speculative),
+            "sentence_start": self._sentence_start if self._clause_end == self._base_offset else None,
+            "completed": [_encode(item) for item in self._completed],
+        }
+
+    @classmethod
+    def restore(cls, state: Mapping[str, Any], clock: Callable[[], float] = time.monotonic) -> StreamSegmenter:
+        """Build a stream from a :meth:`snapshot`, ready to take the next delta.
+
+        *clock* is the restored stream's time source for ``max_hold_ms``.
+
+        A missing field takes its default: the constructor's for the
+        configuration, and an empty stream's for the in-flight state.
+
+        Raises :class:`InvalidConfigurationError` for a state from another
+        snapshot version or with mistyped fields, and the usual constructor
+        errors for its configuration.
+        """
+        if not isinstance(state, Mapping) or state.get("version") != _SNAPSHOT_VERSION:
+            raise InvalidConfigurationError(f"StreamSegmenter.restore() expects a version {_SNAPSHOT_VERSION} snapshot.")
+        try:
+            config = {name: state[name] for name in _SNAPSHOT_CONFIG if name in state}
+            buffer, base_offset = state.get("buffer", ""), state.get("base_offset", 0)
+            lead, should_wait = state.get("lead", 0), state.get("should_wait", False)
+            if not isinstance(buffer, str) or not isinstance(base_offset, int) or not isinstance(should_wait, bool):
+                raise TypeError("buffer, base_offset or should_wait has the wrong type")
+            if not isinstance(lead, int) or not 0 <= lead <= len(buffer):
+                raise ValueError("lead is not an offset into buffer")
+            held_ms = state.get("held_ms")
+            if held_ms is not None and not isinstance(held_ms, (int, float)):
+                raise TypeError("held_ms has the wrong type")
+            sentence_start = state.get("sentence_start")
+            if sentence_start is not None and not isinstance(sentence_start, int):
+                raise TypeError("sentence_start has the wrong type")
+            speculative = state.get("speculative")
+            speculative = None if speculative is None else _decode(speculative)
+            completed = [_decode(item) for item in state.get("completed", [])]
+            if not isinstance(speculative, (TextSpan, type(None))):
+                raise TypeError("speculative is not a sentence")
+        except (KeyError, TypeError, ValueError) as error:
+            raise InvalidConfigurationError(f"Malformed StreamSegmenter snapshot: {error}") from error
+        stream = cls(**config, clock=clock)
+        # The setter re-derives the boundary-free and inert checkpoints, which
+        # depend on the tail alone.
+        stream._buffer = buffer
+        stream._lead = lead
+        stream._base_offset = base_offset
+        stream._last_should_wait = should_wait
+        stream._completed = completed
+        stream._speculative = speculative
+        if sentence_start is not None:
+            stream._sentence_start, stream._clause_end = sentence_start, base_offset
+        if held_ms is not None:
+            stream._held_since = clock() - held_ms / 1000
+        return stream
 
     # ------------------------------------------------------------------ #
     # Internals
     # ------------------------------------------------------------------ #
 
+    def _feed_and_drain(self, delta: str | None, meta: Any = None) -> list[StreamItem]:
+        """Feed *delta* and return everything it emitted, overflow first."""
+        overflow = self.feed(delta, meta)
+        completed = self.get_completed_sentences()
+        return completed if overflow is None else overflow + completed
+
+    def _spawn(self) -> StreamSegmenter:
+        """Return an empty stream with this configuration, sharing the wrapped Segmenter."""
+        stream = copy.copy(self)
+        stream.reset()
+        return stream
+
+    @property
+    def _buffer(self) -> str:
+        """The unemitted tail as one string, joining pending chunks on demand."""
+        if len(self._chunks) > 1:
+            self._chunks = ["".join(self._chunks)]
+        return self._chunks[0] if self._chunks else ""
+
+    @_buffer.setter
+    def _buffer(self, text: str) -> None:
+        self._chunks = [text] if text else []
+        self._length = len(text)
+        self._lead = 0
+        if self._punctuations is None:
+            self._boundary_free_end = 0
+            return
+        self._boundary_free_end = boundary_free_end(text, 0, self._punctuations)
+        self._inert_run = inert_tail(text, self._punctuations)[1]
+
+    def _append(self, delta: str) -> bool:
+        """Add *delta* to the tail and return whether segmenting it can be skipped.
+
+        Skipping is safe when the whole tail is boundary-free, or when *delta*
+        is inert and the tail already ends in a settled inert run: the last
+        boundary candidate was decided on the text before *delta*, and
+        nothing in *delta* can reach back to it or start a new one. The work
+        is deferred to the next delta that is not inert.
+        """
+        previous_length = self._length
+        self._chunks.append(delta)
+        self._length += len(delta)
+        if self._punctuations is None:
+            return False
+        if self._boundary_free_end == previous_length:
+            # Rescan from the previous last character so a hyphen-apostrophe
+            # pair split across two deltas is caught.
+            context = self._chunks[-2][-1:] if len(self._chunks) > 1 else ""
+            free_end = boundary_free_end(context + delta, len(context), self._punctuations)
+            self._boundary_free_end = previous_length + free_end - len(context)
+        settled = self._inert_run[0] >= _SETTLED_WORDS
+        start, self._inert_run = extend_inert_run(delta, self._punctuations, 0, self._inert_run)
+        return self._boundary_free_end == self._length or (settled and start == 0)
+
     def _tail_spans(self) -> list[TextSpan]:
         """Byte-exact spans tiling the current unemitted tail (buffer-relative)."""
-        if not self._buffer:
+        buffer = self._buffer
+        if not buffer:
             return []
-        return self._segmenter.segment_spans(self._buffer)
+        lead = self._lead if self._lead < len(buffer) else 0
+        return self._with_lead(buffer, lead, self._segmenter.segment_spans(buffer[lead:]))
+
+    @staticmethod
+    def _with_lead(buffer: str, lead: int, spans: list[TextSpan]) -> list[TextSpan]:
+        """Rebase *spans* of ``buffer[lead:]`` onto *buffer*, the first one taking the lead."""
+        if not lead or not spans:
+            return spans
+        first = spans[0]
+        rebased = [TextSpan(buffer[: lead + first.end], 0, lead + first.end)]
+        rebased += [TextSpan(span.sent, lead + span.start, lead + span.end) for span in spans[1:]]
+        return rebased
 
     def _stream_span(self, span: TextSpan) -> TextSpan:
         """Rebase a buffer-relative span to monotonic, byte-faithful stream offsets."""
         return TextSpan(span.sent, self._base_offset + span.start, self._base_offset + span.end)
 
-    def _to_output(self, items: list[TextSpan]) -> list:
+    def _to_output(self, items: list[TextSpan | StreamRetraction | StreamClause]) -> list:
         """Project internal TextSpans to the caller-facing form.
 
         ``char_span=True`` returns the byte-exact :class:`TextSpan` items unchanged.
         Plain mode normalizes each span's text exactly as :meth:`Segmenter.segment`
         does — stripping boundary zero-width/format characters and dropping any
         segment that is whitespace-only — so streaming plain output matches
-        non-streaming ``segment()`` even on dirty input.
+        non-streaming ``segment()`` even on dirty input. Retractions and clauses
+        are passed through in both modes.
         """
         if self.char_span:
-            return items
-        out: list[str] = []
+            return items if self._metas is None else self._annotate(items)
+        out: list[str | StreamRetraction | StreamClause] = []
         punctuations = self._segmenter.language_module.Punctuations
         for span in items:
+            if isinstance(span, (StreamRetraction, StreamClause)):
+                out.append(span)
+                continue
             text = strip_zero_width(span.sent, punctuations)
             if text.strip():
                 out.append(text)
         return out
 
+    def _record_meta(self, meta: Any) -> None:
+        """Index *meta* at the stream offset where the delta being fed begins."""
+        if self._meta_starts is None or self._metas is None:
+            self._meta_starts, self._metas = [], []
+        # Invariant under hold releases, which move the tail into the base.
+        self._meta_starts.append(self._base_offset + self._length)
+        self._metas.append(meta)
+
+    def _annotate(self, items: list[TextSpan | StreamRetraction | StreamClause]) -> list:
+        """Attach delta metadata to the sentences in *items*, then prune collected entries.
+
+        Two binary searches per sentence find the deltas holding its first
+        and last characters. Every item before the tail is collected by the
+        time this runs, so only the entry covering the head of the tail and
+        those after it are kept.
+        """
+        starts, metas = self._meta_starts, self._metas
+        assert starts is not None and metas is not None
+        out: list[TextSpan | StreamRetraction | StreamClause] = []
+        for item in items:
+            if type(item) is TextSpan:
+                first = bisect_right(starts, item.start) - 1
+                last = bisect_right(starts, max(item.end - 1, item.start)) - 1
+                item = AnnotatedSpan(
+                    item.sent,
+                    item.start,
+                    item.end,
+                    metas[first] if first >= 0 else None,
+                    metas[last] if last >= 0 else None,
+                )
+            out.append(item)
+        keep = bisect_right(starts, self._base_offset) - 1
+        if keep > 0:
+            del starts[:keep], metas[:keep]
+        return out
+
+    def _is_terminated(self, span: TextSpan) -> bool:
+        """Whether *span* ends in sentence-terminal punctuation."""
+        return terminal_punctuation(span.sent.rstrip(), self._segmenter.language_module.Punctuations) is not None
+
     def _emittable(self, span: TextSpan, is_final: bool, should_wait: bool) -> bool:
         """Whether *span* may be emitted now (vs. held in the pending tail).
 
         A non-final span's boundary lies in the interior of the buffer and is
         stable *unless* it abuts a still-growing multi-character terminator —
-        that case is screened out by the cluster check in :meth:`_detect` before
+        that case is screened out by :meth:`_cluster_blocked` before
         this is reached, so here a non-final span is always emittable. The final
         span is the volatile tail; emitting it is gated by buffering mode and by
         whether it ends in terminal punctuation.
         """
         if not is_final:
             return True
-        punctuations = self._segmenter.language_module.Punctuations
-        if terminal_punctuation(span.sent.rstrip(), punctuations) is None:
+        if not self._is_terminated(span):
             return False
         if self.buffering_mode == "aggressive":
             # Trust terminal punctuation immediately, before lookahead confirms.
@@ -280,55 +757,316 @@ class StreamSegmenter:
         # One segmentation pass yields both the tail spans and the trailing-
         # boundary lookahead verdict; computing them separately would segment the
         # buffer twice on every delta.
-        if self._buffer:
-            lookahead = self._segmenter.segment_spans_with_lookahead(self._buffer)
+        buffer = self._buffer
+        if buffer:
+            lookahead = self._segment(buffer)
             spans, self._last_should_wait = lookahead.segments, lookahead.should_wait_for_more
         else:
             spans, self._last_should_wait = [], False
         if not spans:
+            self._end_hold(False)
             return
+        if self._speculative is not None:
+            resolved = self._resolve_speculation(buffer, spans)
+            if not resolved:
+                return
+            spans, buffer = resolved, self._buffer
         last_index = len(spans) - 1
         cut = 0
+        held = False
         for index, span in enumerate(spans):
             is_final = index == last_index
-            # A non-final span whose boundary falls between terminal punctuation
-            # characters may sit inside an as-yet-incomplete cluster (e.g.
-            # "Wait." inside a "Wait..." still arriving). segment_spans() will
-            # re-merge it once the rest of the cluster lands, so the boundary is
-            # not stable yet — hold it rather than emit a fragment. A terminal
-            # punctuation mark starting the next span ("One. !Two.") is not part
-            # of the previous boundary and must not prevent buffer compaction.
-            if (
-                not is_final
-                and 0 < span.end < len(self._buffer)
-                and self._buffer[span.end - 1] in _CLUSTER_TERMINALS
-                and self._buffer[span.end] in _CLUSTER_TERMINALS
-            ):
+            if not is_final and self._cluster_blocked(buffer, span):
                 break
             if not self._emittable(span, is_final, self._last_should_wait):
-                break  # this span (the volatile final) and nothing after it yet
+                # this span (the volatile final) and nothing after it yet
+                held = is_final and self._hold(span)
+                break
             self._completed.append(self._stream_span(span))
+            self._emitted += 1
             cut = span.end
         if cut:
-            self._buffer = self._buffer[cut:]
+            self._buffer = buffer[cut:]
             self._base_offset += cut
+        self._track_hold(held, cut > 0)
+        if not held and cut == spans[-1].start:
+            # The tail is now the unterminated final span alone.
+            self._emit_clause()
+
+    def _segment(self, buffer: str) -> SegmentLookahead[TextSpan]:
+        """Segment *buffer* with its lookahead verdict, counting the work for :meth:`stats`."""
+        segmenter = self._segmenter
+        # The tally is this thread's, so a Segmenter shared by a pool and
+        # probing for other sessions on other threads does not skew the count.
+        tally = segmenter._lookahead_tally()
+        probed = tally[_PROBED]
+        lead = self._lead if self._lead < len(buffer) else 0
+        lookahead = segmenter.segment_spans_with_lookahead(buffer[lead:])
+        self._probes += tally[_PROBED] - probed
+        self._detects += 1
+        self._segmented += len(buffer) - lead
+        if len(buffer) > self._max_tail:
+            self._max_tail = len(buffer)
+        if lead:
+            lookahead = SegmentLookahead(self._with_lead(buffer, lead, lookahead.segments), lookahead.should_wait_for_more)
+        return lookahead
+
+    def _track_hold(self, held: bool, advanced: bool) -> None:
+        """Start, keep or stop the hold timer after a detection pass."""
+        # The hold runs from when the current held sentence was first held:
+        # emitting anything in front of it emits it too, or means a new
+        # sentence is held.
+        if not held or advanced:
+            self._end_hold(advanced)
+        if held and self._held_since is None:
+            self._held_since = self._clock()
+            self._held_feed = self._feeds
+
+    def _end_hold(self, emitted: bool) -> None:
+        """Stop the hold timer, recording the hold in :meth:`stats` if the sentence was emitted."""
+        if self._held_since is None:
+            return
+        if emitted:
+            seconds = self._clock() - self._held_since
+            feeds = self._feeds - self._held_feed
+            self._holds += 1
+            self._hold_seconds += seconds
+            self._hold_feeds += feeds
+            self._max_hold_seconds = max(self._max_hold_seconds, seconds)
+            self._max_hold_feeds = max(self._max_hold_feeds, feeds)
+        self._held_since = None
+
+    def _emit_clause(self) -> None:
+        """Emit the tail up to its last clause mark once it reaches ``clause_min_length``.
+
+        Only called when the tail is a single unterminated span, so the clause
+        lies inside a sentence that is still arriving; it is dropped from the
+        tail like an emitted sentence.
+        """
+        buffer = self._buffer
+        if self.clause_min_length is None or len(buffer) - self._lead < self.clause_min_length:
+            return
+        end = position = depth = quotes = 0
+        for match in _CLAUSE_RE.finditer(buffer):
+            text = buffer[position : match.start()]
+            depth += sum(text.count(char) for char in _CLAUSE_OPENERS) - sum(text.count(char) for char in _CLAUSE_CLOSERS)
+            quotes += text.count('"')
+            position = match.start()
+            if depth <= 0 and quotes % 2 == 0:
+                end = match.end()
+        if not end:
+            return
+        start = self._base_offset
+        # A clause emitted earlier from this sentence ends where the tail starts.
+        sentence_start = self._sentence_start if self._clause_end == start else start
+        assert sentence_start is not None
+        self._completed.append(StreamClause(buffer[:end], start, start + end, sentence_start))
+        self._buffer = buffer[end:]
+        self._base_offset += end
+        self._sentence_start, self._clause_end = sentence_start, self._base_offset
+
+    def _clause_due(self, delta: str) -> bool:
+        """Whether *delta*, just appended, may let :meth:`_emit_clause` emit a clause.
 
-    def _enforce_max_buffer_size(self) -> list[str | TextSpan] | None:
+        Keeps clause emission working while inert deltas are otherwise
+        skipped: the tail has just reached ``clause_min_length``, or *delta*
+        completes a clause mark with the few characters before it.
+        """
+        length = self._length - self._lead
+        if self.clause_min_length is None or length < self.clause_min_length:
+            return False
+        if length - len(delta) < self.clause_min_length:
+            return True
+        context = self._chunks[-2][-_CLAUSE_CONTEXT:] if len(self._chunks) > 1 else ""
+        return _CLAUSE_RE.search(context + delta) is not None
+
+    def _cluster_blocked(self, buffer: str, span: TextSpan) -> bool:
+        """Whether the boundary after non-final *span* may sit inside a growing cluster.
+
+        A boundary falling between terminal punctuation characters may sit
+        inside an as-yet-incomplete cluster (e.g. "Wait." inside a "Wait..."
+        still arriving). segment_spans() will re-merge it once the rest of the
+        cluster lands, so the boundary is not stable yet — hold it rather than
+        emit a fragment. A terminal punctuation mark starting the next span
+        ("One. !Two.") is not part of the previous boundary and must not
+        prevent buffer compaction.
+        """
+        end = span.end
+        return 0 < end < len(buffer) and buffer[end - 1] in _CLUSTER_TERMINALS and buffer[end] in _CLUSTER_TERMINALS
+
+    def _hold(self, span: TextSpan) -> bool:
+        """Whether the final *span*, not yet emittable, is a terminated sentence held by lookahead.
+
+        A ``speculative`` stream emits such a sentence now and keeps it in the
+        tail until lookahead confirms or moves its boundary.
+        """
+        if not self._is_terminated(span):
+            return False
+        if self.buffering_mode == "speculative":
+            self._speculative = self._stream_span(span)
+            self._completed.append(self._speculative)
+        return True
+
+    def _resolve_speculation(self, buffer: str, spans: list[TextSpan]) -> list[TextSpan] | None:
+        """Confirm or retract the pending speculative sentence against fresh *spans*.
+
+        Returns the spans :meth:`_detect` should go on to emit from: all of
+        *spans* after a retraction, and after a confirmation the rest of them
+        on the shortened tail, so the sentences after the confirmed one are
+        decided by the same segmentation as in ``conservative`` mode. Returns
+        None while lookahead still holds the sentence.
+        """
+        assert self._speculative is not None
+        first = spans[0]
+        if first.sent.rstrip() != self._speculative.sent.rstrip():
+            self._retract_speculation()
+            return spans
+        if len(spans) > 1:
+            pending = self._cluster_blocked(buffer, first)
+        else:
+            pending = not self._emittable(first, True, self._last_should_wait)
+        if pending:
+            return None
+        self._emitted += 1
+        self._end_hold(True)
+        return self._confirm_speculation(spans)
+
+    def _confirm_speculation(self, spans: list[TextSpan]) -> list[TextSpan]:
+        """Drop the already-emitted speculative sentence from the front of the tail.
+
+        The sentence is the first of *spans*, which tile the tail; the rest are
+        returned rebased onto the shortened tail. The whitespace between the
+        sentence's emitted extent and the end of its span stays at the head of
+        the tail as its lead, and the next span emitted takes it.
+        """
+        assert self._speculative is not None
+        length = self._speculative.end - self._base_offset
+        end = spans[0].end
+        buffer = self._buffer[length:]
+        self._buffer = buffer
+        self._base_offset += length
+        self._lead = max(end - length, 0)
+        self._speculative = None
+        rest = [TextSpan(span.sent, span.start - end, span.end - end) for span in spans[1:]]
+        if not rest:
+            return [TextSpan(buffer, 0, len(buffer))] if buffer else []
+        return self._with_lead(buffer, self._lead, rest)
+
+    def _retract_speculation(self) -> None:
+        """Withdraw the speculative sentence; its text stays at the head of the tail."""
+        assert self._speculative is not None
+        speculative = self._speculative
+        self._completed.append(StreamRetraction(speculative.sent, speculative.start, speculative.end))
+        self._speculative = None
+
+    def _settle_speculation(self) -> list[TextSpan]:
+        """Resolve a pending speculative sentence and return the spans of the tail to emit.
+
+        Used by :meth:`flush` and ``max_buffer_size`` overflow: the sentence
+        stands if it is still the tail's first span, and is retracted otherwise.
+        """
+        spans = self._tail_spans()
+        if self._speculative is None:
+            return spans
+        if spans[0].sent.rstrip() == self._speculative.sent.rstrip():
+            return self._confirm_speculation(spans)
+        self._retract_speculation()
+        return spans
+
+    def _hold_remaining(self) -> float | None:
+        """Seconds until the held trailing sentence is released, or None if none is held."""
+        if self._held_since is None or self.max_hold_ms is None:
+            return None
+        return self._held_since + self.max_hold_ms / 1000 - self._clock()
+
+    def _release_expired_hold(self) -> None:
+        """Emit the held trailing sentence once it has waited ``max_hold_ms``."""
+        remaining = self._hold_remaining()
+        if remaining is None or remaining > 0:
+            return
+        self._forced += 1
+        self._last_should_wait = False
+        if self._speculative is not None:
+            # Already emitted; the deadline only makes it final. The tail is
+            # that one span.
+            self._confirm_speculation([TextSpan(self._buffer, 0, self._length)])
+            self._end_hold(True)
+            return
+        # Detection held exactly the final span, so the tail is that one span.
+        self._completed.append(self._stream_span(TextSpan(self._buffer, 0, self._length)))
+        self._base_offset += self._length
+        self._buffer = ""
+        self._end_hold(True)
+
+    def _enforce_max_buffer_size(self) -> list[StreamItem] | None:
         """Force-flush the unemitted tail if it exceeds ``max_buffer_size``.
 
         Pathological inputs (a megabyte with no terminal punctuation) would
-        otherwise grow the buffer without bound. When the tail crosses the limit we
-        emit all of it and drop it, *preserving* ``self._base_offset`` (unlike
-        :meth:`flush`) so subsequent spans stay monotonic and byte-faithful.
+        otherwise grow the buffer without bound. When the tail crosses the limit
+        we emit every complete sentence in it and the unterminated final one up
+        to its best soft break (see :meth:`_soft_cut`), keeping the rest. With
+        no soft break near the end of the tail, all of it is emitted.
+        ``self._base_offset`` is *preserved* (unlike :meth:`flush`) so
+        subsequent spans stay monotonic and byte-faithful.
         """
         assert self.max_buffer_size is not None
-        if len(self._buffer) <= self.max_buffer_size:
+        if self._length <= self.max_buffer_size:
             return None
-        for span in self._tail_spans():
+        spans = self._settle_speculation()
+        buffer = self._buffer
+        cut = self._soft_cut(buffer, spans[-1].start) if spans else len(buffer)
+        for span in spans[:-1]:
             self._completed.append(self._stream_span(span))
+        if spans:
+            final = spans[-1]
+            self._completed.append(self._stream_span(TextSpan(buffer[final.start : cut], final.start, cut)))
         out = self._completed
         self._completed = []
-        self._base_offset += len(self._buffer)
-        self._buffer = ""
-        self._last_should_wait = False
+        self._base_offset += cut
+        self._buffer = buffer[cut:]
+        # A held sentence went out with the cut, whole or in part, so its hold
+        # ends here. Text kept past a soft break is judged afresh: its
+        # lookahead verdict, and a new hold if it is held, start now.
+        self._end_hold(True)
+        if cut == len(buffer):
+            self._last_should_wait = False
+        else:
+            self._detect()
         return self._to_output(out)
+
+    def _soft_cut(self, buffer: str, start: int) -> int:
+        """Return where to cut an overflowing *buffer* whose final span begins at *start*.
+
+        Takes the last match of the strongest :data:`_OVERFLOW_BREAKS` pattern
+        found in the scan window at the end of the final span, or the whole
+        buffer when there is none.
+        """
+        assert self.max_buffer_size is not None
+        low = max(start, len(buffer) - min(_OVERFLOW_WINDOW, self.max_buffer_size // 2))
+        for pattern in _OVERFLOW_BREAKS:
+            end = 0
+            for match in pattern.finditer(buffer, low):
+                if match.start() > start:
+                    end = match.end()
+            if end:
+                return end
+        return len(buffer)
+
+
+def _encode(item: TextSpan | StreamRetraction | StreamClause) -> list[Any]:
+    """Serialize a completed item for :meth:`StreamSegmenter.snapshot`."""
+    if isinstance(item, StreamRetraction):
+        return [item.sent, item.start, item.end, "retraction"]
+    if isinstance(item, StreamClause):
+        return [item.sent, item.start, item.end, "clause", item.sentence_start]
+    return [item.sent, item.start, item.end]
+
+
+def _decode(item: list[Any]) -> TextSpan | StreamRetraction | StreamClause:
+    """Inverse of :func:`_encode`; raises TypeError or ValueError on a malformed item."""
+    if len(item) == 4 and item[3] == "retraction":
+        return StreamRetraction(str(item[0]), int(item[1]), int(item[2]))
+    if len(item) == 5 and item[3] == "clause":
+        return StreamClause(str(item[0]), int(item[1]), int(item[2]), int(item[4]))
+    sent, start, end = item
+    return TextSpan(str(sent), int(start), int(end))
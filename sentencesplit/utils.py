@@ -5,14 +5,16 @@ from __future__ import annotations
 import re
 import unicodedata
 from dataclasses import dataclass
-from typing import Generic, Literal, Optional, TypeVar, get_args
+from typing import Any, Generic, Literal, NamedTuple, Optional, TypeVar, Union, get_args
 
 # Mode parameter type aliases. The runtime ``*_MODES`` tuples below remain the
 # source of truth for validation; these Literal aliases let type checkers catch
 # mode typos at call sites without touching any runtime behaviour.
 SplitMode = Literal["conservative", "balanced", "aggressive"]
 DocType = Optional[Literal["pdf"]]
-BufferingMode = Literal["conservative", "balanced", "aggressive"]
+BufferingMode = Literal["conservative", "balanced", "aggressive", "speculative"]
+CacheKey = Literal["text", "hash"]
+CACHE_KEYS = get_args(CacheKey)
 
 # Zero-width / format characters that ``str.isspace()`` / ``str.strip()`` do not
 # flag or remove (ZWSP, ZWNJ, ZWJ, BOM). A lone one at a sentence boundary (e.g. a
@@ -106,6 +108,162 @@ class TextSpan:
     end: int
 
 
+@dataclass
+class AnnotatedSpan(TextSpan):
+    """A :class:`TextSpan` emitted by a stream fed with delta metadata.
+
+    ``first_meta`` and ``last_meta`` are the ``meta`` passed with the deltas
+    holding the span's first and last characters (None for a delta fed
+    without it), e.g. the first and last timestamp or token index.
+    """
+
+    first_meta: Any = None
+    last_meta: Any = None
+
+
+@dataclass(frozen=True)
+class StreamRetraction:
+    """Withdraws the sentence a ``speculative`` stream emitted at ``start``-``end``.
+
+    Always refers to the most recently emitted sentence. Its text is emitted
+    again as part of a later sentence once the real boundary is known.
+    """
+
+    sent: str
+    start: int
+    end: int
+
+
+@dataclass(frozen=True)
+class StreamClause:
+    """A leading clause of a sentence still arriving, emitted with ``clause_min_length``.
+
+    Its sentence began at stream offset ``sentence_start`` and continues in
+    the next item emitted: a further clause, or the sentence's remainder.
+    """
+
+    sent: str
+    start: int
+    end: int
+    sentence_start: int
+
+
+# Everything StreamSegmenter can emit: a sentence (plain or TextSpan) or a
+# stream event.
+StreamItem = Union[str, TextSpan, StreamRetraction, StreamClause]
+
+
+class TextSpanView:
+    """Lightweight stand-in for :class:`TextSpan`.
+
+    Holds a reference to the source text plus ``start``/``end`` in three slots
+    and slices ``sent`` from the source on each access instead of storing a
+    copy, so ``sent`` is read-only. Compares equal to a :class:`TextSpan` (or
+    another view) with the same ``sent``, ``start`` and ``end``; like
+    :class:`TextSpan` it is unhashable.
+    """
+
+    __slots__ = ("_source", "start", "end")
+
+    _source: str
+    start: int
+    end: int
+
+    def __init__(self, source: str, start: int, end: int) -> None:
+        self._source = source
+        self.start = start
+        self.end = end
+
+    @property
+    def sent(self) -> str:
+        return self._source[self.start : self.end]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (TextSpan, TextSpanView)):
+            return self.start == other.start and self.end == other.end and self.sent == other.sent
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(sent={self.sent!r}, start={self.start!r}, end={self.end!r})"
+
+    def to_text_span(self) -> TextSpan:
+        """Return an equivalent, independent :class:`TextSpan`."""
+        return TextSpan(self.sent, self.start, self.end)
+
+
+class CacheInfo(NamedTuple):
+    """Result-cache statistics reported by ``Segmenter.cache_info()``."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    max_bytes: int | None
+    currbytes: int
+
+
+class LookaheadInfo(NamedTuple):
+    """Lookahead statistics reported by ``Segmenter.lookahead_info()``.
+
+    ``static`` counts period-final segments answered from the terminal token
+    alone, ``cached`` those answered from the shared probe-verdict cache, and
+    ``probed`` those that ran probe re-segmentation.
+    """
+
+    static: int
+    cached: int
+    probed: int
+
+
+class HoldInfo(NamedTuple):
+    """Emission statistics reported by ``StreamSegmenter.hold_info()``.
+
+    ``emitted`` counts sentences emitted once their boundary was stable and
+    ``forced`` those released by the ``max_hold_ms`` deadline.
+    """
+
+    emitted: int
+    forced: int
+
+
+class StreamStats(NamedTuple):
+    """Cumulative counters reported by ``StreamSegmenter.stats()``.
+
+    ``feeds`` counts non-empty deltas fed; ``detects``, ``segmented_chars``,
+    ``max_tail`` and ``mean_tail`` describe the segmentation passes over the
+    unemitted tail, and ``probes`` the lookahead probe re-segmentations among
+    them. ``holds`` counts sentences held by lookahead before emission, with
+    their hold in feeds and in seconds, in total and at most.
+    """
+
+    feeds: int
+    detects: int
+    segmented_chars: int
+    max_tail: int
+    mean_tail: float
+    probes: int
+    holds: int
+    hold_feeds: int
+    max_hold_feeds: int
+    hold_seconds: float
+    max_hold_seconds: float
+
+
+class PoolInfo(NamedTuple):
+    """Session statistics reported by ``StreamSegmenterPool.info()``.
+
+    ``sessions`` is the number of live sessions, ``evicted`` the number evicted
+    by ``ttl`` so far, and ``approx_bytes`` the approximate memory the live
+    sessions hold, excluding the shared ``Segmenter``.
+    """
+
+    sessions: int
+    evicted: int
+    approx_bytes: int
+
+
 _SegmentT = TypeVar("_SegmentT", str, TextSpan)
 
 
@@ -0,0 +1,132 @@
+"""Tests for ``asegment_stream``, the asyncio adapter over ``StreamSegmenter``."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from sentencesplit import InvalidConfigurationError, StreamSegmenter, asegment_stream
+
+_TEXT = "I spoke with Dr. Smith yesterday. He said the GPT 3.5 results were fine! Goodbye, and see p. 4"
+
+
+def _deltas(text, size=3):
+    return [text[index : index + size] for index in range(0, len(text), size)]
+
+
+async def _source(deltas, read=None):
+    for delta in deltas:
+        if read is not None:
+            read.append(delta)
+        yield delta
+        await asyncio.sleep(0)
+
+
+async def _collect(iterator):
+    return [sentence async for sentence in iterator]
+
+
+def _streamed(deltas, **kwargs):
+    stream = StreamSegmenter(language="en", **kwargs)
+    out = []
+    for delta in deltas:
+        stream.feed(delta)
+        out += stream.get_completed_sentences()
+    return out + stream.flush()
+
+
+@pytest.mark.parametrize("offload_threshold", [None, 0, 40])
+@pytest.mark.parametrize("char_span", [False, True])
+def test_matches_stream_segmenter(char_span, offload_threshold):
+    deltas = [*_deltas(_TEXT), None, ""]
+    sentences = asyncio.run(
+        _collect(asegment_stream(_source(deltas), char_span=char_span, offload_threshold=offload_threshold))
+    )
+    assert sentences == _streamed(deltas, char_span=char_span)
+
+
+def test_reader_stays_within_max_pending_chunks():
+    deltas = [f"Sentence {index}. " for index in range(200)]
+    read = []
+
+    async def consume():
+        iterator = asegment_stream(_source(deltas, read), max_pending_chunks=4)
+        first = await iterator.__anext__()
+        for _ in range(20):
+            await asyncio.sleep(0)
+        # Queued chunks, plus the one the reader is blocked putting and the one consumed.
+        assert len(read) <= 4 + 2 + 1
+        await iterator.aclose()
+        return first
+
+    assert asyncio.run(consume()) == "Sentence 0. "
+
+
+def test_long_tails_are_fed_on_a_worker_thread(monkeypatch):
+    threads = []
+    feed_and_drain = StreamSegmenter._feed_and_drain
+
+    def recording(self, delta):
+        threads.append(threading.get_ident())
+        return feed_and_drain(self, delta)
+
+    monkeypatch.setattr(StreamSegmenter, "_feed_and_drain", recording)
+
+    async def run():
+        loop_thread = threading.get_ident()
+        await _collect(asegment_stream(_source(_deltas("word " * 100 + "end.", 10)), offload_threshold=200))
+        return loop_thread
+
+    loop_thread = asyncio.run(run())
+    assert threads[0] == loop_thread
+    assert threads[-1] != loop_thread
+    # The 20th 10-character delta is the first to bring the tail to 200 characters.
+    assert threads.index(next(ident for ident in threads if ident != loop_thread)) == 19
+
+
+def test_source_errors_are_raised_after_completed_sentences():
+    async def failing():
+        yield "One. Two. "
+        raise ValueError("connection lost")
+
+    async def consume():
+        sentences = []
+        with pytest.raises(ValueError, match="connection lost"):
+            async for sentence in asegment_stream(failing()):
+                sentences.append(sentence)
+        return sentences
+
+    assert asyncio.run(consume()) == ["One. ", "Two. "]
+
+
+def test_closing_early_stops_reading_the_source():
+    closed = []
+
+    async def endless():
+        try:
+            while True:
+                yield "More text. "
+                await asyncio.sleep(0)
+        finally:
+            closed.append(True)
+
+    async def consume():
+        iterator = asegment_stream(endless(), max_pending_chunks=2)
+        assert await iterator.__anext__() == "More text. "
+        await iterator.aclose()
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+    asyncio.run(consume())
+    assert closed == [True]
+
+
+def test_invalid_configuration_is_raised_eagerly():
+    with pytest.raises(InvalidConfigurationError):
+        asegment_stream(_source([]), max_pending_chunks=0)
+    with pytest.raises(InvalidConfigurationError):
+        asegment_stream(_source([]), offload_threshold=-1)
+    with pytest.raises(InvalidConfigurationError):
+        asegment_stream(_source([]), buffering_mode="eager")
@@ -0,0 +1,142 @@
+"""Tests for the batch APIs: segment_batch / segment_spans_batch and map.
+
+The batch APIs are pure fan-out: for every input text the result must equal the
+single-text call on the same Segmenter configuration, in input order by default
+and as ``(index, result)`` pairs when ``ordered=False``.
+"""
+
+from __future__ import annotations
+
+import warnings
+
+import pytest
+
+import sentencesplit
+from sentencesplit import _parallel
+from sentencesplit.exceptions import InvalidConfigurationError
+from tests.helpers import assert_span_contract
+
+_TEXTS = [
+    "Dr. Smith went to Washington. He arrived at 3 p.m. yesterday.",
+    "",
+    "One. Two. Three.",
+    "No terminal punctuation here",
+    "1. First item\n2. Second item\n",
+    'He said, "Stop." Then he left.',
+] * 7
+
+
+def _lazy(texts):
+    yield from texts
+
+
+class _ShoutingSegmenter(sentencesplit.Segmenter):
+    def segment(self, text):
+        return [sentence.upper() for sentence in super().segment(text)]
+
+
+@pytest.mark.parametrize("n_workers", [1, 2])
+def test_segment_batch_matches_segment_in_order(n_workers):
+    seg = sentencesplit.Segmenter(language="en")
+    results = list(seg.segment_batch(_lazy(_TEXTS), n_workers=n_workers, chunksize=4))
+    assert results == [seg.segment(text) for text in _TEXTS]
+
+
+@pytest.mark.parametrize("n_workers", [1, 2])
+def test_segment_spans_batch_matches_segment_spans(n_workers):
+    seg = sentencesplit.Segmenter(language="en")
+    results = list(seg.segment_spans_batch(_TEXTS, n_workers=n_workers, chunksize=5))
+    assert results == [seg.segment_spans(text) for text in _TEXTS]
+    for text, spans in zip(_TEXTS, results):
+        assert_span_contract(text, spans)
+
+
+@pytest.mark.parametrize("n_workers", [1, 2])
+def test_segment_batch_unordered_yields_indexed_results(n_workers):
+    seg = sentencesplit.Segmenter(language="en")
+    pairs = list(seg.segment_batch(_TEXTS, n_workers=n_workers, chunksize=3, ordered=False))
+    assert sorted(index for index, _ in pairs) == list(range(len(_TEXTS)))
+    for index, segments in pairs:
+        assert segments == seg.segment(_TEXTS[index])
+
+
+def test_segment_batch_rebuilds_worker_configuration():
+    seg = sentencesplit.Segmenter(language="de", clean=True, split_mode="conservative")
+    texts = ["Das ist gut. Weiter geht es.", "Am 3. Oktober kam er. Dann ging er."]
+    assert list(seg.segment_batch(texts, n_workers=2, chunksize=1)) == [seg.segment(text) for text in texts]
+
+
+def test_segment_batch_workers_rebuild_a_subclass():
+    seg = _ShoutingSegmenter(language="en")
+    assert list(seg.segment_batch(_TEXTS, n_workers=2, chunksize=4)) == [seg.segment(text) for text in _TEXTS]
+
+
+def test_segment_batch_empty_input():
+    seg = sentencesplit.Segmenter(language="en")
+    assert list(seg.segment_batch([], n_workers=2)) == []
+
+
+def test_segment_batch_abandoned_iterator_shuts_down_pool():
+    seg = sentencesplit.Segmenter(language="en")
+    results = seg.segment_batch(_TEXTS, n_workers=2, chunksize=1)
+    assert next(results) == seg.segment(_TEXTS[0])
+    results.close()
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"n_workers": 0}, "n_workers"),
+        ({"chunksize": 0}, "chunksize"),
+        ({"n_workers": True}, "n_workers"),
+        ({"n_workers": 2.0}, "n_workers"),
+        ({"chunksize": True}, "chunksize"),
+        ({"chunksize": 4.5}, "chunksize"),
+    ],
+)
+def test_segment_batch_validates_arguments_eagerly(kwargs, message):
+    seg = sentencesplit.Segmenter(language="en")
+    with pytest.raises(InvalidConfigurationError, match=message):
+        seg.segment_batch(_TEXTS, **kwargs)
+
+
+def test_segment_spans_batch_requires_clean_false():
+    seg = sentencesplit.Segmenter(language="en", clean=True)
+    with pytest.raises(InvalidConfigurationError, match="clean=False"):
+        seg.segment_spans_batch(_TEXTS)
+
+
+# --------------------------------------------------------------------------- #
+# Segmenter.map: shared-segmenter thread pool
+# --------------------------------------------------------------------------- #
+
+
+def test_map_uses_threads_without_gil(monkeypatch):
+    monkeypatch.setattr(_parallel, "gil_enabled", lambda: False)
+    seg = sentencesplit.Segmenter(language="en")
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        results = list(seg.map(_lazy(_TEXTS), threads=4, chunksize=2))
+    assert results == [seg.segment(text) for text in _TEXTS]
+
+
+def test_map_falls_back_to_processes_with_gil(monkeypatch):
+    monkeypatch.setattr(_parallel, "gil_enabled", lambda: True)
+    seg = sentencesplit.Segmenter(language="en")
+    with pytest.warns(RuntimeWarning, match="GIL is enabled"):
+        results = seg.map(_TEXTS, threads=2, chunksize=4)
+    assert list(results) == [seg.segment(text) for text in _TEXTS]
+
+
+def test_map_single_thread_never_warns(monkeypatch):
+    monkeypatch.setattr(_parallel, "gil_enabled", lambda: True)
+    seg = sentencesplit.Segmenter(language="en")
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert list(seg.map(_TEXTS, threads=1)) == [seg.segment(text) for text in _TEXTS]
+
+
+def test_map_validates_threads():
+    seg = sentencesplit.Segmenter(language="en")
+    with pytest.raises(InvalidConfigurationError, match="threads"):
+        seg.map(_TEXTS, threads=0)
@@ -0,0 +1,105 @@
+"""Tests for the lazy generator APIs, iter_segment_spans / iter_segment.
+
+The generators are a memory optimization only: drained, they must produce
+exactly ``segment_spans(text)`` / ``segment(text)``.
+"""
+
+from __future__ import annotations
+
+import random
+from types import GeneratorType
+
+import pytest
+
+import sentencesplit
+from sentencesplit import _hard_boundary
+from sentencesplit.exceptions import InvalidConfigurationError
+from tests.helpers import ALL_CODES, assert_span_contract, paragraph_document, token_document
+
+
+@pytest.mark.parametrize("code", ALL_CODES)
+def test_iter_segment_spans_matches_segment_spans(code):
+    seg = sentencesplit.Segmenter(language=code)
+    rng = random.Random(code)
+    for _ in range(6):
+        text = paragraph_document(rng)
+        spans = list(seg.iter_segment_spans(text, min_piece_size=rng.choice((1, 20, 80))))
+        assert spans == seg.segment_spans(text)
+        assert_span_contract(text, spans)
+
+
+@pytest.mark.parametrize("code", ["en", "de", "ru", "hy"])
+def test_iter_segment_spans_matches_on_list_and_numeral_tokens(code):
+    seg = sentencesplit.Segmenter(language=code)
+    rng = random.Random(f"tokens-{code}")
+    for _ in range(500):
+        text = token_document(rng)
+        assert list(seg.iter_segment_spans(text, min_piece_size=rng.choice((1, 2, 3, 5, 20)))) == seg.segment_spans(text), text
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        # ". i." is the processed form of ".\ni."; it recurs verbatim after the seam.
+        ".\ni. o\n\n. i.",
+        # "??1)" splits after "??" only at the start of a text.
+        "1)(a)ii. \n\n   ??1)  ",
+        # The rewritten "(a) i." recurs verbatim two pieces after the seam.
+        "o  ii.ii.    Foo.Dr.Dr.ii. (a) \n i. \n\n 1.o Dr.\n\n (a) i. ",
+    ],
+)
+def test_iter_segment_spans_matches_across_moving_seams(text):
+    for code in ("en", "de"):
+        seg = sentencesplit.Segmenter(language=code)
+        for min_piece_size in (1, 3):
+            assert list(seg.iter_segment_spans(text, min_piece_size=min_piece_size)) == seg.segment_spans(text)
+
+
+@pytest.mark.parametrize("code", ALL_CODES)
+def test_iter_segment_matches_segment(code):
+    seg = sentencesplit.Segmenter(language=code)
+    rng = random.Random(f"plain-{code}")
+    for _ in range(6):
+        text = paragraph_document(rng)
+        assert list(seg.iter_segment(text, min_piece_size=rng.choice((1, 20, 80)))) == seg.segment(text)
+
+
+def test_iter_segment_clean_matches_segment():
+    seg = sentencesplit.Segmenter(language="en", clean=True)
+    text = paragraph_document(random.Random(1))
+    assert list(seg.iter_segment(text)) == seg.segment(text)
+
+
+def test_iter_segment_spans_is_lazy(monkeypatch):
+    seg = sentencesplit.Segmenter(language="en")
+    text = "\n\n".join(f"Paragraph {i} is here. It has two sentences." for i in range(50))
+    pieces = []
+    original = _hard_boundary.iter_segmented_pieces
+
+    def counting(segmenter, full_text, bounds):
+        for piece in original(segmenter, full_text, bounds):
+            pieces.append(piece)
+            yield piece
+
+    monkeypatch.setattr(_hard_boundary, "iter_segmented_pieces", counting)
+    spans = seg.iter_segment_spans(text, min_piece_size=100)
+    assert isinstance(spans, GeneratorType)
+    first = next(spans)
+    assert first.start == 0
+    # Only the first piece and its successor (for the seam check) are segmented.
+    assert len(pieces) == 2
+    assert [first, *spans] == seg.segment_spans(text)
+
+
+@pytest.mark.parametrize("text", [None, ""])
+def test_iter_empty_input(text):
+    seg = sentencesplit.Segmenter(language="en")
+    assert list(seg.iter_segment_spans(text)) == []
+    assert list(seg.iter_segment(text)) == []
+
+
+def test_iter_segment_spans_validates_eagerly():
+    with pytest.raises(InvalidConfigurationError, match="clean=False"):
+        sentencesplit.Segmenter(language="en", clean=True).iter_segment_spans("Hi.")
+    with pytest.raises(InvalidConfigurationError, match="min_piece_size"):
+        sentencesplit.Segmenter(language="en").iter_segment_spans("Hi.", min_piece_size=0)
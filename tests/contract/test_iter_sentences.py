@@ -0,0 +1,136 @@
+"""Tests for iter_sentences (chunked, bounded-memory segmentation of a file object).
+
+Within the caveats of segment_file (list markers pair up within a chunk), the
+output equals ``segment_spans()`` / ``segment()`` of the whole input, at any
+allowed chunk size, for text and binary sources alike.
+"""
+
+from __future__ import annotations
+
+import io
+import random
+
+import pytest
+
+import sentencesplit
+from sentencesplit import iter_sentences
+from sentencesplit.exceptions import InvalidConfigurationError
+from tests.helpers import ALL_CODES, assert_span_contract
+
+# List-free paragraphs: list numbering is paired per chunk, not per input.
+_PARAGRAPHS = (
+    "Dr. Smith went to Washington. He arrived at 3 p.m. yesterday.",
+    "See p.\n\nSmith et al. wrote it.",
+    "The model is GPT 3.\n\n1 more thing.",
+    'He said, "Stop." Then he left. (See fig. 2.)',
+    "​Leading zero width. Text.​",
+    "Wait...\n\n...what?",
+    "U.S.A.\r\n\r\nNext para here.",
+    "这是第一句。这是第二句！",
+    "Он сказал: «Привет». Потом ушёл.",
+)
+_SEPARATORS = ("\n\n", "\n \n", "\r\n\r\n", "\n\n\n  ", "\n\n​")
+
+
+class _CountingReader(io.StringIO):
+    reads = 0
+
+    def read(self, size=-1):
+        self.reads += 1
+        return super().read(size)
+
+
+def _document(rng, paragraphs=None):
+    return "".join(rng.choice(_PARAGRAPHS) + rng.choice(_SEPARATORS) for _ in range(paragraphs or rng.randint(5, 40)))
+
+
+@pytest.mark.parametrize("code", ALL_CODES)
+def test_iter_sentences_matches_segment_spans(code):
+    seg = sentencesplit.Segmenter(language=code)
+    rng = random.Random(code)
+    for _ in range(3):
+        text = _document(rng)
+        expected = seg.segment_spans(text)
+        for chunk_size in (256, 301, 1 << 16):
+            spans = list(iter_sentences(io.StringIO(text), code, chunk_size=chunk_size, char_span=True))
+            assert spans == expected
+            assert_span_contract(text, spans)
+            # Byte chunks split multi-byte characters; the decoder stitches them.
+            assert list(iter_sentences(io.BytesIO(text.encode()), code, chunk_size=chunk_size, char_span=True)) == expected
+
+
+@pytest.mark.parametrize("code", ["en", "de", "zh"])
+def test_iter_sentences_matches_segment(code):
+    seg = sentencesplit.Segmenter(language=code)
+    text = _document(random.Random(f"plain-{code}"))
+    for chunk_size in (257, 1 << 16):
+        assert list(iter_sentences(io.StringIO(text), code, chunk_size=chunk_size)) == seg.segment(text)
+
+
+def test_reads_lazily_in_chunks():
+    text = _document(random.Random(0), paragraphs=400)
+    reader = _CountingReader(text)
+    sentences = iter_sentences(reader, chunk_size=256)
+    assert reader.reads == 0
+    next(sentences)
+    assert reader.reads <= 8 < len(text) // 256
+    assert sum(1 for _ in sentences) + 1 == len(sentencesplit.Segmenter().segment(text))
+    assert reader.reads == -(-len(text) // 256) + 1
+
+
+def test_long_line_is_cut_between_sentences():
+    # No line break at all: the buffer is cut before its last sentence once it
+    # spans a few chunks, instead of holding the whole input.
+    text = " ".join(f"Sentence {i} is here, e.g. with Dr. Smith." for i in range(600))
+    reader = _CountingReader(text)
+    sentences = iter_sentences(reader, chunk_size=256)
+    next(sentences)
+    assert reader.reads <= 9 < len(text) // 256
+    assert sum(1 for _ in sentences) + 1 == 600
+    spans = list(iter_sentences(io.StringIO(text), chunk_size=256, char_span=True))
+    assert spans == sentencesplit.Segmenter().segment_spans(text)
+
+
+@pytest.mark.parametrize("text", [".\ni. o\n\n. i.", "1)(a)ii. \n\n   ??1)  ", "ii. iv.\n\ni. o\n\n. i. ii."])
+def test_seams_hold_around_numerals_and_list_markers(text):
+    text = (text + "\n\n") * 40
+    expected = sentencesplit.Segmenter().segment_spans(text)
+    for chunk_size in (256, 300):
+        assert list(iter_sentences(io.StringIO(text), chunk_size=chunk_size, char_span=True)) == expected
+
+
+@pytest.mark.parametrize("code", ["en", "de", "ru"])
+def test_smallest_chunk_size_matches_segment_on_single_line_breaks(code):
+    # Sentences joined by spaces and single line breaks, with number-period
+    # tokens ("GPT 3.", "fig. 2.)") that the list phase counts as markers.
+    seg = sentencesplit.Segmenter(language=code)
+    rng = random.Random(f"lines-{code}")
+    for _ in range(40):
+        text = "".join(rng.choice(_PARAGRAPHS) + rng.choice((" ", "\n", " \n", "  ")) for _ in range(rng.randint(3, 30)))
+        assert list(iter_sentences(io.StringIO(text), code, chunk_size=256)) == seg.segment(text)
+
+
+def test_decodes_with_encoding_and_errors():
+    text = "Größe zählt. Nächster Satz. " * 20
+    spans = list(iter_sentences(io.BytesIO(text.encode("latin-1")), "de", chunk_size=257, char_span=True, encoding="latin-1"))
+    assert "".join(span.sent for span in spans) == text
+    data = text.encode() + b"\xff"
+    with pytest.raises(UnicodeDecodeError):
+        list(iter_sentences(io.BytesIO(data), "de", chunk_size=257))
+    expected = sentencesplit.Segmenter(language="de").segment(text + "\ufffd")
+    assert list(iter_sentences(io.BytesIO(data), "de", chunk_size=257, errors="replace")) == expected
+
+
+def test_empty_input_yields_nothing():
+    assert list(iter_sentences(io.StringIO(""))) == []
+    assert list(iter_sentences(io.BytesIO(b""), char_span=True)) == []
+
+
+def test_invalid_configuration_is_rejected_on_call():
+    for chunk_size in (0, 3, 255, True, 256.0):
+        with pytest.raises(InvalidConfigurationError):
+            iter_sentences(io.StringIO("x"), chunk_size=chunk_size)
+    with pytest.raises(LookupError):
+        iter_sentences(io.BytesIO(b"x"), encoding="no-such-codec")
+    with pytest.raises(sentencesplit.UnknownLanguageError):
+        iter_sentences(io.StringIO("x"), language="xx")
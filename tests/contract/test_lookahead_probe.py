@@ -0,0 +1,79 @@
+"""Differential tests: lookahead probing against the full re-segmentation it replaces."""
+
+from __future__ import annotations
+
+import pytest
+
+import sentencesplit
+from tests.helpers import ALL_CODES, lookahead_sample_for_language, three_sentence_stream_sample
+
+_ENGLISH_STREAMS = (
+    "Dr. Smith met Mr. Jones at 3 p.m. on Jan. 5. They spoke about fig. 2.",
+    "The model is GPT 3.5. It costs $3.50 per 1.5 hours.",
+    'He said "hello." She said ‘bye.’ End of section (see p.)',
+    "See https://example.com/a.b. Then e.g. this. U.S.A. was founded.",
+    "Item​. Next.​ Ref.​” Done.\n\nNew paragraph i. ii. iii.",
+)
+
+
+class _FullAlignmentSegmenter(sentencesplit.Segmenter):
+    """Probes by re-processing each probe text and aligning every segment."""
+
+    def _comparison_segments(self, analysis_text):
+        processed_sents = self._process(self._processor_text(analysis_text))
+        if self.clean:
+            return processed_sents
+        return [s for s, _, _ in self._match_spans(processed_sents, analysis_text)]
+
+    def _wait_with_tail_probe(self, base_tail, last_segment, probe_suffixes):
+        if not self.clean:
+            base_tail = self._strip_zero_width(base_tail)
+        for suffix in probe_suffixes:
+            probe_segments = self._comparison_segments(base_tail + suffix)
+            if not probe_segments or probe_segments[0] != self._expected_last_segment_for_probe(last_segment, suffix):
+                return True
+        return False
+
+    def _wait_with_full_probe(self, analysis_text, comparison_segments, last_segment, probe_suffixes):
+        for suffix in probe_suffixes:
+            expected = [*comparison_segments[:-1], self._expected_last_segment_for_probe(last_segment, suffix)]
+            if self._comparison_segments(analysis_text + suffix)[: len(comparison_segments)] != expected:
+                return True
+        return False
+
+
+def _prefixes(text):
+    return [text[:end] for end in range(1, len(text) + 1)]
+
+
+def _assert_same_verdicts(kwargs, texts):
+    seg = sentencesplit.Segmenter(**kwargs)
+    oracle = _FullAlignmentSegmenter(**kwargs)
+    for text in texts:
+        assert seg.should_wait_for_more(text) is oracle.should_wait_for_more(text), text
+
+
+@pytest.mark.parametrize("language_code", ALL_CODES)
+def test_probe_verdicts_match_full_alignment_across_languages(language_code):
+    token, punct = lookahead_sample_for_language(language_code)
+    stream = f"{three_sentence_stream_sample(language_code)}{punct} {token}{punct} 3{punct}"
+    _assert_same_verdicts({"language": language_code}, _prefixes(stream))
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"clean": True}, {"clean": True, "doc_type": "pdf"}, {"split_mode": "aggressive"}])
+def test_probe_verdicts_match_full_alignment_on_streamed_english(kwargs):
+    _assert_same_verdicts({"language": "en", **kwargs}, [prefix for text in _ENGLISH_STREAMS for prefix in _prefixes(text)])
+
+
+@pytest.mark.parametrize("clean", [False, True])
+def test_full_probe_matches_full_alignment(clean):
+    # The full probe is a fallback with no known natural trigger, so call it directly.
+    seg = sentencesplit.Segmenter(language="en", clean=clean)
+    oracle = _FullAlignmentSegmenter(language="en", clean=clean)
+    for text in _ENGLISH_STREAMS:
+        for prefix in _prefixes(text):
+            analysis_text, _, comparison_segments = seg._segment_result(prefix)
+            if not comparison_segments:
+                continue
+            args = (analysis_text, comparison_segments, comparison_segments[-1], (" a", " A", " 1", "1"))
+            assert seg._wait_with_full_probe(*args) is oracle._wait_with_full_probe(*args), prefix
@@ -0,0 +1,109 @@
+"""Tests for the static lookahead verdicts in front of probe re-segmentation."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+import sentencesplit
+from sentencesplit.abbreviation_replacer import AbbreviationReplacer
+from sentencesplit.utils import LookaheadInfo
+from tests.helpers import ALL_CODES, three_sentence_stream_sample
+
+_STREAMS = (
+    "Dr. Smith met Mr. Jones at 3 p.m. on Jan. 5. They spoke about fig. 2 and the finale.",
+    "The model is GPT 3.5. It costs 3 dollars per 5 in. Then the tape measure broke.",
+    "i. first item. ii. second item. b. The third item. Nothing else.",
+    'He said "hello." She said ‘bye.’ End of section (see p.) And sub nom. the case.',
+    "Il nostro tel. è questo. Foo bar rgi bdp. Ev uitl. fare act. Nieuw arch. r cont.",
+)
+
+
+def _texts(code):
+    data = AbbreviationReplacer.abbreviation_data(sentencesplit.Segmenter(language=code).language_module)
+    texts = [three_sentence_stream_sample(code) + "."]
+    for abbr in sorted(data.abbr_set)[:60]:
+        texts += [f"{abbr}.", f"Foo bar {abbr}. ", f"Foo bar {abbr.capitalize()}."]
+    for stream in _STREAMS:
+        texts += [stream[: index + 1] for index, char in enumerate(stream) if char == "."]
+        texts += [stream[: index + 2] for index, char in enumerate(stream[:-1]) if char == "."]
+    stems = list(dict.fromkeys(text.rstrip() for text in texts))
+    # Only "" and " " endings are decided statically; the rest must fall through.
+    return [stem + ending for stem in stems for ending in ("", " ")] + [
+        stem + ending for stem in stems[::4] for ending in ("  ", "\n", " \n ")
+    ]
+
+
+@pytest.mark.parametrize("split_mode", ["conservative", "balanced", "aggressive"])
+@pytest.mark.parametrize("language_code", ALL_CODES)
+def test_static_verdicts_match_probes(language_code, split_mode):
+    seg = sentencesplit.Segmenter(language=language_code, split_mode=split_mode)
+    oracle = sentencesplit.Segmenter(language=language_code, split_mode=split_mode)
+    oracle._static_lookahead = False
+    for text in _texts(language_code):
+        assert seg.should_wait_for_more(text) is oracle.should_wait_for_more(text), text
+    assert oracle.lookahead_info().static == 0
+
+
+def test_lookahead_info_counts_static_and_probed_verdicts():
+    sentencesplit.Segmenter.lookahead_cache_clear()
+    seg = sentencesplit.Segmenter(language="en")
+    assert seg.lookahead_info() == LookaheadInfo(0, 0, 0)
+    assert seg.should_wait_for_more("This is the finale.") is False
+    assert seg.should_wait_for_more("Hello. Dr.") is True
+    assert seg.should_wait_for_more("The model is GPT 3.") is True
+    assert seg.lookahead_info() == LookaheadInfo(static=3, cached=0, probed=0)
+    assert seg.should_wait_for_more('He said "hello."') is True
+    assert seg.should_wait_for_more("He met Smith.") is False
+    assert seg.should_wait_for_more("What?") is False  # not period-final: counted by neither
+    assert seg.lookahead_info() == LookaheadInfo(static=3, cached=0, probed=2)
+
+
+@pytest.mark.parametrize("text", ["Jan.  ", "etc.  ", "B. 3.14 ok.  ", "Jan. \n", "went U.S. \n ", "St.\n"])
+def test_line_breaks_and_space_runs_are_probed(text):
+    sentencesplit.Segmenter.lookahead_cache_clear()
+    seg = sentencesplit.Segmenter(language="en")
+    oracle = sentencesplit.Segmenter(language="en")
+    oracle._static_lookahead = False
+    assert seg.should_wait_for_more(text) is oracle.should_wait_for_more(text)
+    assert seg.lookahead_info().static == 0
+
+
+def test_clean_mode_always_probes():
+    sentencesplit.Segmenter.lookahead_cache_clear()
+    seg = sentencesplit.Segmenter(language="en", clean=True)
+    assert seg.should_wait_for_more("This is the finale.") is False
+    assert seg.lookahead_info() == LookaheadInfo(static=0, cached=0, probed=1)
+
+
+class _CountingLock:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.acquired = 0
+
+    def __enter__(self):
+        self.acquired += 1
+        return self.lock.__enter__()
+
+    def __exit__(self, *exc):
+        return self.lock.__exit__(*exc)
+
+
+def test_counters_are_per_thread_and_lock_free_after_registration():
+    seg = sentencesplit.Segmenter(language="en")
+    seg._lookahead_lock = lock = _CountingLock()
+    texts = ["This is the finale.", "Hello. Dr.", "The model is GPT 3."] * 50
+
+    def work():
+        for text in texts:
+            seg.should_wait_for_more(text)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # One acquisition per thread registers its tally; counting takes none.
+    assert lock.acquired == 4
+    assert seg.lookahead_info() == LookaheadInfo(static=4 * len(texts), cached=0, probed=0)
@@ -0,0 +1,61 @@
+"""Tests for the process-wide cache of lookahead probe verdicts."""
+
+from __future__ import annotations
+
+import pytest
+
+import sentencesplit
+from sentencesplit import StreamSegmenter
+from sentencesplit.utils import LookaheadInfo
+
+_PROBED = ('He said "hello."', "End of section (see p.)", "She said 'goodbye.' ", "He met Smith.")
+_STREAM = 'Dr. Smith met Mr. Jones. He said "hello." She said ‘bye.’ Then he met Smith. See fig. 2. The end.'
+
+
+@pytest.fixture(autouse=True)
+def _empty_verdict_cache():
+    sentencesplit.Segmenter.lookahead_cache_clear()
+    yield
+    sentencesplit.Segmenter.lookahead_cache_clear()
+
+
+def test_repeated_terminal_context_is_served_from_the_cache():
+    seg = sentencesplit.Segmenter(language="en")
+    first = [seg.should_wait_for_more(text) for text in _PROBED]
+    assert seg.lookahead_info() == LookaheadInfo(static=0, cached=0, probed=len(_PROBED))
+    # A different prefix before the same last segment is the same terminal context.
+    assert [seg.should_wait_for_more("Intro. " + text) for text in _PROBED] == first
+    assert seg.lookahead_info() == LookaheadInfo(static=0, cached=len(_PROBED), probed=len(_PROBED))
+    info = sentencesplit.Segmenter.lookahead_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (len(_PROBED), len(_PROBED), len(_PROBED))
+
+
+def test_cache_is_shared_across_segmenters_and_streams():
+    sentencesplit.Segmenter(language="en").segment_with_lookahead('He said "hello."')
+    stream = StreamSegmenter(language="en")
+    stream.feed('He said "hello."')
+    assert stream._segmenter.lookahead_info() == LookaheadInfo(static=0, cached=1, probed=0)
+
+
+def test_configurations_do_not_share_entries():
+    for kwargs in ({"language": "en"}, {"language": "en", "split_mode": "aggressive"}, {"language": "de"}):
+        seg = sentencesplit.Segmenter(**kwargs)
+        seg.should_wait_for_more('He said "hello."')
+        assert seg.lookahead_info().cached == 0
+
+
+@pytest.mark.parametrize("split_mode", ["conservative", "balanced", "aggressive"])
+def test_streamed_output_is_unchanged_by_the_cache(split_mode):
+    def run():
+        stream = StreamSegmenter(language="en", split_mode=split_mode)
+        emitted = []
+        for char in _STREAM:
+            stream.feed(char)
+            emitted.append((tuple(stream.get_completed_sentences()), stream.is_complete()))
+        return emitted, stream._segmenter.lookahead_info()
+
+    cold, cold_info = run()
+    warm, warm_info = run()
+    assert warm == cold
+    assert warm_info.probed == 0
+    assert warm_info.cached == cold_info.cached + cold_info.probed
@@ -30,12 +30,12 @@ caught at once.
 
 Empirically (high-budget Hypothesis search, see the discovery harness):
 
-* **Idempotence fails in ALL 26 codes.** The dominant family is repeated terminal
-  punctuation: an emitted segment that *starts* with a doubled terminal (e.g.
-  ``"!!H"``, ``"！！"``, ``"!? e"``) re-splits when fed back in, because the
+* **Idempotence fails in 25 of the 26 codes.** The dominant family is repeated
+  terminal punctuation: an emitted segment that *starts* with a doubled terminal
+  (e.g. ``"!!H"``, ``"！！"``, ``"!? e"``) re-splits when fed back in, because the
   multi-terminator resplit / between-punctuation passes treat the run differently
-  in fragment position. There is therefore no idempotence gate today; the whole
-  registry is the backlog.
+  in fragment position. hy holds idempotence and is the only live gate; the rest
+  of the registry is the backlog.
 * **split_mode monotonicity fails in 14 codes** (the Latin/Cyrillic period
   languages) on the canonical ``". ! e."``: conservative/balanced emit 2 segments
   but aggressive merges to 1 (``len`` drops as the bias *increases*). The other
@@ -73,16 +73,13 @@ except ImportError:  # pragma: no cover - dev-only dependency
 # that violates the invariant under Hypothesis reds the suite immediately.
 # --------------------------------------------------------------------------- #
 
-# Idempotence is violated by every registered code. The counterexample is an
-# input whose ``segment()`` output contains at least one segment that re-splits
-# when fed back through ``segment()``. Most are the "doubled terminal at the
-# start of a fragment" family; a few (ar/ru/hy/ur) need a zero-width-space carrier
-# (``​``) so the doubled-terminal fragment is produced in non-leading
-# position.
-_ZWSP = "​"
+# Idempotence is violated by every registered code but hy. The counterexample is
+# an input whose ``segment()`` output contains at least one segment that re-splits
+# when fed back through ``segment()``. All are the "doubled terminal at the start
+# of a fragment" family.
 IDEMPOTENCE_QUARANTINE: dict[str, str] = {
     "am": "! !!",
-    "ar": f"؟{_ZWSP} {_ZWSP}م؟م",
+    "ar": "؟!!",
     "bg": ". !!З",
     "da": ". !? e",
     "de": ". !? e",
@@ -94,7 +91,6 @@ IDEMPOTENCE_QUARANTINE: dict[str, str] = {
     "fa": ". . . . ",
     "fr": "w.́ x.H",
     "hi": "! !!",
-    "hy": f"։{_ZWSP} {_ZWSP}Բ։Բ",
     "it": ". !? e",
     "ja": "。！！",
     "kk": "С.!!С",
@@ -102,10 +98,10 @@ IDEMPOTENCE_QUARANTINE: dict[str, str] = {
     "my": "? ??",
     "nl": ". !? e",
     "pl": ". !? e",
-    "ru": f"П!{_ZWSP} {_ZWSP}ПП!П",
+    "ru": "П!!?П",
     "sk": "H.!!H",
     "tl": "H.!!H",
-    "ur": f"۔{_ZWSP} {_ZWSP}س۔س",
+    "ur": "۔!!",
     "zh": "。！！",
 }
 
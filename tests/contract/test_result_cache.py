@@ -0,0 +1,125 @@
+"""Tests for the opt-in result cache, ``Segmenter(cache_size=N)``."""
+
+from __future__ import annotations
+
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import sentencesplit
+from sentencesplit.exceptions import InvalidConfigurationError
+from sentencesplit.utils import CacheInfo
+from tests.helpers import paragraph_document
+
+_TEXTS = ("Dr. Smith arrived. He sat down.", "The model is GPT 3.", "Hello world", "   ", "One. Two. Three.")
+_METHODS = ("segment", "segment_spans", "should_wait_for_more", "segment_with_lookahead", "segment_spans_with_lookahead")
+
+
+@pytest.mark.parametrize("cache_key", ["text", "hash"])
+def test_cached_results_match_uncached(cache_key):
+    plain = sentencesplit.Segmenter(language="en")
+    cached = sentencesplit.Segmenter(language="en", cache_size=64, cache_key=cache_key)
+    texts = (*_TEXTS, paragraph_document(random.Random(cache_key)))
+    for _ in range(2):
+        for text in texts:
+            for method in _METHODS:
+                assert getattr(cached, method)(text) == getattr(plain, method)(text)
+    info = cached.cache_info()
+    assert info.misses == len(texts) * len(_METHODS)
+    assert info.hits == len(texts) * len(_METHODS)
+    assert info.currsize == len(texts) * len(_METHODS)
+
+
+def test_methods_do_not_share_entries():
+    seg = sentencesplit.Segmenter(language="en", cache_size=8)
+    text = "The model is GPT 3."
+    assert seg.segment(text) == ["The model is GPT 3."]
+    assert seg.segment_spans(text) == [sentencesplit.TextSpan("The model is GPT 3.", 0, 19)]
+    assert seg.should_wait_for_more(text) is True
+    assert seg.segment_with_lookahead(text).segments == ["The model is GPT 3."]
+    assert seg.cache_info().hits == 0
+
+
+def test_mutating_a_result_does_not_corrupt_the_cache():
+    seg = sentencesplit.Segmenter(language="en", cache_size=8)
+    text = "One. Two."
+    seg.segment(text).append("junk")
+    seg.segment_spans(text)[0].sent = "junk"
+    seg.segment_spans_with_lookahead(text).segments.clear()
+    assert seg.segment(text) == ["One. ", "Two."]
+    assert [span.sent for span in seg.segment_spans(text)] == ["One. ", "Two."]
+    assert len(seg.segment_spans_with_lookahead(text).segments) == 2
+
+
+def test_lru_eviction_by_count():
+    seg = sentencesplit.Segmenter(language="en", cache_size=2)
+    seg.segment("A.")
+    seg.segment("B.")
+    seg.segment("A.")  # A is now the most recently used
+    seg.segment("C.")  # evicts B
+    seg.segment("A.")
+    assert seg.cache_info()[:4] == (2, 3, 2, 2)
+    seg.segment("B.")
+    assert seg.cache_info().misses == 4
+
+
+def test_byte_bound_evicts_and_skips_oversized_entries():
+    seg = sentencesplit.Segmenter(language="en", cache_size=1000, cache_max_bytes=4000)
+    for i in range(50):
+        seg.segment(f"Sentence number {i}. Another one.")
+    info = seg.cache_info()
+    assert 0 < info.currsize < 50
+    assert info.currbytes <= 4000
+    seg.segment("Long sentence here. " * 500)
+    assert seg.cache_info().currbytes <= 4000
+    seg.segment("Long sentence here. " * 500)
+    assert seg.cache_info().hits == 0
+
+
+def test_hash_key_does_not_keep_the_text():
+    seg = sentencesplit.Segmenter(language="en", cache_size=4, cache_key="hash")
+    text = "Some long text. " * 1000
+    seg.segment(text)
+    ((kind, key),) = seg._result_cache._entries
+    assert kind == "segment"
+    assert not any(isinstance(part, str) for part in key)
+    assert seg.segment(text) == sentencesplit.Segmenter(language="en").segment(text)
+    assert seg.cache_info().hits == 1
+
+
+def test_cache_clear_and_disabled_info():
+    seg = sentencesplit.Segmenter(language="en", cache_size=4)
+    seg.segment("A.")
+    seg.segment("A.")
+    seg.cache_clear()
+    assert seg.cache_info() == CacheInfo(0, 0, 4, 0, None, 0)
+    disabled = sentencesplit.Segmenter(language="en")
+    disabled.segment("A.")
+    assert disabled.cache_info() == CacheInfo(0, 0, 0, 0, None, 0)
+
+
+def test_cache_is_thread_safe():
+    seg = sentencesplit.Segmenter(language="en", cache_size=16)
+    plain = sentencesplit.Segmenter(language="en")
+    texts = [f"Item {i % 20}. Done." for i in range(400)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(seg.segment_spans, texts))
+    assert results == [plain.segment_spans(text) for text in texts]
+    info = seg.cache_info()
+    assert info.hits + info.misses == len(texts)
+    assert info.currsize <= 16
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"cache_size": -1}, "cache_size"),
+        ({"cache_size": True}, "cache_size"),
+        ({"cache_size": 4, "cache_max_bytes": 0}, "cache_max_bytes"),
+        ({"cache_size": 4, "cache_key": "md5"}, "cache_key"),
+    ],
+)
+def test_invalid_cache_arguments(kwargs, match):
+    with pytest.raises(InvalidConfigurationError, match=match):
+        sentencesplit.Segmenter(language="en", **kwargs)
@@ -0,0 +1,127 @@
+"""Tests for Segmenter.segment_file (memory-mapped, windowed file segmentation).
+
+Within the documented caveat (list markers pair up within a window), the spans
+streamed from a file equal ``segment_spans()`` of the decoded file, whatever
+the window size, including windows that split a multi-byte character.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+import sentencesplit
+from sentencesplit import _hard_boundary
+from sentencesplit.exceptions import InvalidConfigurationError
+from tests.helpers import ALL_CODES, assert_span_contract, paragraph_document
+
+# List-free paragraphs: list numbering is paired per window, not per file.
+_PARAGRAPHS = (
+    "Dr. Smith went to Washington. He arrived at 3 p.m. yesterday.",
+    "See p.\n\nSmith et al. wrote it.",
+    "The model is GPT 3.\n\n1 more thing.",
+    'He said, "Stop." Then he left. (See fig. 2.)',
+    "​Leading zero width. Text.​",
+    "Wait...\n\n...what?",
+    "Hello!!! World?? Yes.",
+    "pp.",
+    "Mr.",
+    "U.S.A.\r\n\r\nNext para here.",
+    "这是第一句。这是第二句！",
+    "Он сказал: «Привет». Потом ушёл.",
+    "Ένα. Δύο; Τρία.",
+)
+_SEPARATORS = ("\n\n", "\n \n", "\r\n\r\n", "\n\n\n  ", "\n\t\n", "\n\n​")
+
+
+def _write(tmp_path, text, encoding="utf-8"):
+    path = tmp_path / "doc.txt"
+    path.write_bytes(text.encode(encoding))
+    return path
+
+
+def _document(rng):
+    return "".join(rng.choice(_PARAGRAPHS) + rng.choice(_SEPARATORS) for _ in range(rng.randint(5, 60)))
+
+
+@pytest.mark.parametrize("code", ALL_CODES)
+def test_segment_file_matches_segment_spans(tmp_path, code):
+    seg = sentencesplit.Segmenter(language=code)
+    rng = random.Random(code)
+    for _ in range(3):
+        text = _document(rng)
+        path = _write(tmp_path, text)
+        expected = seg.segment_spans(text)
+        for window_size in (7, 64, 1 << 20):
+            spans = list(seg.segment_file(path, window_size=window_size))
+            assert spans == expected
+            assert_span_contract(text, spans)
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "utf-8-sig", "utf-16", "utf-32-le"])
+def test_segment_file_byte_offsets_tile_the_file(tmp_path, encoding):
+    seg = sentencesplit.Segmenter(language="en")
+    text = _document(random.Random(encoding))
+    path = _write(tmp_path, text, encoding)
+    raw = path.read_bytes()
+    items = list(seg.segment_file(path, encoding=encoding, byte_offsets=True, window_size=33))
+    assert [span for span, _, _ in items] == seg.segment_spans(raw.decode(encoding))
+    assert items[0][1] == 0
+    assert items[-1][2] == len(raw)
+    for (span, byte_start, byte_end), (_, next_start, _) in zip(items, items[1:]):
+        assert byte_end == next_start
+    for span, byte_start, byte_end in items[1:]:
+        assert raw[byte_start:byte_end].decode(encoding) == span.sent
+
+
+def test_segment_file_without_paragraph_breaks_is_force_cut(tmp_path):
+    seg = sentencesplit.Segmenter(language="en")
+    text = "\n".join(f"Line {i} has a sentence. And another one." for i in range(200))
+    path = _write(tmp_path, text)
+    spans = list(seg.segment_file(path, window_size=64))
+    assert_span_contract(text, spans)
+    assert spans == seg.segment_spans(text)
+
+
+def test_list_numbering_is_paired_per_window(tmp_path):
+    # The documented caveat: with list paragraphs spread over many windows, some
+    # documents segment differently from segment_spans() on the whole text. All
+    # of those hold list markers, the spans still tile the file, and a window
+    # holding the whole file removes the difference.
+    seg = sentencesplit.Segmenter(language="en")
+    rng = random.Random(0)
+    differing = 0
+    for _ in range(40):
+        text = "".join(paragraph_document(rng) for _ in range(5))
+        path = _write(tmp_path, text)
+        expected = seg.segment_spans(text)
+        spans = list(seg.segment_file(path, window_size=256))
+        assert_span_contract(text, spans)
+        if spans != expected:
+            differing += 1
+            assert _hard_boundary.list_marked_region(seg, text) is not None
+        assert list(seg.segment_file(path, window_size=1 << 20)) == expected
+    assert 0 < differing < 20
+
+
+def test_segment_file_empty_file(tmp_path):
+    path = _write(tmp_path, "")
+    assert list(sentencesplit.Segmenter(language="en").segment_file(path)) == []
+
+
+def test_segment_file_decode_error_propagates(tmp_path):
+    path = tmp_path / "bad.txt"
+    path.write_bytes(b"Valid. \xff\xfe invalid.")
+    with pytest.raises(UnicodeDecodeError):
+        list(sentencesplit.Segmenter(language="en").segment_file(path))
+
+
+def test_segment_file_validates_eagerly(tmp_path):
+    path = _write(tmp_path, "Hi.")
+    with pytest.raises(InvalidConfigurationError, match="clean=False"):
+        sentencesplit.Segmenter(language="en", clean=True).segment_file(path)
+    with pytest.raises(InvalidConfigurationError, match="window_size"):
+        sentencesplit.Segmenter(language="en").segment_file(path, window_size=0)
+    with pytest.raises(LookupError):
+        sentencesplit.Segmenter(language="en").segment_file(path, encoding="no-such-codec")
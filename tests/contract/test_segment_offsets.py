@@ -0,0 +1,49 @@
+"""Tests for Segmenter.segment_offsets, the compact offset-array output mode.
+
+The array holds exactly the boundaries of ``segment_spans(text)``, so the
+round-trip and tiling invariants hold for the slices it describes.
+"""
+
+from __future__ import annotations
+
+import random
+from array import array
+
+import pytest
+
+import sentencesplit
+from sentencesplit.exceptions import InvalidConfigurationError
+from tests.helpers import ALL_CODES, paragraph_document
+
+_DIRTY_TEXTS = (
+    "   ",
+    "​",
+    "﻿Hello world. Bye.",
+    "A. B. C.",
+    "t.​\n​pp.\nM​pp.",
+    'He said, "Stop." Then he left.   ',
+)
+
+
+@pytest.mark.parametrize("code", ALL_CODES)
+def test_segment_offsets_match_segment_spans(code):
+    seg = sentencesplit.Segmenter(language=code)
+    rng = random.Random(code)
+    for text in (*_DIRTY_TEXTS, *(paragraph_document(rng) for _ in range(4))):
+        offsets = seg.segment_offsets(text)
+        spans = seg.segment_spans(text)
+        assert isinstance(offsets, array) and offsets.typecode == "q"
+        assert list(offsets) == [0, *(span.end for span in spans)]
+        assert offsets[-1] == len(text)
+        assert "".join(text[start:end] for start, end in zip(offsets, offsets[1:])) == text
+        assert all(start < end for start, end in zip(offsets, offsets[1:]))
+
+
+@pytest.mark.parametrize("text", [None, ""])
+def test_segment_offsets_empty_input(text):
+    assert sentencesplit.Segmenter(language="en").segment_offsets(text) == array("q", [0])
+
+
+def test_segment_offsets_requires_clean_false():
+    with pytest.raises(InvalidConfigurationError, match="clean=False"):
+        sentencesplit.Segmenter(language="en", clean=True).segment_offsets("Hi.")
@@ -0,0 +1,32 @@
+"""Tests for Segmenter.segment_span_views, the lightweight TextSpan alternative."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+import sentencesplit
+from sentencesplit.exceptions import InvalidConfigurationError
+from tests.helpers import ALL_CODES, assert_span_contract, paragraph_document
+
+
+@pytest.mark.parametrize("code", ALL_CODES)
+def test_span_views_match_segment_spans(code):
+    seg = sentencesplit.Segmenter(language=code)
+    rng = random.Random(code)
+    for text in ("​ Hi. ​", *(paragraph_document(rng) for _ in range(4))):
+        views = seg.segment_span_views(text)
+        assert all(isinstance(view, sentencesplit.TextSpanView) for view in views)
+        assert views == seg.segment_spans(text)
+        assert_span_contract(text, [view.to_text_span() for view in views])
+
+
+@pytest.mark.parametrize("text", [None, ""])
+def test_span_views_empty_input(text):
+    assert sentencesplit.Segmenter(language="en").segment_span_views(text) == []
+
+
+def test_span_views_require_clean_false():
+    with pytest.raises(InvalidConfigurationError, match="clean=False"):
+        sentencesplit.Segmenter(language="en", clean=True).segment_span_views("Hi.")
@@ -0,0 +1,91 @@
+"""Differential tests for Segmenter.segment_spans_parallel.
+
+Cutting a document at paragraph breaks and segmenting the pieces separately
+must be invisible: for every input the spans equal ``segment_spans(text)``
+exactly, so the round-trip and tiling contract carries over unchanged.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+import sentencesplit
+from sentencesplit import _hard_boundary
+from sentencesplit.exceptions import InvalidConfigurationError
+from tests.helpers import ALL_CODES, assert_span_contract, paragraph_document, token_document
+
+
+@pytest.mark.parametrize("code", ALL_CODES)
+@pytest.mark.parametrize("split_mode", ["conservative", "balanced", "aggressive"])
+def test_parallel_spans_match_serial_spans(code, split_mode):
+    seg = sentencesplit.Segmenter(language=code, split_mode=split_mode)
+    rng = random.Random(f"{code}-{split_mode}")
+    for _ in range(8):
+        text = paragraph_document(rng)
+        if rng.random() < 0.5:
+            text = text.rstrip()
+        spans = seg.segment_spans_parallel(text, n_workers=1, min_piece_size=rng.choice((1, 5, 40, 100)))
+        assert spans == seg.segment_spans(text)
+        assert_span_contract(text, spans)
+
+
+@pytest.mark.parametrize("code", ["en", "ru"])
+def test_parallel_spans_match_on_list_and_numeral_tokens(code):
+    seg = sentencesplit.Segmenter(language=code)
+    rng = random.Random(f"tokens-{code}")
+    for _ in range(300):
+        text = token_document(rng)
+        spans = seg.segment_spans_parallel(text, n_workers=1, min_piece_size=rng.choice((1, 2, 3, 5)))
+        assert spans == seg.segment_spans(text), text
+
+
+def test_parallel_spans_on_process_pool():
+    seg = sentencesplit.Segmenter(language="en")
+    paragraphs = ("Dr. Smith went to Washington. He arrived at 3 p.m. yesterday.", "Wait...\n\n...what?", "Mr.")
+    text = "\n\n".join(paragraphs[i % len(paragraphs)] for i in range(60))
+    assert _hard_boundary.hard_boundary_cuts(seg, text, 200)
+    assert seg.segment_spans_parallel(text, n_workers=2, min_piece_size=200) == seg.segment_spans(text)
+
+
+def test_seam_whose_boundary_moves_is_merged():
+    seg = sentencesplit.Segmenter(language="en")
+    text = "He paid 5 dollars.\n\npp.\n\nThe end."
+    cuts = _hard_boundary.hard_boundary_cuts(seg, text, 1)
+    bounds = [0, *cuts, len(text)]
+    assert not _hard_boundary.seam_holds(seg, text, 0, bounds[1], bounds[2])
+    assert seg.segment_spans_parallel(text, n_workers=1, min_piece_size=1) == seg.segment_spans(text)
+
+
+def test_no_cut_inside_list_marked_region():
+    seg = sentencesplit.Segmenter(language="en")
+    # The parenthesized items are paired across the paragraph break; the list
+    # phase restores their markers, so the text itself comes back unchanged.
+    text = "Intro line.\n\n1) first\n\n2) second\n\nOutro line."
+    region = _hard_boundary.list_marked_region(seg, text)
+    assert region is not None
+    assert not any(region[0] <= cut <= region[1] for cut in _hard_boundary.hard_boundary_cuts(seg, text, 1))
+
+
+def test_reserved_sentinel_input_is_not_cut():
+    seg = sentencesplit.Segmenter(language="en")
+    text = "First ♨ para.\n\nSecond para.\n\nThird para."
+    assert _hard_boundary.hard_boundary_cuts(seg, text, 1) == []
+    assert seg.segment_spans_parallel(text, min_piece_size=1) == seg.segment_spans(text)
+
+
+@pytest.mark.parametrize("text", [None, "", "   ", "One sentence only."])
+def test_short_input_matches_segment_spans(text):
+    seg = sentencesplit.Segmenter(language="en")
+    assert seg.segment_spans_parallel(text) == seg.segment_spans(text)
+
+
+def test_parallel_spans_requires_clean_false():
+    with pytest.raises(InvalidConfigurationError, match="clean=False"):
+        sentencesplit.Segmenter(language="en", clean=True).segment_spans_parallel("Hi.")
+
+
+def test_parallel_spans_validates_min_piece_size():
+    with pytest.raises(InvalidConfigurationError, match="min_piece_size"):
+        sentencesplit.Segmenter(language="en").segment_spans_parallel("Hi.", min_piece_size=0)
@@ -0,0 +1,96 @@
+"""Tests for the boundary-free tail checkpoint in ``StreamSegmenter``.
+
+A tail made only of characters that cannot hold a boundary is not re-segmented
+on each delta. The helper must agree with the processor, and streams with the
+checkpoint must match streams that segment on every delta.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+import sentencesplit
+from sentencesplit import StreamSegmenter
+from sentencesplit._screen import boundary_free_end
+from tests.helpers import ALL_CODES, three_sentence_stream_sample
+
+_PLAIN = tuple("abXYéñжαاकこ漢ကሀ039 \t,;'-[]{}<>=+*/\\_#@$%^|~`:") + ("ि", "्", "ा")
+_OTHER = (".", "?", "!", "\n", "(", ")", '"', "&", "“", "。", "Dr.", " 3.", "...")
+
+
+def _random_deltas(rng, count):
+    deltas = []
+    for _ in range(count):
+        pool = _PLAIN if rng.random() < 0.85 else _OTHER
+        deltas.append("".join(rng.choice(pool) for _ in range(rng.randint(1, 4))))
+    return deltas
+
+
+@pytest.mark.parametrize("code", ALL_CODES)
+def test_boundary_free_prefix_is_one_sentence(code):
+    rng = random.Random(code)
+    for split_mode in ("conservative", "balanced", "aggressive"):
+        seg = sentencesplit.Segmenter(language=code, split_mode=split_mode)
+        for _ in range(150):
+            text = "".join(_random_deltas(rng, rng.randint(1, 12)))
+            prefix = text[: boundary_free_end(text, 0, seg._screen_punctuations)]
+            expected = [prefix.strip()] if prefix.strip() else []
+            assert seg.processor(prefix).process() == expected, prefix
+
+
+def test_boundary_free_end_stops_at_candidates():
+    punctuations = frozenset(".!?")
+    assert boundary_free_end("abc def", 0, punctuations) == 7
+    assert boundary_free_end("ab. c", 0, punctuations) == 2
+    assert boundary_free_end("a(b", 0, punctuations) == 1
+    assert boundary_free_end("a\nb", 0, punctuations) == 1
+    assert boundary_free_end("ab-' Yb", 0, punctuations) == 3
+    # The pair is caught when the scan starts on the apostrophe.
+    assert boundary_free_end("ab-' Yb", 3, punctuations) == 3
+    assert boundary_free_end("γ; x", 0, frozenset(";.")) == 1
+
+
+class _EagerStream(StreamSegmenter):
+    """Re-segments the tail on every delta, as before the checkpoint."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._punctuations = None
+
+
+@pytest.mark.parametrize("buffering_mode", ["conservative", "aggressive"])
+@pytest.mark.parametrize("code", ALL_CODES)
+def test_checkpointed_stream_matches_eager_stream(code, buffering_mode):
+    rng = random.Random(f"{code}-{buffering_mode}")
+    for _ in range(20):
+        kwargs = {"language": code, "buffering_mode": buffering_mode, "char_span": True}
+        stream, eager = StreamSegmenter(**kwargs), _EagerStream(**kwargs)
+        deltas = _random_deltas(rng, rng.randint(1, 30))
+        deltas.insert(rng.randint(0, len(deltas)), three_sentence_stream_sample(code))
+        for delta in deltas:
+            stream.feed(delta)
+            eager.feed(delta)
+            assert stream.get_completed_sentences() == eager.get_completed_sentences(), deltas
+            assert stream.pending_text() == eager.pending_text()
+            assert stream.is_complete() is eager.is_complete()
+        assert stream.flush() == eager.flush()
+
+
+def test_boundary_free_deltas_skip_segmentation(monkeypatch):
+    stream = StreamSegmenter(language="en", max_buffer_size=10_000)
+    calls = []
+    original = stream._segmenter.segment_spans_with_lookahead
+    monkeypatch.setattr(stream._segmenter, "segment_spans_with_lookahead", lambda text: calls.append(text) or original(text))
+    for token in ["The", " cost", " is", " 3", "-", "4", " units", " per", " [item]"] * 50:
+        stream.feed(token)
+    assert calls == []
+    assert stream.is_complete() is False
+    stream.feed(". Next")
+    assert len(calls) == 1
+    assert stream.get_completed_sentences()[0].rstrip().endswith("per [item].")
+    # Emitting re-anchors the checkpoint on the remaining tail.
+    stream.feed(" one")
+    assert len(calls) == 1
+    assert stream.flush() == ["Next one"]
@@ -0,0 +1,121 @@
+"""Tests for ``StreamSegmenter.feed_many()`` and clause-level emission (``clause_min_length``)."""
+
+from __future__ import annotations
+
+import json
+import random
+
+import pytest
+
+from sentencesplit import InvalidConfigurationError, StreamClause, StreamSegmenter, TextSpan
+from tests.helpers import random_deltas, run_stream, three_sentence_stream_sample
+
+_TEXTS = (
+    "When the storm finally passed over the valley, the farmers walked out; some found the crops flattened, "
+    "others found them untouched: nobody knew why. Then it was over.",
+    "I spoke with Dr. Smith, the new doctor, yesterday: he said the GPT 3.5 results were fine, mostly. "
+    "Goodbye, and see p. 4, or the appendix — whichever",
+    'She wrote "ship it, now." Then she left (see a, b) and the long tail went on, and on, and on; '
+    "e.g. here, Mr. Jones, Ph.D., agreed.",
+    "Numbers like 3,14 and 1, 2, 3 stay; lists: a) one, b) two. Wait... what, really?! Yes, i. e. fine",
+)
+
+
+class _CountingStream(StreamSegmenter):
+    __slots__ = ("calls",)
+
+    def _detect(self):
+        self.calls = getattr(self, "calls", 0) + 1
+        super()._detect()
+
+
+def _regroup(items):
+    """Join each run of clauses to the item after it, checking the clause offsets."""
+    sentences, clauses = [], []
+    for item in items:
+        if isinstance(item, StreamClause):
+            assert item.start == (clauses[-1].end if clauses else item.sentence_start)
+            assert item.sentence_start == (clauses[0] if clauses else item).sentence_start
+            clauses.append(item)
+        elif clauses:
+            assert item.start == clauses[-1].end
+            sentences.append(TextSpan("".join(c.sent for c in clauses) + item.sent, clauses[0].sentence_start, item.end))
+            clauses = []
+        else:
+            sentences.append(item)
+    assert not clauses
+    return sentences
+
+
+def test_feed_many_segments_once_per_burst():
+    deltas = [text[index : index + 4] for text in _TEXTS for index in range(0, len(text), 4)]
+    stream = _CountingStream(language="en")
+    assert stream.feed_many(deltas[:60]) is None
+    assert stream.calls == 1
+    stream.feed_many([None, "", *deltas[60:]])
+    assert stream.calls == 2
+    expected = StreamSegmenter(language="en")
+    expected.feed("".join(deltas))
+    assert stream.get_completed_sentences() + stream.flush() == expected.get_completed_sentences() + expected.flush()
+
+
+def test_feed_many_returns_overflow():
+    stream = StreamSegmenter(language="en", max_buffer_size=8)
+    assert stream.feed_many(["abc", " def", " ghi"]) == ["abc def "]
+
+
+def test_long_sentence_is_emitted_clause_by_clause():
+    stream = StreamSegmenter(language="en", clause_min_length=30)
+    assert run_stream(stream, random_deltas(_TEXTS[0], random.Random(0))) == [
+        StreamClause("When the storm finally passed over the valley, ", 0, 47, 0),
+        StreamClause("the farmers walked out; ", 47, 71, 0),
+        StreamClause("some found the crops flattened, ", 71, 103, 0),
+        StreamClause("others found them untouched: ", 103, 132, 0),
+        "nobody knew why.",
+        " Then it was over.",
+    ]
+
+
+def test_clauses_stay_outside_quotes_brackets_and_before_words():
+    stream = StreamSegmenter(language="en", clause_min_length=1)
+    stream.feed('She said "yes, no, maybe" and (a, b, or c) then 1, 2, ')
+    assert stream.get_completed_sentences() == []
+    stream.feed("fi")
+    assert stream.get_completed_sentences() == [
+        StreamClause('She said "yes, no, maybe" and (a, b, or c) then 1, 2, ', 0, 54, 0),
+    ]
+    stream.feed("ne")
+    assert stream.get_completed_sentences() == []
+
+
+def test_short_sentences_are_not_split():
+    stream = StreamSegmenter(language="en", clause_min_length=50)
+    stream.feed("Well, yes, I think so, probably")
+    assert stream.get_completed_sentences() == []
+    assert stream.flush() == ["Well, yes, I think so, probably"]
+
+
+@pytest.mark.parametrize("clause_min_length", [1, 20, 40])
+@pytest.mark.parametrize("language", ["en", "de", "fr"])
+def test_regrouped_clauses_match_sentences(language, clause_min_length):
+    rng = random.Random(f"{language}-{clause_min_length}")
+    for text in (*_TEXTS, three_sentence_stream_sample(language)):
+        for _ in range(10):
+            deltas = random_deltas(text, rng)
+            expected = run_stream(StreamSegmenter(language=language, char_span=True), deltas)
+            items = run_stream(StreamSegmenter(language=language, char_span=True, clause_min_length=clause_min_length), deltas)
+            assert _regroup(items) == expected, deltas
+
+
+def test_snapshot_keeps_the_sentence_a_clause_began():
+    stream = StreamSegmenter(language="en", clause_min_length=10)
+    stream.feed("First, second and")
+    assert stream.get_completed_sentences() == [StreamClause("First, ", 0, 7, 0)]
+    restored = StreamSegmenter.restore(json.loads(json.dumps(stream.snapshot())))
+    restored.feed(" more, then the")
+    assert restored.get_completed_sentences() == [StreamClause("second and more, ", 7, 24, 0)]
+
+
+def test_invalid_clause_min_length():
+    with pytest.raises(InvalidConfigurationError):
+        StreamSegmenter(clause_min_length=0)
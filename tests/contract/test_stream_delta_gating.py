@@ -0,0 +1,107 @@
+"""Differential tests for deferring inert deltas in ``StreamSegmenter``.
+
+Once the held tail ends in a run of inert text several words past its last
+boundary candidate, further inert deltas are not segmented. Streams must match
+streams that segment on every delta, in every built-in language and mode.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+
+import pytest
+
+from sentencesplit import StreamSegmenter
+from sentencesplit._screen import inert_tail
+from tests.helpers import ALL_CODES, three_sentence_stream_sample
+
+_INERT = (" a", " Bob", " x1", " 3", "5", "I", " I", "ab", ",", " ,", "\t", " ", "é", " ж", " 漢", "ि", " s", "Smith")
+# Bracket pairs the inert run may hold, and near misses that form list
+# markers or close a pair opened before it.
+_INERT += (" (see", " fig)", " (Ab", " Cd)", " (a)", " b)", " (iv)", " x1)", " [ok", " so]", " (", ")", "ii)")
+_OTHER = (".", "?", "!", "\n", "(", ")", '"', "&", "“", "”", "。", "Dr.", " 3.", "...", "'", "-", "--", "[", "]", ":", ";")
+_OTHER += (" e.g.", " U.S.", " i.", "«", "»", "‘", "’")
+
+
+class _CountingStream(StreamSegmenter):
+    """Counts the segmentation passes run by ``_detect``."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.calls = 0
+
+    def _detect(self):
+        self.calls += 1
+        super()._detect()
+
+
+class _EagerStream(_CountingStream):
+    """Re-segments the tail on every delta, with no skipping at all."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._punctuations = None
+
+
+def test_inert_tail():
+    punctuations = frozenset(".!?")
+    assert inert_tail("Dr. Smith and Bob", punctuations) == (3, (3, "b", "", "Bob"))
+    assert inert_tail("a b c", punctuations) == (0, (2, "c", "", "c"))
+    assert inert_tail("x (a b", punctuations) == (0, (2, "b", ")", "b"))
+    assert inert_tail("x (see the lab) ok", punctuations) == (0, (4, "k", "", "ok"))
+    # A closer after a list letter, roman numeral or number ends the run.
+    assert inert_tail("x (b) ok", punctuations) == (5, (1, "k", "", "ok"))
+    assert inert_tail("x (iv) y", punctuations) == (6, (1, "y", "", "y"))
+    assert inert_tail("x (fig 2) y", punctuations) == (9, (1, "y", "", "y"))
+    assert inert_tail('x "a b', punctuations) == (3, (1, "b", "", "b"))
+    assert inert_tail("ends.", punctuations) == (5, (0, "", "", ""))
+    assert inert_tail("γ; x y", frozenset(";.")) == (2, (2, "y", "", "y"))
+
+
+@pytest.mark.parametrize("split_mode", ["conservative", "balanced", "aggressive"])
+@pytest.mark.parametrize("code", ALL_CODES)
+def test_gated_stream_matches_eager_stream(code, split_mode):
+    rng = random.Random(f"{code}-{split_mode}")
+    sample = three_sentence_stream_sample(code)
+    for buffering_mode in ("conservative", "aggressive"):
+        for _ in range(8):
+            kwargs = {"language": code, "split_mode": split_mode, "buffering_mode": buffering_mode, "char_span": True}
+            stream, eager = StreamSegmenter(**kwargs), _EagerStream(**kwargs)
+            deltas = [rng.choice(_INERT if rng.random() < 0.75 else _OTHER) for _ in range(rng.randint(1, 40))]
+            deltas.insert(rng.randint(0, len(deltas)), sample)
+            for delta in deltas:
+                stream.feed(delta)
+                eager.feed(delta)
+                assert stream.get_completed_sentences() == eager.get_completed_sentences(), deltas
+                assert stream.pending_text() == eager.pending_text()
+                assert stream.is_complete() is eager.is_complete()
+            assert stream.flush() == eager.flush()
+
+
+def test_inert_deltas_after_a_settled_run_are_deferred():
+    stream = _CountingStream(language="en")
+    tokens = ["Dr.", " Smith", " (of", " the", " lab)", " said", " that", " the", " new", " results", ",", " in", " short"]
+    for token in tokens:
+        stream.feed(token)
+    # Every delta up to the third word past "Dr." re-segments; the rest, the
+    # bracketed aside included, wait.
+    assert stream.calls == 4
+    stream.feed(", were good.")
+    assert stream.calls == 5
+    assert stream.get_completed_sentences() == ["Dr. Smith (of the lab) said that the new results, in short, were good."]
+
+
+def test_gating_reduces_detect_calls_on_prose():
+    text = (
+        "Dr. Smith said the results (shown in Fig. 2) were clear, and the team at the U.S. lab agreed with him. "
+        'She wrote "we will ship it soon, maybe by Friday, if the tests pass" and left. '
+    ) * 5
+    tokens = re.findall(r"\s*\S{1,4}", text)
+    stream, eager = _CountingStream(language="en"), _EagerStream(language="en")
+    for token in tokens:
+        stream.feed(token)
+        eager.feed(token)
+    assert stream.get_completed_sentences() == eager.get_completed_sentences()
+    assert eager.calls == len(tokens)
+    assert stream.calls < len(tokens) * 2 // 3
@@ -0,0 +1,138 @@
+"""Tests for deadline-bounded emission (``StreamSegmenter(max_hold_ms=...)``)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from sentencesplit import InvalidConfigurationError, StreamSegmenter, StreamSegmenterPool, asegment_stream
+from sentencesplit.utils import HoldInfo
+from tests.helpers import ManualClock
+
+
+def _stream(**kwargs):
+    clock = ManualClock()
+    return StreamSegmenter(language="en", max_hold_ms=500, clock=clock, **kwargs), clock
+
+
+def test_held_sentence_is_released_after_the_deadline():
+    stream, clock = _stream()
+    stream.feed("I spoke with Dr.")
+    clock.now = 0.499
+    assert stream.get_completed_sentences() == []
+    clock.now = 0.5
+    assert stream.get_completed_sentences() == ["I spoke with Dr."]
+    assert stream.pending_text() == ""
+    assert stream.is_complete() is True
+    assert stream.hold_info() == HoldInfo(emitted=0, forced=1)
+
+
+def test_resolving_delta_within_the_deadline_emits_normally():
+    stream, clock = _stream()
+    stream.feed("I spoke with Dr.")
+    clock.now = 0.3
+    stream.feed(" Smith. Bye")
+    clock.now = 10
+    assert stream.get_completed_sentences() == ["I spoke with Dr. Smith. "]
+    assert stream.pending_text() == "Bye"
+    assert stream.hold_info() == HoldInfo(emitted=1, forced=0)
+
+
+def test_late_delta_follows_the_released_sentence():
+    stream, clock = _stream(char_span=True)
+    stream.feed("The model is GPT 3.")
+    clock.now = 1
+    stream.feed("5 now.")
+    assert [(span.sent, span.start, span.end) for span in stream.get_completed_sentences()] == [
+        ("The model is GPT 3.", 0, 19),
+        ("5 now.", 19, 25),
+    ]
+
+
+def test_hold_restarts_for_each_held_sentence():
+    stream, clock = _stream()
+    stream.feed("Ask Dr.")
+    clock.now = 0.4
+    stream.feed(" Jones. Or Mr.")
+    assert stream.get_completed_sentences() == ["Ask Dr. Jones. "]
+    clock.now = 0.8
+    assert stream.get_completed_sentences() == []
+    clock.now = 0.9
+    assert stream.get_completed_sentences() == ["Or Mr."]
+    assert stream.hold_info() == HoldInfo(emitted=1, forced=1)
+
+
+def test_hold_restarts_for_the_text_an_overflow_keeps():
+    stream, clock = _stream(max_buffer_size=16)
+    stream.feed("I spoke with Dr.")
+    clock.now = 0.3
+    # The overflow cuts the held sentence at its last space and keeps 'Dr."'.
+    assert stream.feed('"') == ["I spoke with "]
+    assert stream.pending_text() == 'Dr."'
+    assert stream.is_complete() is False
+    clock.now = 0.5
+    assert stream.get_completed_sentences() == []
+    clock.now = 0.8
+    assert stream.get_completed_sentences() == ['Dr."']
+    assert stream.hold_info() == HoldInfo(emitted=0, forced=1)
+
+
+def test_unterminated_tail_is_never_forced():
+    stream, clock = _stream()
+    stream.feed("Still typing")
+    clock.now = 100
+    assert stream.get_completed_sentences() == []
+    assert stream.hold_info() == HoldInfo(0, 0)
+
+
+def test_the_clock_is_only_read_for_held_sentences():
+    def clock():
+        raise AssertionError("clock read")
+
+    stream = StreamSegmenter(language="en", clock=clock)
+    stream.feed("Hello there. How are")
+    stream.feed(" you? Still typing")
+    assert stream.get_completed_sentences() == ["Hello there. ", "How are you? "]
+    assert stream.flush() == ["Still typing"]
+
+
+def test_snapshot_carries_the_elapsed_hold():
+    stream, clock = _stream()
+    stream.feed("I spoke with Dr.")
+    clock.now = 0.2
+    state = json.loads(json.dumps(stream.snapshot()))
+    assert state["held_ms"] == pytest.approx(200)
+    other = ManualClock()
+    other.now = 50
+    restored = StreamSegmenter.restore(state, clock=other)
+    other.now = 50.29
+    assert restored.get_completed_sentences() == []
+    other.now = 50.3
+    assert restored.get_completed_sentences() == ["I spoke with Dr."]
+
+
+def test_pool_releases_held_sentences_on_an_empty_feed():
+    clock = ManualClock()
+    pool = StreamSegmenterPool(language="en", max_hold_ms=500, clock=clock)
+    assert pool.feed("a", "Call Dr.") == []
+    clock.now = 1
+    assert pool.feed("a", None) == ["Call Dr."]
+
+
+def test_async_stream_releases_during_a_pause():
+    async def source():
+        yield "I spoke with Dr."
+        await asyncio.sleep(0.5)
+        yield " Smith."
+
+    async def consume():
+        return [sentence async for sentence in asegment_stream(source(), max_hold_ms=50)]
+
+    assert asyncio.run(consume()) == ["I spoke with Dr.", " Smith."]
+
+
+def test_invalid_max_hold_ms():
+    with pytest.raises(InvalidConfigurationError):
+        StreamSegmenter(max_hold_ms=-1)
@@ -0,0 +1,92 @@
+"""Tests for delta metadata (``feed(delta, meta=...)``) carried onto emitted spans."""
+
+from __future__ import annotations
+
+import random
+from bisect import bisect_right
+from itertools import accumulate
+
+import pytest
+
+from sentencesplit import AnnotatedSpan, StreamSegmenter, StreamSegmenterPool, TextSpan
+from tests.helpers import random_deltas, run_stream, three_sentence_stream_sample
+
+_TEXTS = (
+    "I spoke with Dr. Smith yesterday. He said the GPT 3.5 results were fine! Goodbye, and see p. 4",
+    'She wrote "ship it." Then she left (see p. 4) and the long unterminated tail went on and on',
+    "Wait... What?! Numbers like 3.14 stay whole, e.g. here.\n\nNew paragraph i. ii. iii.",
+)
+
+
+def _covering(deltas, offset):
+    """Index of the delta holding the character at *offset*, by a linear scan."""
+    return bisect_right(list(accumulate(len(delta) for delta in deltas)), offset)
+
+
+def test_sentences_carry_first_and_last_delta_metadata():
+    stream = StreamSegmenter(language="en", char_span=True)
+    stream.feed("Hello ", meta=(0.0, 0))
+    stream.feed("world. ", meta=(0.4, 1))
+    stream.feed("Bye", meta=(0.9, 2))
+    assert stream.get_completed_sentences() == [AnnotatedSpan("Hello world. ", 0, 13, (0.0, 0), (0.4, 1))]
+    assert stream.flush() == [AnnotatedSpan("Bye", 13, 16, (0.9, 2), (0.9, 2))]
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{}, {"max_buffer_size": 24}, {"buffering_mode": "speculative"}, {"clause_min_length": 10}],
+    ids=["default", "overflow", "speculative", "clauses"],
+)
+def test_metadata_matches_the_covering_deltas(options):
+    rng = random.Random(str(options))
+    for text in (*_TEXTS, three_sentence_stream_sample("en")):
+        for _ in range(10):
+            deltas = random_deltas(text, rng)
+            stream = StreamSegmenter(language="en", char_span=True, **options)
+            items = run_stream(stream, deltas, meta=True)
+            spans = [item for item in items if type(item) is AnnotatedSpan]
+            assert spans and all(type(item) is not TextSpan for item in items)
+            for span in spans:
+                assert span.first_meta == _covering(deltas, span.start), deltas
+                assert span.last_meta == _covering(deltas, span.end - 1), deltas
+
+
+def test_index_is_pruned_as_sentences_are_collected():
+    stream = StreamSegmenter(language="en", char_span=True)
+    for index in range(200):
+        stream.feed(f"Sentence {index}. ", meta=index)
+        stream.get_completed_sentences()
+    assert len(stream._metas) <= 3
+    stream.flush()
+    assert stream._metas is None
+
+
+def test_deltas_without_metadata_leave_it_unset():
+    stream = StreamSegmenter(language="en", char_span=True)
+    stream.feed("One. ")
+    assert stream.get_completed_sentences() == [TextSpan("One. ", 0, 5)]
+    stream.feed("Two ")
+    stream.feed("and three.", meta="t")
+    stream.feed(" Four")
+    assert stream.get_completed_sentences() == [AnnotatedSpan("Two and three.", 5, 19, None, "t")]
+    assert stream.flush() == [AnnotatedSpan(" Four", 19, 24, None, None)]
+
+
+def test_plain_mode_and_reset_ignore_metadata():
+    stream = StreamSegmenter(language="en")
+    stream.feed("One. Two", meta=1)
+    assert stream.get_completed_sentences() == ["One. "]
+    assert stream._metas is None
+
+    stream = StreamSegmenter(language="en", char_span=True)
+    stream.feed("One", meta=1)
+    stream.reset()
+    stream.feed("Two. Three")
+    assert stream.get_completed_sentences() == [TextSpan("Two. ", 0, 5)]
+
+
+def test_pool_forwards_metadata():
+    pool = StreamSegmenterPool(language="en", char_span=True)
+    assert pool.feed("a", "Hi there. ", meta=7) == [AnnotatedSpan("Hi there. ", 0, 10, 7, 7)]
+    pool.feed("a", "Bye", meta=8)
+    assert pool.flush("a") == [AnnotatedSpan("Bye", 10, 13, 8, 8)]
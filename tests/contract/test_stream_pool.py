@@ -0,0 +1,122 @@
+"""Tests for ``StreamSegmenterPool``: per-session streams over one shared Segmenter."""
+
+from __future__ import annotations
+
+import random
+import threading
+
+import pytest
+
+from sentencesplit import InvalidConfigurationError, StreamSegmenter, StreamSegmenterPool
+from sentencesplit.utils import PoolInfo
+from tests.helpers import ManualClock, random_deltas
+
+_TEXTS = (
+    "I spoke with Dr. Smith yesterday. He said the GPT 3.5 results were fine. Goodbye.",
+    'She wrote "ship it." Then she left (see p. 4). The end',
+    "Numbers like 3.14 stay whole. So do e.g. abbreviations! Right?",
+)
+
+
+def _standalone_output(deltas, **kwargs):
+    stream = StreamSegmenter(language="en", **kwargs)
+    out = []
+    for delta in deltas:
+        stream.feed(delta)
+        out += stream.get_completed_sentences()
+    return out + stream.flush()
+
+
+@pytest.mark.parametrize("char_span", [False, True])
+def test_interleaved_sessions_match_standalone_streams(char_span):
+    rng = random.Random(0)
+    pool = StreamSegmenterPool(language="en", char_span=char_span)
+    queues = {session_id: random_deltas(text, rng, 6) for session_id, text in enumerate(_TEXTS)}
+    expected = {session_id: _standalone_output(deltas, char_span=char_span) for session_id, deltas in queues.items()}
+    actual = {session_id: [] for session_id in queues}
+    while any(queues.values()):
+        session_id = rng.choice([sid for sid, deltas in queues.items() if deltas])
+        actual[session_id] += pool.feed(session_id, queues[session_id].pop(0))
+    for session_id in actual:
+        actual[session_id] += pool.flush(session_id)
+    assert actual == expected
+    assert len(pool) == 0
+
+
+def test_sessions_share_one_segmenter():
+    pool = StreamSegmenterPool(language="en")
+    pool.feed("a", "Hello")
+    pool.feed("b", "World")
+    assert pool._sessions["a"][0]._segmenter is pool._sessions["b"][0]._segmenter
+    assert pool.pending_text("a") == "Hello"
+    assert "b" in pool and "c" not in pool
+
+
+def test_feed_many_groups_sentences_by_session():
+    pool = StreamSegmenterPool(language="en")
+    completed = pool.feed_many([("a", "One. Two"), ("b", "Hi"), ("a", ". Three"), ("b", "!"), ("c", "Wait")])
+    assert completed == {"a": ["One. ", "Two. "], "b": ["Hi!"]}
+    assert pool.pending_text("a") == "Three"
+    assert pool.flush("c") == ["Wait"]
+
+
+def test_idle_sessions_are_evicted_by_ttl():
+    clock = ManualClock()
+    pool = StreamSegmenterPool(language="en", ttl=10, clock=clock)
+    pool.feed("a", "Hello")
+    clock.now = 5
+    pool.feed("b", "Hi")
+    clock.now = 9
+    pool.feed("a", " there")
+    clock.now = 15
+    assert pool.evict_idle() == ["b"]
+    assert pool.pending_text("a") == "Hello there"
+    clock.now = 19
+    pool.feed("c", "New")
+    assert "a" not in pool
+    assert pool.flush("a") == []
+    assert pool.info() == PoolInfo(sessions=1, evicted=2, approx_bytes=pool.info().approx_bytes)
+
+
+def test_info_reports_session_memory():
+    pool = StreamSegmenterPool(language="en")
+    assert pool.info() == PoolInfo(0, 0, 0)
+    for session_id in range(100):
+        pool.feed(session_id, "A short unfinished tail")
+    info = pool.info()
+    assert info.sessions == 100
+    assert 0 < info.approx_bytes // info.sessions < 1024
+
+
+def test_max_buffer_size_overflow_is_returned():
+    pool = StreamSegmenterPool(language="en", max_buffer_size=8)
+    assert pool.feed("a", "abc def") == []
+    assert pool.feed("a", " ghi jkl") == ["abc def ghi "]
+    assert pool.pending_text("a") == "jkl"
+
+
+def test_invalid_configuration():
+    with pytest.raises(InvalidConfigurationError):
+        StreamSegmenterPool(ttl=0)
+    with pytest.raises(InvalidConfigurationError):
+        StreamSegmenterPool(clean=True)
+
+
+def test_threads_feed_distinct_sessions():
+    pool = StreamSegmenterPool(language="en")
+    results = {}
+
+    def run(session_id):
+        out = []
+        for delta in random_deltas(_TEXTS[0], random.Random(session_id), 6):
+            out += pool.feed(session_id, delta)
+        results[session_id] = out + pool.flush(session_id)
+
+    threads = [threading.Thread(target=run, args=(session_id,)) for session_id in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for session_id, out in results.items():
+        assert out == _standalone_output(random_deltas(_TEXTS[0], random.Random(session_id), 6))
+    assert len(pool) == 0
@@ -12,7 +12,7 @@ from __future__ import annotations
 import pytest
 
 import sentencesplit
-from sentencesplit import StreamSegmenter
+from sentencesplit import StreamSegmenter, TextSpan
 from sentencesplit.languages import LANGUAGE_CODES
 from tests.helpers import (
     assert_span_contract,
@@ -310,6 +310,30 @@ def test_max_buffer_size_force_flushes_pending():
     assert len(stream.pending_text()) <= 20
 
 
+@pytest.mark.parametrize(
+    ("tail", "emitted"),
+    [
+        ("x" * 30 + " ab; cd, ef gh", "x" * 30 + " ab; "),
+        ("x" * 30 + " ab cd, ef gh", "x" * 30 + " ab cd, "),
+        ("x" * 30 + " ab cd ef gh", "x" * 30 + " ab cd ef "),
+        ("x" * 44, "x" * 44),
+    ],
+)
+def test_overflow_cuts_at_the_strongest_soft_break(tail, emitted):
+    stream = StreamSegmenter(language="en", max_buffer_size=len(tail) - 1)
+    assert stream.feed(tail) == [emitted]
+    assert stream.pending_text() == tail[len(emitted) :]
+
+
+def test_overflow_searches_only_the_end_of_the_tail():
+    # Half of max_buffer_size: the comma is outside the window, the space is not.
+    stream = StreamSegmenter(language="en", char_span=True, max_buffer_size=20)
+    tail = "aaaa, bbbbbbbbbbbbb cc"
+    assert stream.feed(tail) == [TextSpan("aaaa, bbbbbbbbbbbbb ", 0, 20)]
+    assert stream.feed(" dd") is None
+    assert stream.flush() == [TextSpan("cc dd", 20, 25)]
+
+
 @pytest.mark.parametrize("max_buffer_size", [0, -1])
 def test_invalid_max_buffer_size_raises(max_buffer_size):
     with pytest.raises(ValueError, match="max_buffer_size must be a positive integer or None"):
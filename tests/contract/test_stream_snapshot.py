@@ -0,0 +1,104 @@
+"""Tests for ``StreamSegmenter.snapshot()`` / ``restore()`` failover."""
+
+from __future__ import annotations
+
+import json
+import random
+
+import pytest
+
+from sentencesplit import InvalidConfigurationError, StreamSegmenter, UnknownLanguageError
+from tests.helpers import random_deltas, run_stream, three_sentence_stream_sample
+
+_TEXTS = (
+    "I spoke with Dr. Smith yesterday. He said the GPT 3.5 results were fine! Goodbye, and see p. 4",
+    'She wrote "ship it." Then she left (see p. 4) and the long unterminated tail went on and on',
+    "Wait... What?! Numbers like 3.14 stay whole, e.g. here.\n\nNew paragraph i. ii. iii.",
+)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"char_span": True},
+        {"buffering_mode": "aggressive"},
+        {"buffering_mode": "speculative"},
+        {"max_buffer_size": 40},
+        {"clause_min_length": 20},
+    ],
+)
+@pytest.mark.parametrize("language", ["en", "de", "ja"])
+def test_restored_stream_matches_uninterrupted_stream(language, kwargs):
+    rng = random.Random(f"{language}-{kwargs}")
+    texts = (*_TEXTS, three_sentence_stream_sample(language))
+    for text in texts:
+        deltas = random_deltas(text, rng)
+        uninterrupted = StreamSegmenter(language=language, **kwargs)
+        expected = run_stream(uninterrupted, deltas)
+        for cut in range(len(deltas) + 1):
+            stream = StreamSegmenter(language=language, **kwargs)
+            head = []
+            for delta in deltas[:cut]:
+                overflow = stream.feed(delta)
+                head += overflow or []
+            # Sentences completed before the snapshot travel with it.
+            restored = StreamSegmenter.restore(json.loads(json.dumps(stream.snapshot())))
+            checkpoints = ("_boundary_free_end", "_inert_run")
+            assert [getattr(restored, name) for name in checkpoints] == [getattr(stream, name) for name in checkpoints]
+            tail = restored.get_completed_sentences() + run_stream(restored, deltas[cut:])
+            assert head + tail == expected, (text, cut)
+
+
+def test_snapshot_holds_only_the_in_flight_state():
+    stream = StreamSegmenter(language="en", char_span=True)
+    stream.feed("One. Two. Thr")
+    state = stream.snapshot()
+    assert state == {
+        "version": 1,
+        "language": "en",
+        "char_span": True,
+        "split_mode": "balanced",
+        "buffering_mode": "conservative",
+        "max_buffer_size": None,
+        "max_hold_ms": None,
+        "clause_min_length": None,
+        "buffer": "Thr",
+        "lead": 0,
+        "base_offset": 10,
+        "should_wait": True,
+        "held_ms": None,
+        "speculative": None,
+        "sentence_start": None,
+        "completed": [["One. ", 0, 5], ["Two. ", 5, 10]],
+    }
+    # Taking a snapshot does not drain the stream.
+    assert [span.sent for span in stream.get_completed_sentences()] == ["One. ", "Two. "]
+
+
+def test_restore_defaults_missing_fields():
+    stream = StreamSegmenter(language="de", char_span=True, clause_min_length=20)
+    stream.feed("Eins. Zwei")
+    state = stream.snapshot()
+    # A snapshot taken before a field existed restores with its default.
+    for name in ("max_hold_ms", "clause_min_length", "held_ms", "speculative", "sentence_start"):
+        del state[name]
+    restored = StreamSegmenter.restore(state)
+    assert restored.clause_min_length is None and restored.max_hold_ms is None
+    assert restored.get_completed_sentences() == stream.get_completed_sentences()
+    assert restored.flush() == stream.flush()
+    assert StreamSegmenter.restore({"version": 1}).snapshot() == StreamSegmenter().snapshot()
+
+
+def test_restore_rejects_malformed_states():
+    state = StreamSegmenter(language="en").snapshot()
+    with pytest.raises(InvalidConfigurationError):
+        StreamSegmenter.restore({**state, "version": 99})
+    with pytest.raises(InvalidConfigurationError):
+        StreamSegmenter.restore({**state, "base_offset": "10"})
+    with pytest.raises(InvalidConfigurationError):
+        StreamSegmenter.restore({**state, "completed": [["One.", 0]]})
+    with pytest.raises(InvalidConfigurationError):
+        StreamSegmenter.restore({**state, "buffering_mode": "eager"})
+    with pytest.raises(UnknownLanguageError):
+        StreamSegmenter.restore({**state, "language": "xx"})
@@ -0,0 +1,149 @@
+"""Tests for ``buffering_mode="speculative"``: early emission with retraction events."""
+
+from __future__ import annotations
+
+import json
+import random
+
+import pytest
+
+from sentencesplit import StreamRetraction, StreamSegmenter, TextSpan
+from tests.helpers import ManualClock, random_deltas, run_stream, three_sentence_stream_sample
+
+_TEXTS = (
+    "I spoke with Dr. Smith yesterday. He said the GPT 3.5 results were fine! Goodbye, and see p. 4",
+    'She wrote "ship it." Then she left (see p. 4) and the long unterminated tail went on and on',
+    "Wait... What?! Numbers like 3.14 stay whole, e.g. here.\n\nNew paragraph i. ii. iii.",
+    "Mr. J. R. R. Tolkien wrote it. No. 5 is next. It costs $3.50 at St. Mary's. Fine.",
+)
+
+
+def _apply(events):
+    """Drop each retracted sentence, checking that it was the last one emitted."""
+    sentences = []
+    for event in events:
+        if not isinstance(event, StreamRetraction):
+            sentences.append(event)
+        elif isinstance(sentences[-1], TextSpan):
+            assert sentences.pop() == TextSpan(event.sent, event.start, event.end)
+        else:
+            assert sentences.pop().strip() in event.sent
+    return sentences
+
+
+def test_unstable_boundary_is_retracted():
+    stream = StreamSegmenter(language="en", buffering_mode="speculative", char_span=True)
+    stream.feed("I met Dr.")
+    assert stream.get_completed_sentences() == [TextSpan("I met Dr.", 0, 9)]
+    stream.feed(" Smith today.")
+    assert stream.get_completed_sentences() == [
+        StreamRetraction("I met Dr.", 0, 9),
+        TextSpan("I met Dr. Smith today.", 0, 22),
+    ]
+    stream.feed(" Bye")
+    assert stream.get_completed_sentences() == []
+    assert stream.flush() == [TextSpan(" Bye", 22, 26)]
+
+
+def test_confirmed_sentence_is_not_emitted_again():
+    stream = StreamSegmenter(language="en", buffering_mode="speculative")
+    stream.feed("It was GPT 3.")
+    assert stream.get_completed_sentences() == ["It was GPT 3."]
+    # The space rules out "3.5": the sentence is confirmed, not emitted again.
+    stream.feed(" ")
+    assert stream.get_completed_sentences() == []
+    assert stream.pending_text() == " "
+    stream.feed("Then")
+    assert stream.get_completed_sentences() == []
+    assert stream.pending_text() == " Then"
+    assert stream.flush() == [" Then"]
+    assert stream.hold_info().emitted == 1
+
+
+@pytest.mark.parametrize("char_span", [False, True])
+@pytest.mark.parametrize("language", ["en", "de", "ja"])
+def test_applying_retractions_matches_conservative(language, char_span):
+    rng = random.Random(f"{language}-{char_span}")
+    for text in (*_TEXTS, three_sentence_stream_sample(language)):
+        for _ in range(20):
+            deltas = random_deltas(text, rng)
+            expected = run_stream(StreamSegmenter(language=language, char_span=char_span), deltas)
+            sentences = _apply(
+                run_stream(StreamSegmenter(language=language, char_span=char_span, buffering_mode="speculative"), deltas)
+            )
+            if char_span:
+                # The spans still tile the stream exactly.
+                assert [span.start for span in sentences[1:]] == [span.end for span in sentences[:-1]]
+                assert "".join(span.sent for span in sentences) == text
+                sentences, expected = [span.sent for span in sentences], [span.sent for span in expected]
+            # A confirmed sentence keeps its emitted extent; the whitespace
+            # lookahead found after it leads the next sentence instead.
+            assert [s.strip() for s in sentences if s.strip()] == [s.strip() for s in expected if s.strip()], deltas
+
+
+@pytest.mark.parametrize(
+    ("language", "deltas"),
+    [
+        # A number, then a list marker, continuing after the confirmed sentence.
+        ("en", ["Step one costs 42.", " 2", ". Mix the flour. Done"]),
+        ("en", ["vs. 1.", " 1", "0. well, weno. d Reallvs"]),
+        ("en_legal", [" 1.", " a)", " Dr.", ".", " b)", " Done", " a)", " Done", "5", " \n ", "5", ".", " Next"]),
+    ],
+)
+def test_sentences_after_a_confirmation_match_conservative(language, deltas):
+    expected = run_stream(StreamSegmenter(language=language, char_span=True), deltas)
+    sentences = _apply(run_stream(StreamSegmenter(language=language, char_span=True, buffering_mode="speculative"), deltas))
+    assert [span.sent.strip() for span in sentences] == [span.sent.strip() for span in expected]
+    assert [span.start for span in sentences[1:]] == [span.end for span in sentences[:-1]]
+    # The whitespace after a confirmed sentence is never emitted on its own.
+    assert all(span.sent.strip() for span in sentences)
+
+
+def test_flush_settles_a_pending_speculation():
+    stream = StreamSegmenter(language="en", buffering_mode="speculative", char_span=True)
+    stream.feed("See Dr.")
+    assert stream.get_completed_sentences() == [TextSpan("See Dr.", 0, 7)]
+    assert stream.flush() == []
+    stream.feed("See Dr.")
+    stream.feed(" Smith")
+    assert stream.flush() == [TextSpan("See Dr.", 0, 7), StreamRetraction("See Dr.", 0, 7), TextSpan("See Dr. Smith", 0, 13)]
+
+
+def test_overflow_settles_a_pending_speculation():
+    stream = StreamSegmenter(language="en", buffering_mode="speculative", max_buffer_size=12)
+    assert stream.feed("Ask Dr.") is None
+    assert stream.get_completed_sentences() == ["Ask Dr."]
+    overflow = stream.feed(" Who and")
+    assert overflow == [StreamRetraction("Ask Dr.", 0, 7), "Ask Dr. Who "]
+    assert stream.pending_text() == "and"
+
+
+def test_deadline_confirms_without_emitting_again():
+    clock = ManualClock()
+    stream = StreamSegmenter(language="en", buffering_mode="speculative", max_hold_ms=200, clock=clock)
+    stream.feed("Call Dr.")
+    assert stream.get_completed_sentences() == ["Call Dr."]
+    clock.now = 0.3
+    assert stream.get_completed_sentences() == []
+    assert stream.pending_text() == ""
+    stream.feed(" Smith now.")
+    assert stream.get_completed_sentences() == [" Smith now."]
+    assert stream.hold_info() == (1, 1)
+
+
+def test_snapshot_carries_the_pending_speculation():
+    stream = StreamSegmenter(language="en", buffering_mode="speculative", char_span=True)
+    stream.feed("One. See Dr.")
+    stream.feed(" Smith")
+    state = json.loads(json.dumps(stream.snapshot()))
+    assert state["speculative"] is None
+    assert state["completed"] == [["One. ", 0, 5], ["See Dr.", 5, 12], ["See Dr.", 5, 12, "retraction"]]
+    restored = StreamSegmenter.restore(state)
+    assert restored.get_completed_sentences() == stream.get_completed_sentences()
+
+    stream = StreamSegmenter(language="en", buffering_mode="speculative", char_span=True)
+    stream.feed("See Dr.")
+    stream.get_completed_sentences()
+    restored = StreamSegmenter.restore(json.loads(json.dumps(stream.snapshot())))
+    restored.feed(" Smith.")
+    assert restored.get_completed_sentences() == [StreamRetraction("See Dr.", 0, 7), TextSpan("See Dr. Smith.", 0, 14)]
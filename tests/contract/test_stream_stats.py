@@ -0,0 +1,86 @@
+"""Tests for ``StreamSegmenter.stats()`` instrumentation counters."""
+
+from __future__ import annotations
+
+import json
+
+from sentencesplit import StreamSegmenter
+from sentencesplit.utils import StreamStats
+from tests.helpers import ManualClock
+
+
+class _RecordingStream(StreamSegmenter):
+    __slots__ = ("tails",)
+
+    def _segment(self, buffer):
+        self.tails = [*getattr(self, "tails", []), len(buffer)]
+        return super()._segment(buffer)
+
+
+def test_counts_segmentation_passes_and_tail_lengths():
+    stream = _RecordingStream(language="en")
+    text = "I spoke with Dr. Smith yesterday. He said the GPT 3.5 results were fine! Goodbye, and see p. 4"
+    for index in range(0, len(text), 3):
+        stream.feed(text[index : index + 3])
+    stream.feed("")
+    stats = stream.stats()
+    assert stats.feeds == len(range(0, len(text), 3))
+    assert stats.detects == len(stream.tails) < stats.feeds
+    assert stats.segmented_chars == sum(stream.tails)
+    assert stats.max_tail == max(stream.tails)
+    assert stats.mean_tail == sum(stream.tails) / len(stream.tails)
+    assert stats.probes == stream._segmenter.lookahead_info().probed
+
+
+def test_hold_time_is_measured_in_feeds_and_seconds():
+    clock = ManualClock()
+    stream = StreamSegmenter(language="en", clock=clock)
+    stream.feed("I spoke with Dr.")
+    clock.now = 0.5
+    # "Dr." was held and goes out inside the sentence it turned out to start.
+    stream.feed(" Smith today. Then GPT 3.")
+    clock.now = 2.0
+    stream.feed(" ")
+    clock.now = 2.5
+    stream.feed("Next one")
+    assert stream.get_completed_sentences() == ["I spoke with Dr. Smith today. ", "Then GPT 3. "]
+    stats = stream.stats()
+    assert (stats.holds, stats.hold_feeds, stats.max_hold_feeds) == (2, 2, 1)
+    assert (stats.hold_seconds, stats.max_hold_seconds) == (2.0, 1.5)
+
+
+def test_superseded_hold_is_not_recorded():
+    clock = ManualClock()
+    stream = StreamSegmenter(language="en", clock=clock)
+    stream.feed("I spoke with Dr.")
+    clock.now = 1.0
+    stream.feed(" Smith and")
+    assert stream.stats().holds == 0
+    assert stream._held_since is None
+
+
+def test_flush_and_forced_releases_count_as_holds():
+    clock = ManualClock()
+    stream = StreamSegmenter(language="en", max_hold_ms=100, clock=clock)
+    stream.feed("Call Dr.")
+    clock.now = 0.2
+    assert stream.get_completed_sentences() == ["Call Dr."]
+    stream.feed(" See Mr.")
+    clock.now = 0.25
+    assert stream.flush() == [" See Mr."]
+    stats = stream.stats()
+    assert (stats.holds, stats.hold_feeds, stats.max_hold_feeds) == (2, 0, 0)
+    assert (stats.hold_seconds, stats.max_hold_seconds) == (0.25, 0.2)
+
+
+def test_stats_export_as_a_plain_dict():
+    stream = StreamSegmenter(language="en")
+    assert stream.stats() == StreamStats(0, 0, 0, 0, 0.0, 0, 0, 0, 0, 0.0, 0.0)
+    stream.feed("One. Two")
+    stream.flush()
+    stream.reset()
+    exported = json.loads(json.dumps(stream.stats()._asdict()))
+    assert exported["feeds"] == 1
+    assert exported["detects"] == 1
+    assert exported["segmented_chars"] == 8
+    assert list(exported) == list(StreamStats._fields)
@@ -0,0 +1,109 @@
+"""Differential tests for the trivial-input pre-screen (``sentencesplit._screen``).
+
+Whenever the screen answers, its result must be exactly what the full
+``Processor`` pipeline returns, for every built-in language and split mode.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+import sentencesplit
+from sentencesplit._screen import trivial_sentences
+from tests.helpers import ALL_CODES
+
+_LETTERS = tuple("abcxyzABCXYZéñßабвАБВαβγابتअआकि्ंこんにちは漢字カナԱԲաբሀለကခါ်ȸȹƪ")
+_OTHER = (" ", " ", ",", ";", "'", "-", "0", "3", "9", "²", "\t", "\n", "_", ".")
+_WORDS = tuple("Mr Mrs Dr etc i ii a A v vs No fig pp St Jr U S GPT 3 10 e g Yahoo ca al Inc Nr usw т г см ق प".split())
+
+
+def _random_text(rng, punctuations):
+    if rng.random() < 0.5:
+        text = "".join(rng.choice(_LETTERS if rng.random() < 0.7 else _OTHER) for _ in range(rng.randint(1, 25)))
+    else:
+        text = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(1, 6)))
+    if rng.random() < 0.6:
+        text += rng.choice(punctuations)
+    if rng.random() < 0.3:
+        text = " " + text
+    if rng.random() < 0.3:
+        text += "  "
+    return text
+
+
+@pytest.mark.parametrize("code", ALL_CODES)
+def test_screen_agrees_with_full_pipeline(code):
+    rng = random.Random(code)
+    for split_mode in ("conservative", "balanced", "aggressive"):
+        seg = sentencesplit.Segmenter(language=code, split_mode=split_mode)
+        punctuations = sorted(seg.language_module.Punctuations)
+        screened = 0
+        for _ in range(400):
+            text = _random_text(rng, punctuations)
+            sentences = trivial_sentences(text, seg._screen_punctuations)
+            if sentences is not None:
+                screened += 1
+                assert sentences == seg.processor(text).process(), text
+        assert screened > 100
+
+
+_QUOTES = ("'", "'", "'", '"', "\u2018", "\u2019", "\u201c", "\u201d", "\u00ab", "\u00bb", "-'")
+_CASED_WORDS = ("Hi", "Bob", "ok", "I", "said", "it", "Ann", "yes", "Él", "Да", "Ωμέγα", "s", "3")
+_GAPS = (" ", " ", ", ", "; ", " - ", "  ")
+
+
+def _quoted_text(rng, punctuations):
+    words = []
+    for _ in range(rng.randint(1, 6)):
+        word = rng.choice(_CASED_WORDS)
+        roll = rng.random()
+        if roll < 0.3:
+            quote = rng.choice(_QUOTES)
+            word = quote + word + (quote if rng.random() < 0.7 else rng.choice(_QUOTES))
+        elif roll < 0.45:
+            word += rng.choice(_QUOTES)
+        elif roll < 0.55:
+            word = rng.choice(_QUOTES) + word
+        words.append(word)
+    text = words[0] + "".join(rng.choice(_GAPS) + word for word in words[1:])
+    if rng.random() < 0.7:
+        text += rng.choice(punctuations)
+    return text
+
+
+@pytest.mark.parametrize("code", ALL_CODES)
+def test_screen_agrees_with_full_pipeline_around_quotes(code):
+    rng = random.Random(f"quotes-{code}")
+    seg = sentencesplit.Segmenter(language=code)
+    punctuations = sorted(seg.language_module.Punctuations)
+    screened = 0
+    for _ in range(600):
+        text = _quoted_text(rng, punctuations)
+        sentences = trivial_sentences(text, seg._screen_punctuations)
+        if sentences is not None:
+            screened += 1
+            assert sentences == seg.processor(text).process(), text
+    assert screened > 30
+
+
+@pytest.mark.parametrize("text", ["'Hi' Bob.", "'ok' I said.", "ab-' Yb"])
+def test_segment_splits_after_a_closing_single_quote(text):
+    seg = sentencesplit.Segmenter(language="en")
+    assert trivial_sentences(text, seg._screen_punctuations) is None
+    assert len(seg.segment(text)) == 2
+
+
+def test_registered_language_is_not_screened():
+    from sentencesplit.lang.english import English
+
+    class Custom(English):
+        iso_code = "xx_screen"
+
+    sentencesplit.register_language("xx_screen", Custom)
+    try:
+        assert sentencesplit.Segmenter(language="xx_screen")._screen_punctuations is None
+    finally:
+        sentencesplit.unregister_language("xx_screen")
+    assert sentencesplit.Segmenter(language="en")._screen_punctuations is not None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import random
 from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
@@ -105,6 +106,45 @@ def three_sentence_stream_sample(code: str) -> str:
     return f"{token}{token}{punct} {token}{token}{punct} {token}{token}"
 
 
+# --------------------------------------------------------------------------- #
+# Driving a StreamSegmenter: a hand-advanced clock for ``clock=``, random
+# delta splits and a feed loop collecting everything the stream returns.
+# --------------------------------------------------------------------------- #
+
+
+class ManualClock:
+    """A ``clock`` for StreamSegmenter that only moves when ``now`` is set."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def random_deltas(text: str, rng: random.Random, max_step: int = 7) -> list[str]:
+    """Split *text* into consecutive deltas of 1 to *max_step* characters."""
+    deltas, index = [], 0
+    while index < len(text):
+        step = rng.randint(1, max_step)
+        deltas.append(text[index : index + step])
+        index += step
+    return deltas
+
+
+def run_stream(stream, deltas: Sequence[str], *, flush: bool = True, meta: bool = False) -> list:
+    """Feed *deltas* and collect overflow and completed items, then the flush.
+
+    With ``meta=True`` each delta is fed with its index as metadata; with
+    ``flush=False`` the stream is left holding its tail.
+    """
+    out: list = []
+    for index, delta in enumerate(deltas):
+        overflow = stream.feed(delta, meta=index) if meta else stream.feed(delta)
+        out += (overflow or []) + stream.get_completed_sentences()
+    return out + stream.flush() if flush else out
+
+
 # --------------------------------------------------------------------------- #
 # Per-script Hypothesis input strategies (promoted from test_span_roundtrip).
 #
@@ -195,3 +235,67 @@ def text_strategy(code: str) -> st.SearchStrategy[str]:
     pool += [". ", "! ", "? ", "\n", " "]
     char_st = st.sampled_from(pool)
     return st.lists(char_st, min_size=0, max_size=24).map("".join)
+
+
+# --------------------------------------------------------------------------- #
+# Multi-paragraph documents for the piecewise (hard-boundary) APIs. Each
+# paragraph stresses something that can see across a paragraph break: list
+# numbering, orphan fragments, abbreviations and decimals at a paragraph end,
+# zero-width characters and CRLF line breaks.
+# --------------------------------------------------------------------------- #
+
+_DOCUMENT_PARAGRAPHS = (
+    "Dr. Smith went to Washington. He arrived at 3 p.m. yesterday.",
+    "1. First item\n2. Second item\n3. Third item",
+    "See p.\n\nSmith et al. wrote it.",
+    "The model is GPT 3.\n\n1 more thing.",
+    'He said, "Stop." Then he left. (See fig. 2.)',
+    "a. alpha b. beta c. gamma",
+    "​Leading zero width. Text.​",
+    "i. one ii. two iii. three",
+    "Wait...\n\n...what?",
+    "Hello!!! World?? Yes.",
+    "pp.",
+    "Mr.",
+    "U.S.A.\r\n\r\nNext para here.",
+    "1) first 2) second",
+    "(1) one (2) two",
+    "这是第一句。这是第二句！",
+    "Он сказал: «Привет». Потом ушёл.",
+    "  indented para. ",
+)
+_PARAGRAPH_SEPARATORS = ("\n\n", "\n \n", "\r\n\r\n", "\n\n\n  ", "\n\t\n", "\n\n​")
+
+
+def paragraph_document(rng: random.Random) -> str:
+    """A random multi-paragraph document exercising cross-paragraph rules."""
+    return "".join(rng.choice(_DOCUMENT_PARAGRAPHS) + rng.choice(_PARAGRAPH_SEPARATORS) for _ in range(rng.randint(2, 30)))
+
+
+# Short documents of list markers, roman numerals, terminators and line breaks,
+# dense enough in cross-paragraph effects that random cuts hit them often.
+_DOCUMENT_TOKENS = (
+    ".",
+    "i.",
+    "ii.",
+    "iv.",
+    "a.",
+    "1.",
+    "2.",
+    "Dr.",
+    "(a)",
+    "1)",
+    "2)",
+    "?",
+    "o",
+    "Foo",
+    "\n",
+    "\n\n",
+    " ",
+    "​",
+)
+
+
+def token_document(rng: random.Random) -> str:
+    """A random short document of list, numeral and paragraph-break tokens."""
+    return "".join(rng.choice(_DOCUMENT_TOKENS) + rng.choice(("", " ")) for _ in range(rng.randint(3, 30)))
@@ -59,13 +59,20 @@ def test_public_surface_matches_all():
     expected = {
         "Segmenter",
         "StreamSegmenter",
+        "StreamSegmenterPool",
+        "asegment_stream",
+        "iter_sentences",
         "SentenceSplitError",
         "InvalidConfigurationError",
         "UnknownLanguageError",
         "list_languages",
         "register_language",
         "unregister_language",
+        "AnnotatedSpan",
+        "StreamClause",
+        "StreamRetraction",
         "TextSpan",
+        "TextSpanView",
         "SegmentLookahead",
         "__version__",
     }
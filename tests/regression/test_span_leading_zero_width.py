@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+"""Regression test: a processed sentence that starts with a zero-width char.
+
+The processor can hand ``Segmenter._match_spans`` a sentence such as
+``"\\u200bpp."`` whose leading zero-width char the previous span's trailing sweep
+has already consumed. Searching for the sentence with that char skipped ahead
+to a later occurrence, so one span swallowed the sentences in between.
+"""
+
+from __future__ import annotations
+
+import sentencesplit
+from tests.helpers import assert_span_contract
+
+
+def test_leading_zero_width_sentence_does_not_skip_ahead():
+    seg = sentencesplit.Segmenter(language="en")
+    text = "t.​\n​pp.\nM​pp."
+    spans = seg.segment_spans(text)
+    assert [span.sent for span in spans] == ["t.​\n​", "pp.\n", "M​pp."]
+    assert_span_contract(text, spans)
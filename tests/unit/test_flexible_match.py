@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""Differential tests: ``find_flexible`` against the regexes it replaces."""
+
+import random
+import re
+
+import pytest
+
+from sentencesplit._flexible_match import find_flexible
+from sentencesplit._normalize import _ZERO_WIDTH_CLASS
+
+_ALPHABET = ("a", "b", ".", " ", "\n", "\t", "\xa0", "​", "﻿")
+
+
+def _regex_find(sent, text, pos):
+    match = re.compile(re.escape(sent).replace(r"\ ", r"\s*")).search(text, pos)
+    if match is None:
+        joiner = rf"[{_ZERO_WIDTH_CLASS}]*"
+        parts = [(rf"[\s{_ZERO_WIDTH_CLASS}]*" if char.isspace() else re.escape(char)) + joiner for char in sent]
+        match = re.compile("".join(parts)).search(text, pos)
+    return None if match is None else (match.start(), match.end())
+
+
+@pytest.mark.parametrize(
+    ("sent", "text"),
+    [
+        ("a \nb", "x a \n\nb"),  # a flexible space must give a newline back
+        ("a​b", "a​​b"),  # a zero-width run must give a literal zero-width char back
+        ("Mr. pp.", "Mr.\n\n​pp."),
+        ("Text.​ pp.", "Text.​\n\n​pp."),
+        ("one  two", "one two one\t\ttwo"),
+        (" ", "abc"),
+        ("zz", "abc"),
+    ],
+)
+def test_find_flexible_matches_regex_on_backtracking_cases(sent, text):
+    for pos in range(len(text) + 1):
+        assert find_flexible(sent, text, pos) == _regex_find(sent, text, pos)
+
+
+def test_find_flexible_matches_regex_on_random_inputs():
+    rng = random.Random(0)
+    for _ in range(5000):
+        text = "".join(rng.choice(_ALPHABET) for _ in range(rng.randint(0, 14)))
+        sent = "".join(rng.choice(_ALPHABET) for _ in range(rng.randint(1, 6)))
+        if text and rng.random() < 0.5:
+            start = rng.randint(0, len(text) - 1)
+            mutated = "".join(
+                c if rng.random() > 0.3 else rng.choice(_ALPHABET) for c in text[start : start + rng.randint(1, 8)]
+            )
+            sent = mutated or sent
+        pos = rng.randint(0, len(text))
+        assert find_flexible(sent, text, pos) == _regex_find(sent, text, pos), (sent, text, pos)
@@ -1,6 +1,14 @@
 # -*- coding: utf-8 -*-
 
-from sentencesplit.utils import _next_nonspace_char, _next_nonspace_char_is_non_ascii_upper, _next_nonspace_char_is_upper
+import pytest
+
+from sentencesplit.utils import (
+    TextSpan,
+    TextSpanView,
+    _next_nonspace_char,
+    _next_nonspace_char_is_non_ascii_upper,
+    _next_nonspace_char_is_upper,
+)
 
 
 class NoSliceStr(str):
@@ -16,3 +24,22 @@ def test_next_nonspace_char_uses_start_offset_without_slicing():
     assert _next_nonspace_char(text, 7) == "É"
     assert _next_nonspace_char_is_upper(text, 7)
     assert _next_nonspace_char_is_non_ascii_upper(text, 7)
+
+
+def test_text_span_view_slices_lazily_and_matches_text_span():
+    lazy = TextSpanView(NoSliceStr("Hello world. Bye."), 0, 13)  # construction does not slice
+    assert (lazy.start, lazy.end) == (0, 13)
+    source = "Hello world. Bye."
+    view = TextSpanView(source, 0, 13)
+    span = TextSpan("Hello world. ", 0, 13)
+
+    assert not hasattr(view, "__dict__")
+    assert view == span and span == view
+    assert view != TextSpan("Hello world. ", 0, 12)
+    assert view != TextSpanView(source, 13, 17)
+    assert view.to_text_span() == span
+    assert repr(view) == "TextSpanView(sent='Hello world. ', start=0, end=13)"
+    with pytest.raises(TypeError):
+        hash(view)
+    with pytest.raises(AttributeError):
+        view.sent = "other"